@@ -0,0 +1,268 @@
+import operator
+import sys
+from array import array
+from itertools import repeat
+
+
+# Numeric arrays for KA programs: `[1, 2, 3]` literals, a[i] and a[i:j]
+# (either bound may be left out; negative ones count from the end), and
+# + - * / // % ** and the comparisons element by element, between two
+# arrays of the same length or an array and a number. Comparisons give
+# arrays of true/false, which count as 1/0 in arithmetic and sums. The
+# builtins below take arrays; a program that defines a function of the
+# same name calls its own instead (see resolver.py).
+#
+# A KaArray wraps a NumPy array when NumPy is installed and an array.array
+# ('q' for integers, 'd' once a float is among them, 'B' for true/false)
+# otherwise; NumPy is imported on the first array, not at startup. Either
+# way the loop over the elements runs in C. With NumPy, integers are 64-bit
+# and wrap around, which array.array does not allow (it falls back to 'd').
+# Arrays are never changed in place: every operation makes a new one.
+
+_storage = None
+
+
+def storage():
+    global _storage
+    if _storage is None:
+        try:
+            import numpy
+        except ImportError:
+            _storage = _ArrayStorage()
+        else:
+            _storage = _NumpyStorage(numpy)
+    return _storage
+
+
+class _ArrayStorage:
+    name = "array"
+
+    def build(self, values, boolean=False):
+        if boolean:
+            return array('B', values)
+        try:
+            return array('q', values)
+        except (TypeError, OverflowError):
+            return array('d', values)
+
+    def integers(self, data):
+        return data
+
+    def apply(self, op, left, right, boolean=False):
+        if type(left) is array:
+            values = map(op, left, right if type(right) is array else repeat(right))
+        else:
+            values = map(op, repeat(left), right)
+        return self.build(list(values), boolean)
+
+    def negate(self, data):
+        return self.build(list(map(operator.neg, data)))
+
+    def item(self, value, boolean):
+        return bool(value) if boolean else value
+
+    def values(self, data, boolean):
+        return [bool(value) for value in data] if boolean else list(data)
+
+    def total(self, data):
+        return sum(data)
+
+    def minimum(self, data, boolean):
+        return self.item(min(data), boolean)
+
+    def maximum(self, data, boolean):
+        return self.item(max(data), boolean)
+
+
+class _NumpyStorage:
+    name = "numpy"
+
+    def __init__(self, numpy):
+        self.numpy = numpy
+
+    def build(self, values, boolean=False):
+        return self.numpy.array(values, dtype=bool if boolean else None)
+
+    def integers(self, data):
+        return data.astype(self.numpy.int64)
+
+    def apply(self, op, left, right, boolean=False):
+        # Division by zero raises, as it does for numbers, instead of giving
+        # inf or nan.
+        with self.numpy.errstate(divide='raise', invalid='raise'):
+            return op(left, right)
+
+    def negate(self, data):
+        return -data
+
+    def item(self, value, boolean):
+        return value.item()
+
+    def values(self, data, boolean):
+        return data.tolist()
+
+    def total(self, data):
+        return data.sum().item()
+
+    def minimum(self, data, boolean):
+        return data.min().item()
+
+    def maximum(self, data, boolean):
+        return data.max().item()
+
+
+def _elementwise(op, comparison=False, reflected=False):
+    def method(self, other):
+        return self.combine(op, other, comparison, reflected)
+    return method
+
+
+class KaArray:
+    __slots__ = ('data', 'boolean')
+    __hash__ = None
+
+    def __init__(self, data, boolean=False):
+        self.data = data
+        self.boolean = boolean
+
+    def __len__(self):
+        return len(self.data)
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sys.getsizeof(self.data)
+
+    def __str__(self):
+        return "[" + ", ".join(map(str, self.values())) + "]"
+
+    __repr__ = __str__
+
+    def __bool__(self):
+        raise TypeError("ಸರಣಿ ಸತ್ಯವೂ ಅಲ್ಲ ಸುಳ್ಳೂ ಅಲ್ಲ/An array is neither true nor false")
+
+    def values(self):
+        return storage().values(self.data, self.boolean)
+
+    def operand(self, comparison):
+        if self.boolean and not comparison:
+            return storage().integers(self.data)
+        return self.data
+
+    def combine(self, op, other, comparison, reflected):
+        left = self.operand(comparison)
+        if isinstance(other, KaArray):
+            if len(other.data) != len(self.data):
+                raise ValueError(f"ಸರಣಿಗಳ ಉದ್ದ ಬೇರೆ/Arrays differ in length: {len(self.data)} and {len(other.data)}")
+            right = other.operand(comparison)
+        elif isinstance(other, (int, float)):
+            right = other
+        else:
+            raise TypeError("ಸರಣಿಗಳು ಸಂಖ್ಯೆ ಅಥವಾ ಸರಣಿಯೊಂದಿಗೆ ಮಾತ್ರ/Arrays combine only with numbers and arrays")
+        if reflected:
+            left, right = right, left
+        return KaArray(storage().apply(op, left, right, comparison), comparison)
+
+    __add__ = _elementwise(operator.add)
+    __radd__ = _elementwise(operator.add, reflected=True)
+    __sub__ = _elementwise(operator.sub)
+    __rsub__ = _elementwise(operator.sub, reflected=True)
+    __mul__ = _elementwise(operator.mul)
+    __rmul__ = _elementwise(operator.mul, reflected=True)
+    __truediv__ = _elementwise(operator.truediv)
+    __rtruediv__ = _elementwise(operator.truediv, reflected=True)
+    __floordiv__ = _elementwise(operator.floordiv)
+    __rfloordiv__ = _elementwise(operator.floordiv, reflected=True)
+    __mod__ = _elementwise(operator.mod)
+    __rmod__ = _elementwise(operator.mod, reflected=True)
+    __pow__ = _elementwise(operator.pow)
+    __rpow__ = _elementwise(operator.pow, reflected=True)
+    __lt__ = _elementwise(operator.lt, comparison=True)
+    __gt__ = _elementwise(operator.gt, comparison=True)
+    __le__ = _elementwise(operator.le, comparison=True)
+    __ge__ = _elementwise(operator.ge, comparison=True)
+    __eq__ = _elementwise(operator.eq, comparison=True)
+    __ne__ = _elementwise(operator.ne, comparison=True)
+
+    def __neg__(self):
+        return KaArray(storage().negate(self.operand(False)))
+
+
+def make_array(values):
+    for value in values:
+        if not isinstance(value, (int, float)):
+            raise TypeError(f"ಸರಣಿಯಲ್ಲಿ ಸಂಖ್ಯೆಗಳು ಮಾತ್ರ/Arrays hold numbers only, not {value}")
+    boolean = bool(values) and all(type(value) is bool for value in values)
+    return KaArray(storage().build(values, boolean), boolean)
+
+
+def _array(value, what):
+    if not isinstance(value, KaArray):
+        raise TypeError(f"ಸರಣಿ ಬೇಕು/{what} needs an array, not {value}")
+    return value
+
+
+def _position(value):
+    if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+        raise TypeError(f"ಸೂಚ್ಯಂಕ ಪೂರ್ಣಾಂಕವಾಗಿರಬೇಕು/Array index must be an integer, not {value}")
+    return value
+
+
+def get_item(value, position):
+    array_value = _array(value, "Indexing")
+    try:
+        item = array_value.data[_position(position)]
+    except IndexError:
+        raise IndexError(f"ಸೂಚ್ಯಂಕ ವ್ಯಾಪ್ತಿಯ ಹೊರಗಿದೆ/Array index out of range: {position}") from None
+    return storage().item(item, array_value.boolean)
+
+
+def get_slice(value, start, stop):
+    array_value = _array(value, "Slicing")
+    return KaArray(array_value.data[_position(start):_position(stop)], array_value.boolean)
+
+
+# Builtins, by KA name.
+
+def _arguments(name, values, count):
+    if len(values) != count:
+        raise TypeError(f"ತಪ್ಪು ಆರ್ಗ್ಯುಮೆಂಟ್‌ಗಳು/{name} takes {count} argument(s), not {len(values)}")
+    return values
+
+
+def length(*values):
+    value, = _arguments("ಉದ್ದ", values, 1)
+    if isinstance(value, str):
+        return len(value)
+    return len(_array(value, "ಉದ್ದ").data)
+
+
+def total(*values):
+    value, = _arguments("ಮೊತ್ತ", values, 1)
+    return storage().total(_array(value, "ಮೊತ್ತ").operand(False))
+
+
+def _extreme(name, values, reduce, builtin):
+    # An array's least (greatest) element, or that of several numbers.
+    if len(values) == 1 and isinstance(values[0], KaArray):
+        value = values[0]
+        if not len(value.data):
+            raise ValueError(f"ಖಾಲಿ ಸರಣಿ/{name} of an empty array")
+        return reduce(value.data, value.boolean)
+    if not values:
+        raise TypeError(f"ತಪ್ಪು ಆರ್ಗ್ಯುಮೆಂಟ್‌ಗಳು/{name} needs an array or numbers")
+    return builtin(values)
+
+
+def minimum(*values):
+    return _extreme("ಕನಿಷ್ಠ", values, storage().minimum, min)
+
+
+def maximum(*values):
+    return _extreme("ಗರಿಷ್ಠ", values, storage().maximum, max)
+
+
+BUILTINS = {
+    "ಉದ್ದ": length,
+    "ಮೊತ್ತ": total,
+    "ಕನಿಷ್ಠ": minimum,
+    "ಗರಿಷ್ಠ": maximum,
+}
@@ -0,0 +1,340 @@
+# AST node classes built by parser.py. Every node has an integer `kind`
+# (one of the constants below) for dispatch, and to_dict() returns the
+# original dict form ({"type": "print", ...}) for tooling; to_dict(lines=True)
+# also gives each node its source `line`. `slot`, `local_names`,
+# `frame_size`, `shadowed`, `recursive`, `pure`, `memoized`, `tail`,
+# `builtin` and `plan` are filled in by resolver.resolve().
+
+(PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS,
+ TRY_EXCEPT, IMPORT, FROM_IMPORT, CLASS, NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON,
+ UNARY_OP, ARRAY, INDEX, SLICE) = range(26)
+
+KIND_NAMES = (
+    'print', 'assignment', 'input', 'if', 'while', 'for', 'function_def', 'function_call', 'return', 'break',
+    'continue', 'pass', 'try_except', 'import', 'from_import', 'class', 'number', 'string', 'boolean',
+    'identifier', 'binary_op', 'comparison', 'unary_op', 'array', 'index', 'slice',
+)
+
+
+def _to_plain(value, lines=False):
+    if isinstance(value, Node):
+        return value.to_dict(lines)
+    if isinstance(value, list):
+        return [_to_plain(item, lines) for item in value]
+    return value
+
+
+class Node:
+    __slots__ = ('line',)
+    kind = -1
+    fields = ()
+
+    def to_dict(self, lines=False):
+        result = {"type": KIND_NAMES[self.kind]}
+        for field in self.fields:
+            value = getattr(self, field)
+            if value is not None:
+                result[field] = _to_plain(value, lines)
+        if lines and self.line:
+            result["line"] = self.line
+        return result
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class Print(Node):
+    __slots__ = ('values',)
+    kind = PRINT
+    fields = ('values',)
+
+    def __init__(self, values, line=0):
+        self.values = values
+        self.line = line
+
+
+class Assignment(Node):
+    __slots__ = ('target', 'value', 'slot')
+    kind = ASSIGNMENT
+    fields = ('target', 'value')
+
+    def __init__(self, target, value, line=0):
+        self.target = target
+        self.value = value
+        self.slot = -1
+        self.line = line
+
+
+class Input(Node):
+    __slots__ = ('target', 'slot')
+    kind = INPUT
+    fields = ('target',)
+
+    def __init__(self, target, line=0):
+        self.target = target
+        self.slot = -1
+        self.line = line
+
+
+class If(Node):
+    __slots__ = ('condition', 'body', 'elif_clauses', 'else_body')
+    kind = IF
+    fields = ('condition', 'body', 'elif_clauses', 'else_body')
+
+    def __init__(self, condition, body, elif_clauses=None, else_body=None, line=0):
+        self.condition = condition
+        self.body = body
+        self.elif_clauses = elif_clauses
+        self.else_body = else_body
+        self.line = line
+
+
+class While(Node):
+    __slots__ = ('condition', 'body', 'plan')
+    kind = WHILE
+    fields = ('condition', 'body')
+
+    def __init__(self, condition, body, line=0):
+        self.condition = condition
+        self.body = body
+        self.plan = None
+        self.line = line
+
+
+class For(Node):
+    __slots__ = ('var', 'start', 'end', 'body', 'slot', 'plan')
+    kind = FOR
+    fields = ('var', 'start', 'end', 'body')
+
+    def __init__(self, var, start, end, body, line=0):
+        self.var = var
+        self.start = start
+        self.end = end
+        self.body = body
+        self.slot = -1
+        self.plan = None
+        self.line = line
+
+
+class FunctionDef(Node):
+    __slots__ = ('name', 'params', 'body', 'local_names', 'frame_size', 'shadowed', 'recursive', 'pure',
+                 'memoized')
+    kind = FUNCTION_DEF
+    fields = ('name', 'params', 'body')
+
+    def __init__(self, name, params, body, line=0):
+        self.name = name
+        self.params = params
+        self.body = body
+        self.local_names = tuple(params)
+        self.frame_size = len(params)
+        self.shadowed = frozenset()
+        self.recursive = True
+        self.pure = False
+        self.memoized = False
+        self.line = line
+
+
+class FunctionCall(Node):
+    __slots__ = ('name', 'args', 'builtin')
+    kind = FUNCTION_CALL
+    fields = ('name', 'args')
+
+    def __init__(self, name, args, line=0):
+        self.name = name
+        self.args = args
+        self.builtin = False
+        self.line = line
+
+
+class Return(Node):
+    __slots__ = ('value', 'tail')
+    kind = RETURN
+    fields = ('value',)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.tail = False
+        self.line = line
+
+
+class Break(Node):
+    __slots__ = ()
+    kind = BREAK
+
+    def __init__(self, line=0):
+        self.line = line
+
+
+class Continue(Node):
+    __slots__ = ()
+    kind = CONTINUE
+
+    def __init__(self, line=0):
+        self.line = line
+
+
+class Pass(Node):
+    __slots__ = ()
+    kind = PASS
+
+    def __init__(self, line=0):
+        self.line = line
+
+
+class TryExcept(Node):
+    __slots__ = ('try_body', 'except_body', 'finally_body')
+    kind = TRY_EXCEPT
+    fields = ('try_body', 'except_body', 'finally_body')
+
+    def __init__(self, try_body, except_body, finally_body=None, line=0):
+        self.try_body = try_body
+        self.except_body = except_body
+        self.finally_body = finally_body
+        self.line = line
+
+
+class Import(Node):
+    __slots__ = ('module',)
+    kind = IMPORT
+    fields = ('module',)
+
+    def __init__(self, module, line=0):
+        self.module = module
+        self.line = line
+
+
+class FromImport(Node):
+    __slots__ = ('module', 'name')
+    kind = FROM_IMPORT
+    fields = ('module', 'name')
+
+    def __init__(self, module, name, line=0):
+        self.module = module
+        self.name = name
+        self.line = line
+
+
+class ClassDef(Node):
+    __slots__ = ('name', 'parent', 'body')
+    kind = CLASS
+    fields = ('name', 'parent', 'body')
+
+    def __init__(self, name, body, parent=None, line=0):
+        self.name = name
+        self.parent = parent
+        self.body = body
+        self.line = line
+
+
+class Number(Node):
+    __slots__ = ('value',)
+    kind = NUMBER
+    fields = ('value',)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+
+class String(Node):
+    __slots__ = ('value',)
+    kind = STRING
+    fields = ('value',)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+
+class Boolean(Node):
+    __slots__ = ('value',)
+    kind = BOOLEAN
+    fields = ('value',)
+
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+
+class Identifier(Node):
+    __slots__ = ('name', 'slot')
+    kind = IDENTIFIER
+    fields = ('name',)
+
+    def __init__(self, name, line=0):
+        self.name = name
+        self.slot = -1
+        self.line = line
+
+
+class BinaryOp(Node):
+    __slots__ = ('op', 'left', 'right')
+    kind = BINARY_OP
+    fields = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right, line=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+
+
+class Comparison(Node):
+    __slots__ = ('op', 'left', 'right')
+    kind = COMPARISON
+    fields = ('op', 'left', 'right')
+
+    def __init__(self, op, left, right, line=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+
+
+class UnaryOp(Node):
+    __slots__ = ('op', 'operand')
+    kind = UNARY_OP
+    fields = ('op', 'operand')
+
+    def __init__(self, op, operand, line=0):
+        self.op = op
+        self.operand = operand
+        self.line = line
+
+
+class ArrayLiteral(Node):
+    __slots__ = ('elements',)
+    kind = ARRAY
+    fields = ('elements',)
+
+    def __init__(self, elements, line=0):
+        self.elements = elements
+        self.line = line
+
+
+class Index(Node):
+    __slots__ = ('value', 'index')
+    kind = INDEX
+    fields = ('value', 'index')
+
+    def __init__(self, value, index, line=0):
+        self.value = value
+        self.index = index
+        self.line = line
+
+
+class Slice(Node):
+    __slots__ = ('value', 'start', 'stop')
+    kind = SLICE
+    fields = ('value', 'start', 'stop')
+
+    def __init__(self, value, start, stop, line=0):
+        self.value = value
+        self.start = start
+        self.stop = stop
+        self.line = line
+
+
+def to_dict(ast, lines=False):
+    return _to_plain(ast, lines)
@@ -0,0 +1,162 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Runs many .kn programs over a pool of warm worker processes and writes one
+# JSON line per program: path, status, stdout, error and timings.
+#
+# python batch.py DIR [-o report.jsonl]        every *.kn under DIR; a sibling
+#                                              NAME.in file is fed as stdin
+# python batch.py manifest.jsonl [...]         lines of {"program": path,
+#                                              "stdin": path} or {"program":
+#                                              path, "input": text}
+#
+# Options: --workers N, --mode tree|closure|python|vm|stackless, --optimize,
+# --no-memo (do not memoize pure recursive functions), --max-depth N (nested
+# KA calls allowed in stackless and vm modes), and per-program budgets
+# --max-steps N, --timeout SECONDS, --max-memory BYTES.
+#
+# Status is "ok", "syntax_error" (the program did not parse), "error" (it
+# stopped with a runtime error, reported in `error`) or "limit_exceeded"
+# (it ran over its budget; `limit` says which one). Programs whose calls
+# were memoized also get `memo`: hits, misses and entries per function.
+
+OK = "ok"
+SYNTAX_ERROR = "syntax_error"
+ERROR = "error"
+LIMIT_EXCEEDED = "limit_exceeded"
+
+
+def warm_up():
+    # Load the parser tables once per worker, before the first job.
+    from parser import get_parser
+    get_parser()
+
+
+def discover(path):
+    if os.path.isdir(path):
+        jobs = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".kn"):
+                    program = os.path.join(root, name)
+                    stdin = program[:-3] + ".in"
+                    jobs.append({"program": program, "stdin": stdin if os.path.exists(stdin) else None})
+        return jobs
+    base = os.path.dirname(os.path.abspath(path))
+    jobs = []
+    with open(path, encoding="utf-8") as manifest:
+        for line in manifest:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            job = {"program": os.path.join(base, entry["program"])}
+            if entry.get("stdin") is not None:
+                job["stdin"] = os.path.join(base, entry["stdin"])
+            elif entry.get("input") is not None:
+                job["input"] = entry["input"]
+            jobs.append(job)
+    return jobs
+
+
+def run_job(job, mode="closure", passes=(), limits=None, memoize=True, max_depth=None):
+    from parser import KannadaInterpreter, format_error
+    from parse_cache import default_cache
+    from budget import Budget, BudgetExceeded
+    result = {"program": job["program"], "status": OK, "error": None}
+    started = prepared = time.perf_counter()
+    stdout = io.StringIO()
+    interpreter = None
+    try:
+        with open(job["program"], encoding="utf-8") as source:
+            code = source.read().strip()
+        if job.get("stdin") is not None:
+            with open(job["stdin"], encoding="utf-8") as stdin:
+                text = stdin.read()
+        else:
+            text = job.get("input") or ""
+        saved_stdin = sys.stdin
+        sys.stdin = io.StringIO(text)
+        try:
+            with contextlib.redirect_stdout(stdout):
+                run = default_cache.prepared(code, mode, passes, max_depth)
+                prepared = time.perf_counter()
+                if run is None:
+                    result["status"] = SYNTAX_ERROR
+                else:
+                    interpreter = KannadaInterpreter(budget=Budget(**limits) if limits else None, memoize=memoize)
+                    run(interpreter)
+        finally:
+            sys.stdin = saved_stdin
+    except BudgetExceeded as e:
+        result["status"] = LIMIT_EXCEEDED
+        result["error"] = format_error(e)
+        result["limit"] = e.kind
+    except Exception as e:
+        result["status"] = ERROR
+        result["error"] = format_error(e)
+    finished = time.perf_counter()
+    result["stdout"] = stdout.getvalue()
+    if interpreter is not None and interpreter.memo is not None and interpreter.memo.counts:
+        result["memo"] = interpreter.memo.stats()
+    result["prepare_seconds"] = round(prepared - started, 6)
+    result["seconds"] = round(finished - started, 6)
+    return result
+
+
+def _run(args):
+    return run_job(*args)
+
+
+def run_batch(jobs, report, workers=None, mode="closure", passes=(), limits=None, memoize=True, max_depth=None):
+    counts = {OK: 0, SYNTAX_ERROR: 0, ERROR: 0, LIMIT_EXCEEDED: 0}
+    chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as pool:
+        for result in pool.map(_run, [(job, mode, passes, limits, memoize, max_depth) for job in jobs], chunksize=chunksize):
+            counts[result["status"]] += 1
+            report.write(json.dumps(result, ensure_ascii=False) + "\n")
+    return counts
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Run many KA-Lang programs in a process pool")
+    arg_parser.add_argument("source", help="directory of .kn files or a JSON-lines manifest")
+    arg_parser.add_argument("-o", "--output", help="report file (default: stdout)")
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--mode", default="closure", choices=["tree", "closure", "python", "vm", "stackless"])
+    arg_parser.add_argument("--optimize", action="store_true", help="run the AST optimizer first")
+    arg_parser.add_argument("--no-memo", action="store_true", help="do not memoize pure recursive functions")
+    arg_parser.add_argument("--max-depth", type=int, default=None, help="nested KA calls allowed in stackless and vm modes")
+    arg_parser.add_argument("--max-steps", type=int, default=None, help="statements each program may execute")
+    arg_parser.add_argument("--timeout", type=float, default=None, help="seconds each program may run")
+    arg_parser.add_argument("--max-memory", type=int, default=None, help="bytes each program's variables may hold")
+    args = arg_parser.parse_args()
+    passes = ()
+    if args.optimize:
+        from optimizer import PASSES
+        passes = PASSES
+    limits = {name: value for name, value in (("max_steps", args.max_steps), ("timeout", args.timeout),
+                                              ("max_memory", args.max_memory)) if value is not None}
+    jobs = discover(args.source)
+    started = time.perf_counter()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as report:
+            counts = run_batch(jobs, report, args.workers, args.mode, passes, limits, not args.no_memo,
+                               args.max_depth)
+    else:
+        counts = run_batch(jobs, sys.stdout, args.workers, args.mode, passes, limits, not args.no_memo,
+                           args.max_depth)
+    elapsed = time.perf_counter() - started
+    summary = "  ".join(f"{status} {count}" for status, count in counts.items())
+    print(f"{len(jobs)} programs in {elapsed:.2f} s  {summary}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,973 @@
+import argparse
+import compileall
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from ast_nodes import to_dict
+from parser import parse, execute, KannadaInterpreter
+
+
+# python benchmarks.py execute [mode ...]   time workloads per execution mode
+#                      [--optimize]          ... after optimizer.optimize()
+# python benchmarks.py memory [statements]  AST node classes vs dict nodes
+# python benchmarks.py cache [runs]          repeated runs with/without the parse cache
+# python benchmarks.py startup [runs]        fresh process: import to first statement
+# python benchmarks.py scaling               parse time vs program size; fails if not near-linear
+# python benchmarks.py lex [statements]      PLY lexer vs scanner vs streaming: tokens/s, peak RSS
+# python benchmarks.py budget [mode ...]     loop workloads with and without an execution budget
+# python benchmarks.py suite [workload ...]   tokenize, parse and execute times, min/median
+#                      [--modes mode ...] [--repeats N] [--json results.json] [--compare old.json]
+#                      [--no-memo] [--no-specialize]
+# python benchmarks.py tailcall [mode ...]   tail-recursive loops in a shallow Python stack
+# python benchmarks.py recursion [depth]     deep non-tail recursion in stackless and vm modes
+# python benchmarks.py arrays [size]         element by element loops vs whole-array operations
+#                      [--modes mode ...]
+# python benchmarks.py loops [mode ...]      loop workloads with and without loop specialization
+# python benchmarks.py conformance [mode ...] small programs whose output every mode must match
+#
+# execute and budget run with memoization off, so that fib measures calls.
+
+WORKLOADS = {
+    "while_count": """ಪ್ರಾರಂಭಿಸಿ
+i = 0
+s = 0
+ಯಾವಾಗ (i < 200000)
+s = s + i % 7
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(s)
+ಮುಗಿಯಿರಿ""",
+    "literals": """ಪ್ರಾರಂಭಿಸಿ
+n = 200
+i = 0
+s = 0
+ಯಾವಾಗ (i < n * 1000)
+ನಂತರ (1 < 2)
+s = s + (60 * 60 * 24) % 7 + (n * 3 + 7) % 5
+ಮುಗಿಯಿರಿ
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(s)
+ಮುಗಿಯಿರಿ""",
+    "for_branch": """ಪ್ರಾರಂಭಿಸಿ
+even = 0
+odd = 0
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 200000))
+ನಂತರ (i % 2 == 0)
+even = even + i
+ಇಲ್ಲದಿದ್ದರೆ
+odd = odd + i
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(even, odd)
+ಮುಗಿಯಿರಿ""",
+    "loop_control": """ಪ್ರಾರಂಭಿಸಿ
+total = 0
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 200000))
+ನಂತರ (i % 3 == 0)
+ಮುಂದುವರಿಸು
+ಮುಗಿಯಿರಿ
+total = total + i
+ಮುಗಿಯಿರಿ
+j = 0
+ಯಾವಾಗ (true)
+j = j + 1
+ನಂತರ (j > 100000)
+ಮುರಿದುಬಿಡು
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(total, j)
+ಮುಗಿಯಿರಿ""",
+    "returns": """ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ pick(n):
+ನಂತರ (n % 2 == 0)
+ಹಿಂತಿರುಗಿಸು n
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು 0
+ಮುಗಿಯಿರಿ
+total = 0
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 100000))
+total = total + pick(i)
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(total)
+ಮುಗಿಯಿರಿ""",
+    "calls": """ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ step(a, b):
+c = a * b + 1
+ಮುಗಿಯಿರಿ
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 50000))
+step(i, 3)
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ""",
+    "fib": """ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ fib(n):
+ನಂತರ (n < 2)
+ಹಿಂತಿರುಗಿಸು n
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು fib(n - 1) + fib(n - 2)
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(fib(18))
+ಮುಗಿಯಿರಿ""",
+}
+
+# The same recursion with 500 globals defined first: call cost must not
+# depend on the size of the global table.
+WORKLOADS["fib_globals"] = WORKLOADS["fib"].replace(
+    "ಪ್ರಾರಂಭಿಸಿ\n", "ಪ್ರಾರಂಭಿಸಿ\n" + "".join(f"g{i} = {i}\n" for i in range(500)), 1)
+
+WORKLOADS["strings"] = """ಪ್ರಾರಂಭಿಸಿ
+s = ""
+i = 0
+ಯಾವಾಗ (i < 20000)
+s = s + "ka-lang "
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(s)
+ಮುಗಿಯಿರಿ"""
+
+# A for loop of sums the resolver reduces to closed form (loops.py).
+WORKLOADS["sums"] = """ಪ್ರಾರಂಭಿಸಿ
+k = 7
+a = 0
+b = 0
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 200000))
+a = a + i * i - 3 * i + 2
+b = b - k
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(a, b, i)
+ಮುಗಿಯಿರಿ"""
+
+WORKLOADS["printing"] = """ಪ್ರಾರಂಭಿಸಿ
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 20000))
+ಮುದ್ರಿಸಿ("line", i, i * 2, true)
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ"""
+
+# Twenty ifs nested in a loop: every iteration walks down all of them.
+WORKLOADS["nested_if"] = "\n".join(
+    ["ಪ್ರಾರಂಭಿಸಿ", "c = 0", "ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 10000))"]
+    + [f"ನಂತರ (i >= {depth})" if depth % 2 else f"ನಂತರ (i != {-depth - 1})" for depth in range(20)]
+    + ["c = c + 1"] + ["ಮುಗಿಯಿರಿ"] * 21 + ["ಮುದ್ರಿಸಿ(c)", "ಮುಗಿಯಿರಿ"])
+
+
+def time_execution(ast, mode, repeats=3):
+    best = None
+    for _ in range(repeats):
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            execute(ast, KannadaInterpreter(memoize=False), mode)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def quiet_parse(code):
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return parse(code)
+
+
+def generate_program(statements):
+    lines = ["ಪ್ರಾರಂಭಿಸಿ", "total = 0"]
+    for i in range(statements // 4):
+        lines.append(f"x{i} = {i} * 2 + total % 7")
+        lines.append(f"ನಂತರ (x{i} > {i})")
+        lines.append(f"total = total + x{i} - 1")
+        lines.append("ಮುಗಿಯಿರಿ")
+    lines.append("ಮುದ್ರಿಸಿ(total)")
+    lines.append("ಮುಗಿಯಿರಿ")
+    return "\n".join(lines)
+
+
+def generate_arguments(count):
+    values = ", ".join(f"{i} + 1" for i in range(count))
+    return f"ಪ್ರಾರಂಭಿಸಿ\nಮುದ್ರಿಸಿ({values})\nಮುಗಿಯಿರಿ"
+
+
+def traced_size(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def run_memory(statements):
+    ast = quiet_parse(generate_program(statements))
+    # Measure both forms built from the parsed tree so that lexer and
+    # parser allocations are not counted.
+    _, node_size = traced_size(lambda: _rebuild(ast))
+    _, dict_size = traced_size(lambda: to_dict(ast))
+    print(f"statements {statements}")
+    print(f"node classes {node_size / 1024:10.1f} KiB")
+    print(f"dict nodes   {dict_size / 1024:10.1f} KiB  ({dict_size / node_size:.2f}x)")
+
+
+def _rebuild(node):
+    if isinstance(node, list):
+        return [_rebuild(item) for item in node]
+    if not hasattr(node, "kind"):
+        return node
+    clone = object.__new__(type(node))
+    clone.line = node.line
+    for field in node.fields:
+        setattr(clone, field, _rebuild(getattr(node, field)))
+    return clone
+
+
+# Program sizes for the scaling check, and the most the per-statement parse
+# time may grow from the smallest to the largest before it counts as
+# super-linear. Building lists with p[1] + [p[2]] grew it 6-20x here.
+SCALING_SIZES = (1000, 10000, 100000)
+SCALING_LIMIT = 2.5
+
+
+def run_scaling(sizes=SCALING_SIZES, limit=SCALING_LIMIT):
+    failures = []
+    for shape, generate in (("statements", generate_program), ("arguments", generate_arguments)):
+        per_item = []
+        for size in sizes:
+            code = generate(size)
+            repeats = max(1, sizes[-1] // size // 10)
+            best = None
+            for _ in range(repeats):
+                start = time.perf_counter()
+                if quiet_parse(code) is None:
+                    raise SystemExit(f"{shape} {size}: generated program did not parse")
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            per_item.append(best / size)
+            print(f"{shape:<10} {size:7}  {best * 1000:9.1f} ms  {best / size * 1e6:6.2f} us/item")
+        growth = max(per_item) / per_item[0]
+        print(f"{shape:<10} per-item growth {growth:.2f}x (limit {limit}x)")
+        if growth > limit:
+            failures.append(shape)
+    if failures:
+        raise SystemExit(f"parse time is super-linear for: {', '.join(failures)}")
+
+
+def run_execute(modes, optimize=False):
+    for name, code in WORKLOADS.items():
+        ast = quiet_parse(code)
+        if optimize:
+            from optimizer import optimize as optimize_ast
+            ast, _ = optimize_ast(ast)
+        timings = {mode: time_execution(ast, mode) for mode in modes}
+        baseline = timings[modes[0]]
+        row = "  ".join(f"{mode} {seconds * 1000:8.1f} ms ({baseline / seconds:4.1f}x)"
+                        for mode, seconds in timings.items())
+        print(f"{name:<12} {row}")
+
+
+# Workloads dominated by loops and calls, where budgets are charged, and the
+# most a budget with every limit set may slow them down overall.
+BUDGET_WORKLOADS = ("while_count", "for_branch", "loop_control", "returns", "calls", "fib")
+BUDGET_LIMIT = 0.05
+
+
+def time_runs(runs, repeats):
+    # Best of `repeats` runs of each (prepared program, interpreter factory)
+    # pair, taken in turn so that noise on the machine hits them alike, after
+    # one untimed run that builds anything prepared lazily.
+    best = [None] * len(runs)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for run, make_interpreter in runs:
+            run(make_interpreter())
+        for _ in range(repeats):
+            for index, (run, make_interpreter) in enumerate(runs):
+                interpreter = make_interpreter()
+                start = time.perf_counter()
+                run(interpreter)
+                elapsed = time.perf_counter() - start
+                best[index] = elapsed if best[index] is None else min(best[index], elapsed)
+    return best
+
+
+def run_budget(modes, limit=BUDGET_LIMIT, repeats=5):
+    from budget import Budget
+    from parser import prepare
+    budget = Budget(max_steps=10 ** 12, timeout=3600, max_memory=2 ** 40)
+    failures = []
+    for mode in modes:
+        plain = budgeted = 0
+        for name in BUDGET_WORKLOADS:
+            run = prepare(quiet_parse(WORKLOADS[name]), mode)
+            free, charged = time_runs([(run, lambda: KannadaInterpreter(memoize=False)),
+                                       (run, lambda: KannadaInterpreter(budget=budget, memoize=False))], repeats)
+            plain += free
+            budgeted += charged
+            print(f"{mode:<8} {name:<12} {free * 1000:8.1f} ms  budgeted {charged * 1000:8.1f} ms"
+                  f"  ({(charged / free - 1) * 100:+5.1f}%)")
+        overhead = budgeted / plain - 1
+        print(f"{mode:<8} overall overhead {overhead * 100:+5.1f}% (limit {limit * 100:.0f}%)")
+        if overhead > limit:
+            failures.append(mode)
+    if failures:
+        raise SystemExit(f"budget checks cost more than {limit * 100:.0f}% in: {', '.join(failures)}")
+
+
+# A million tail calls of one function and of two calling each other. They
+# must run under TAIL_CALL_RECURSION_LIMIT, so the stack may not grow with them.
+TAIL_CALL_PROGRAM = """ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ total(n, acc):
+ನಂತರ (n == 0)
+ಹಿಂತಿರುಗಿಸು acc
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು total(n - 1, acc + n)
+ಮುಗಿಯಿರಿ
+ನಂತರ (true)
+ಕಾರ್ಯ even(n):
+ನಂತರ (n == 0)
+ಹಿಂತಿರುಗಿಸು true
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು odd(n - 1)
+ಮುಗಿಯಿರಿ
+ನಂತರ (true)
+ಕಾರ್ಯ odd(n):
+ನಂತರ (n == 0)
+ಹಿಂತಿರುಗಿಸು false
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು even(n - 1)
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(total(1000000, 0), even(1000000), odd(1000000))
+ಮುಗಿಯಿರಿ"""
+TAIL_CALL_OUTPUT = "500000500000 True False "
+TAIL_CALL_RECURSION_LIMIT = 200
+
+
+def run_tailcall(modes):
+    from budget import Budget
+    from parser import prepare
+    failures = []
+    for mode in modes:
+        run = prepare(quiet_parse(TAIL_CALL_PROGRAM), mode)
+        for budget in (None, Budget(max_steps=10 ** 12)):
+            output = io.StringIO()
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(TAIL_CALL_RECURSION_LIMIT)
+            start = time.perf_counter()
+            try:
+                run(KannadaInterpreter(output, budget))
+                result = output.getvalue()
+            except RecursionError:
+                result = "RecursionError"
+            finally:
+                sys.setrecursionlimit(limit)
+            elapsed = time.perf_counter() - start
+            label = "budgeted" if budget is not None else ""
+            print(f"{mode:<8} {label:<8} {elapsed * 1000:9.1f} ms  {result.strip()}")
+            if result != TAIL_CALL_OUTPUT:
+                failures.append(f"{mode} {label}".strip())
+    if failures:
+        raise SystemExit(f"tail calls did not run in constant stack depth in: {', '.join(failures)}")
+
+
+# Non-tail recursion `depth` calls deep, under the same recursion limit as
+# the tail calls: it must finish with a stack limit of depth + 1 calls and
+# stop with StackOverflow at depth.
+RECURSION_PROGRAM = """ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ count(n):
+ನಂತರ (n == 0)
+ಹಿಂತಿರುಗಿಸು 0
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು 1 + count(n - 1)
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(count(DEPTH))
+ಮುಗಿಯಿರಿ"""
+
+
+def run_recursion(depth):
+    from parser import prepare
+    from stackless import StackOverflow
+    ast = quiet_parse(RECURSION_PROGRAM.replace("DEPTH", str(depth)))
+    failures = []
+    for mode in ("stackless", "vm"):
+        for max_depth, expected in ((depth + 1, f"{depth} "), (depth, "StackOverflow")):
+            run = prepare(ast, mode, max_depth)
+            output = io.StringIO()
+            limit = sys.getrecursionlimit()
+            sys.setrecursionlimit(TAIL_CALL_RECURSION_LIMIT)
+            start = time.perf_counter()
+            try:
+                run(KannadaInterpreter(output, memoize=False))
+                result = output.getvalue()
+            except (RecursionError, StackOverflow) as e:
+                result = type(e).__name__
+            finally:
+                sys.setrecursionlimit(limit)
+            elapsed = time.perf_counter() - start
+            print(f"{mode:<10} max depth {max_depth:<8} {elapsed * 1000:9.1f} ms  {result.strip()}")
+            if result != expected:
+                failures.append(f"{mode} {max_depth}")
+    if failures:
+        raise SystemExit(f"count({depth}) went wrong with max depth {', '.join(failures)}")
+
+
+# The same sums over an array of `size` numbers, once element by element in
+# a KA loop and once with whole-array operations; each pair must agree in
+# every mode.
+ARRAY_LOOP_PROGRAM = """ಪ್ರಾರಂಭಿಸಿ
+a = VALUES
+i = 0
+s = 0
+big = 0
+ಯಾವಾಗ (i < ಉದ್ದ(a))
+x = a[i]
+s = s + x * x + 3 * x
+ನಂತರ (x > 500)
+big = big + 1
+ಮುಗಿಯಿರಿ
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(s, big)
+ಮುಗಿಯಿರಿ"""
+ARRAY_BULK_PROGRAM = """ಪ್ರಾರಂಭಿಸಿ
+a = VALUES
+ಮುದ್ರಿಸಿ(ಮೊತ್ತ(a * a + 3 * a), ಮೊತ್ತ(a > 500))
+ಮುಗಿಯಿರಿ"""
+
+
+def run_arrays(size, modes):
+    from parser import prepare
+    values = "[" + ", ".join(str(i % 1000) for i in range(size)) + "]"
+    programs = [quiet_parse(program.replace("VALUES", values))
+                for program in (ARRAY_LOOP_PROGRAM, ARRAY_BULK_PROGRAM)]
+    failures = []
+    for mode in modes:
+        results = []
+        for ast in programs:
+            run = prepare(ast, mode)
+            output = io.StringIO()
+            start = time.perf_counter()
+            run(KannadaInterpreter(output, memoize=False))
+            results.append((time.perf_counter() - start, output.getvalue()))
+        (loop_time, loop_output), (bulk_time, bulk_output) = results
+        print(f"{mode:<10} loop {loop_time * 1000:9.1f} ms  arrays {bulk_time * 1000:8.1f} ms  "
+              f"{loop_time / bulk_time:6.1f}x  {bulk_output.strip()}")
+        if loop_output != bulk_output:
+            failures.append(mode)
+    if failures:
+        raise SystemExit(f"array operations and loops disagree in: {', '.join(failures)}")
+
+
+# Loops the resolver plans (loops.py): reduced to closed form, or run
+# without statement dispatch.
+LOOP_WORKLOADS = ("while_count", "strings", "sums")
+
+
+def run_loops(modes):
+    from parser import prepare
+    failures = []
+    for name in LOOP_WORKLOADS:
+        ast = quiet_parse(WORKLOADS[name])
+        for mode in modes:
+            run = prepare(ast, mode)
+            results = []
+            for specialize in (False, True):
+                output = io.StringIO()
+                start = time.perf_counter()
+                run(KannadaInterpreter(output, memoize=False, specialize=specialize))
+                results.append((time.perf_counter() - start, output.getvalue()))
+            (plain_time, plain_output), (fast_time, fast_output) = results
+            print(f"{name:<12} {mode:<10} plain {plain_time * 1000:9.1f} ms  specialized {fast_time * 1000:9.1f} ms  "
+                  f"{plain_time / fast_time:8.1f}x")
+            if plain_output != fast_output:
+                failures.append(f"{name} ({mode})")
+    if failures:
+        raise SystemExit(f"specialized loops disagree in: {', '.join(failures)}")
+
+
+# Programs with the output each must print in every mode, with and without
+# a budget, and after optimizer.optimize().
+CONFORMANCE_CASES = {
+    # A local read before it is assigned has the global of that name.
+    "global_read": ("""ಪ್ರಾರಂಭಿಸಿ
+g = 10
+ನಂತರ (true)
+ಕಾರ್ಯ f(n):
+g = g + n
+ಹಿಂತಿರುಗಿಸು g
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(f(1), f(2), g)
+ಮುಗಿಯಿರಿ""", "11 12 10 "),
+    # ... so a recursive function reading one is not memoized.
+    "global_read_recursive": ("""ಪ್ರಾರಂಭಿಸಿ
+g = 1
+ನಂತರ (true)
+ಕಾರ್ಯ r(n):
+ನಂತರ (n == 0)
+g = g * 2
+ಹಿಂತಿರುಗಿಸು g
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು r(n - 1) + 0
+ಮುಗಿಯಿರಿ
+a = r(3)
+g = 5
+ಮುದ್ರಿಸಿ(a, r(3), g)
+ಮುಗಿಯಿರಿ""", "2 10 5 "),
+    # Break, continue and return in a finally body end just that body.
+    "finally_break": ("""ಪ್ರಾರಂಭಿಸಿ
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 3))
+ಪ್ರಯತ್ನಿಸು:
+ಮುದ್ರಿಸಿ(i)
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ("e")
+ಕೊನೆಗೂ:
+ಮುರಿದುಬಿಡು
+ಮುದ್ರಿಸಿ("no")
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ("end")
+ಮುಗಿಯಿರಿ""", "0 1 2 end "),
+    "finally_return": ("""ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ f():
+ಪ್ರಯತ್ನಿಸು:
+x = 1
+ಹೊರಹಾಕು:
+x = 2
+ಕೊನೆಗೂ:
+ನಿಮಿತ್ತ (j ಒಳಗೆ ವ್ಯಾಪ್ತಿ(0, 3))
+ನಂತರ (j == 1)
+ಹಿಂತಿರುಗಿಸು 3
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(j)
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ("no")
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(f())
+ಮುಗಿಯಿರಿ""", "0 None "),
+    "finally_nested": ("""ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ g(n):
+ಪ್ರಯತ್ನಿಸು:
+ಹಿಂತಿರುಗಿಸು n * 10
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ("e")
+ಕೊನೆಗೂ:
+ಪ್ರಯತ್ನಿಸು:
+ಮುದ್ರಿಸಿ("in")
+ಹಿಂತಿರುಗಿಸು 99
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ("e2")
+ಕೊನೆಗೂ:
+ಮುದ್ರಿಸಿ("inner")
+ಮುಗಿಯಿರಿ
+k = 0
+ಯಾವಾಗ (k < 3)
+k = k + 1
+ಪ್ರಯತ್ನಿಸು:
+x = 1 / (k - 2)
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ("div")
+ಕೊನೆಗೂ:
+ಮುಂದುವರಿಸು
+ಮುದ್ರಿಸಿ("no")
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(g(4), k)
+ಮುಗಿಯಿರಿ""", "div in inner 40 3 "),
+    # The optimizer moves nothing that fails ahead of a print or assignment.
+    "hoist_after_effects": ("""ಪ್ರಾರಂಭಿಸಿ
+k = 6
+z = 0
+n = 0
+ಪ್ರಯತ್ನಿಸು:
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(5, 8))
+ಮುದ್ರಿಸಿ("x")
+n = n + 1
+y = k / z
+ಮುಗಿಯಿರಿ
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ(n, i)
+ಮುಗಿಯಿರಿ""", "x 1 5 "),
+    "hoist_loop_variable": ("""ಪ್ರಾರಂಭಿಸಿ
+k = 6
+z = 0
+n = 0
+ಪ್ರಯತ್ನಿಸು:
+ನಿಮಿತ್ತ (i ಒಳಗೆ ವ್ಯಾಪ್ತಿ(5, 8))
+y = k / z
+ಮುಗಿಯಿರಿ
+ಹೊರಹಾಕು:
+ಮುದ್ರಿಸಿ(i)
+ಮುಗಿಯಿರಿ""", "5 "),
+    # The guard around a hoisted while loop keeps the original condition.
+    "hoist_index_condition": ("""ಪ್ರಾರಂಭಿಸಿ
+a = [1, 5, 9, 2, 0, 0]
+k = 1
+i = 0
+ಯಾವಾಗ (a[k * 2] > i)
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(i)
+ಮುಗಿಯಿರಿ""", "9 "),
+}
+
+
+# Programs run under a budget of {limit: value}, with the output each must
+# print in every mode before the budget stops it with that kind of limit.
+BUDGET_CASES = {
+    # Every while iteration is paid for before it runs: 8 statements in
+    # four iterations would pass a 7 statement limit.
+    "while_steps": ("""ಪ್ರಾರಂಭಿಸಿ
+i = 0
+ಯಾವಾಗ (true)
+ಮುದ್ರಿಸಿ(i)
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ""", {"max_steps": 7}, "0 1 2 ", "steps"),
+    "while_steps_long": ("""ಪ್ರಾರಂಭಿಸಿ
+i = 0
+ಯಾವಾಗ (true)
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ(i)
+ಮುಗಿಯಿರಿ""", {"max_steps": 20000}, "", "steps"),
+    # The memory cap sees a function's locals in every mode.
+    "local_memory": ("""ಪ್ರಾರಂಭಿಸಿ
+ನಂತರ (true)
+ಕಾರ್ಯ grow(n):
+s = "x"
+i = 0
+ಯಾವಾಗ (i < n)
+s = s + "0123456789"
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಹಿಂತಿರುಗಿಸು 1
+ಮುಗಿಯಿರಿ
+ಮುದ್ರಿಸಿ("start")
+ಮುದ್ರಿಸಿ(grow(300000))
+ಮುಗಿಯಿರಿ""", {"max_memory": 1000000}, "start ", "memory"),
+}
+
+
+def run_conformance(modes):
+    from budget import Budget, BudgetExceeded
+    from optimizer import optimize
+    from parser import prepare, format_error
+    failures = []
+    for name, (program, expected) in CONFORMANCE_CASES.items():
+        ast = quiet_parse(program)
+        for tree, optimized in ((ast, ""), (optimize(ast)[0], " optimized")):
+            for mode in modes:
+                run = prepare(tree, mode)
+                for budget in (None, Budget(max_steps=10 ** 12)):
+                    output = io.StringIO()
+                    try:
+                        run(KannadaInterpreter(output, budget))
+                    except Exception as e:
+                        output.write(format_error(e))
+                    if output.getvalue() != expected:
+                        label = mode + optimized + (" budgeted" if budget is not None else "")
+                        failures.append(f"{name} ({label})")
+                        print(f"{name:<24} {label:<30} {output.getvalue()!r}, expected {expected!r}")
+    for name, (program, limits, expected, kind) in BUDGET_CASES.items():
+        ast = quiet_parse(program)
+        for mode in modes:
+            output = io.StringIO()
+            stopped = None
+            try:
+                prepare(ast, mode)(KannadaInterpreter(output, Budget(**limits)))
+            except BudgetExceeded as e:
+                stopped = e.kind
+            if (output.getvalue(), stopped) != (expected, kind):
+                failures.append(f"{name} ({mode})")
+                print(f"{name:<24} {mode:<30} {output.getvalue()!r} stopped by {stopped}, "
+                      f"expected {expected!r} stopped by {kind}")
+    print(f"{len(CONFORMANCE_CASES) + len(BUDGET_CASES)} programs, {len(modes)} modes, {len(failures)} failures")
+    if failures:
+        raise SystemExit(f"wrong output from: {', '.join(failures)}")
+
+
+def run_cache(runs, mode="closure"):
+    from parse_cache import ParseCache
+    from parser import prepare
+    code = generate_program(200)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(runs):
+            prepare(parse(code), mode)(KannadaInterpreter())
+        uncached = time.perf_counter() - start
+        cache = ParseCache()
+        start = time.perf_counter()
+        for _ in range(runs):
+            cache.prepared(code, mode)(KannadaInterpreter())
+        cached = time.perf_counter() - start
+    print(f"runs {runs}  mode {mode}")
+    print(f"parse every run {uncached * 1000:8.1f} ms")
+    print(f"parse cache     {cached * 1000:8.1f} ms  ({uncached / cached:.1f}x)  {cache.stats()}")
+
+
+# Runs in a fresh interpreter: times importing parser.py and then running a
+# program up to its first statement, and reports both on stderr.
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import parser
+imported = time.perf_counter()
+parser.execute(parser.parse("ಪ್ರಾರಂಭಿಸಿ\\nಮುದ್ರಿಸಿ(1)\\nಮುಗಿಯಿರಿ"))
+executed = time.perf_counter()
+print(imported - start, executed - start, file=sys.stderr)
+"""
+
+
+def run_startup(runs):
+    here = os.path.dirname(os.path.abspath(__file__))
+    # Time loading cached bytecode, as an installed copy would, even when
+    # PYTHONDONTWRITEBYTECODE keeps imports from writing it.
+    compileall.compile_dir(here, maxlevels=0, quiet=1)
+    imports, firsts, processes = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=here,
+                                capture_output=True, text=True, check=True)
+        processes.append(time.perf_counter() - start)
+        imported, executed = map(float, result.stderr.split()[-2:])
+        imports.append(imported)
+        firsts.append(executed)
+    print(f"runs {runs}  (median)")
+    print(f"import parser            {statistics.median(imports) * 1000:8.1f} ms")
+    print(f"import to first statement {statistics.median(firsts) * 1000:7.1f} ms")
+    print(f"whole process            {statistics.median(processes) * 1000:8.1f} ms")
+
+
+# Lexes the file named on the command line in a fresh interpreter: whole,
+# with the PLY lexer ("ply") or the scanner ("scanner"), or through the
+# streaming tokenizer ("stream"); "none" only loads both. Prints the token
+# count, seconds and peak RSS in KiB.
+LEX_SCRIPT = """
+import resource, sys, time
+from lexer import get_lexer, tokenize_file
+from scanner import tokenize
+
+def peak_rss():
+    # VmHWM belongs to this process image; ru_maxrss can carry the parent's
+    # peak across fork and exec.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+path, how = sys.argv[1:]
+lexer = get_lexer().clone()
+start = time.perf_counter()
+count = 0
+if how == "stream":
+    for _ in tokenize_file(path):
+        count += 1
+elif how == "ply":
+    with open(path, encoding="utf-8") as source:
+        lexer.input(source.read())
+    for _ in iter(lexer.token, None):
+        count += 1
+elif how == "scanner":
+    with open(path, encoding="utf-8") as source:
+        for _ in tokenize(source.read()):
+            count += 1
+elapsed = time.perf_counter() - start
+print(count, elapsed, peak_rss())
+"""
+
+
+# Token-stream edge cases for the scanner conformance check: keyword
+# prefixes, Kannada and other Unicode digits, strings across lines, and
+# illegal characters.
+SCANNER_CORPUS = [
+    "trueish falsey ಆಗುವ ಇಲ್ಲದಿದ್ದರೆನಂತರ ಮುಗಿಸು_ನಂತರx ನಂತರ1 true೧x a1١ x೧",
+    "೧೨ + ೩ * ١٢ ** 2 // 3 % 4 != 5 <= 6 >= 7 == 8 = ! < > ( ) : ,",
+    "x = 'a\nb'\ny = \"q\n z = 'open\n\n\tw = 3 @ 4 $ é \r\n\n",
+    "\n\n  \t ಮುದ್ರಿಸಿ(\"ಹಲೋ\") ಮುದ್ರಣ ಕಾರ್ಯ ನಿರ್ಧರಿಸು   \t",
+]
+
+
+def check_scanner(texts):
+    from lexer import get_lexer
+    from scanner import tokenize
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for text in texts:
+            lexer = get_lexer().clone()
+            lexer.input(text)
+            expected = [(t.type, t.value, t.lineno, t.lexpos) for t in iter(lexer.token, None)]
+            actual = [(t.type, t.value, t.lineno, t.lexpos) for t in tokenize(text)]
+            if actual != expected:
+                raise AssertionError(f"scanner and PLY lexer disagree on {text[:60]!r}")
+
+
+def run_lex(statements):
+    check_scanner(SCANNER_CORPUS + list(WORKLOADS.values()) + [generate_program(2000)])
+    here = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "generated.kn")
+        with open(path, "w", encoding="utf-8") as source:
+            source.write(generate_program(statements))
+        size = os.path.getsize(path)
+        print(f"statements {statements}  source {size / 1024 / 1024:.1f} MiB")
+        for how in ("none", "ply", "scanner", "stream"):
+            result = subprocess.run([sys.executable, "-c", LEX_SCRIPT, path, how], cwd=here,
+                                    capture_output=True, text=True, check=True)
+            count, seconds, rss = result.stdout.split()
+            count, seconds = int(count), float(seconds)
+            rate = f"{count / seconds:12,.0f} tokens/s" if count else " " * 21
+            print(f"{how:<7} {count:9} tokens  {rate}  peak RSS {int(rss) / 1024:7.1f} MiB")
+
+
+# Workloads the suite runs by default: a tight while loop, recursion,
+# string concatenation, heavy printing and deep if nesting. Loop
+# specialization reduces the strings loop to its closed form; run with
+# --no-specialize to time the concatenation itself, as earlier versions did.
+SUITE_WORKLOADS = ("while_count", "fib", "strings", "printing", "nested_if")
+
+
+def summarize(times):
+    return {"min": min(times), "median": statistics.median(times), "runs": times}
+
+
+def time_phases(code, modes, repeats, memoize=True, specialize=True):
+    # Tokenizing, parsing the tokens and executing are timed on their own,
+    # each `repeats` times; execution runs prepare()d code in a fresh
+    # interpreter and leaves the one-off preparation out.
+    from parser import Parser, prepare
+    from scanner import tokenize
+    parser = Parser()
+    phases = {"tokenize": [], "parse": []}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            tokens = list(tokenize(code))
+            phases["tokenize"].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            ast = parser.parse_tokens(tokens)
+            phases["parse"].append(time.perf_counter() - start)
+        for mode in modes:
+            run = prepare(ast, mode)
+            run(KannadaInterpreter(memoize=memoize, specialize=specialize))
+            times = phases[f"execute:{mode}"] = []
+            for _ in range(repeats):
+                interpreter = KannadaInterpreter(memoize=memoize, specialize=specialize)
+                start = time.perf_counter()
+                run(interpreter)
+                times.append(time.perf_counter() - start)
+    return {phase: summarize(times) for phase, times in phases.items()}
+
+
+def run_suite(workloads, modes, repeats, json_path=None, compare_path=None, memoize=True, specialize=True):
+    unknown = [name for name in workloads if name not in WORKLOADS]
+    if unknown:
+        raise SystemExit(f"unknown workloads: {', '.join(unknown)} (choose from {', '.join(WORKLOADS)})")
+    baseline = {}
+    if compare_path:
+        with open(compare_path, encoding="utf-8") as previous:
+            baseline = json.load(previous)["workloads"]
+    results = {}
+    for name in workloads:
+        results[name] = phases = time_phases(WORKLOADS[name], modes, repeats, memoize, specialize)
+        for phase, timing in phases.items():
+            row = f"{name:<12} {phase:<16} min {timing['min'] * 1000:9.3f} ms  median {timing['median'] * 1000:9.3f} ms"
+            old = baseline.get(name, {}).get(phase)
+            if old:
+                row += f"  ({timing['median'] / old['median']:5.2f}x of {compare_path})"
+            print(row)
+    if json_path:
+        report = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "memoize": memoize,
+            "specialize": specialize,
+            "workloads": results,
+        }
+        with open(json_path, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="KA-Lang benchmarks")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    execute_command = commands.add_parser("execute", help="time workloads per execution mode")
+    execute_command.add_argument("modes", nargs="*", default=["tree", "vm"])
+    execute_command.add_argument("--optimize", action="store_true", help="run the AST optimizer first")
+    memory_command = commands.add_parser("memory", help="compare AST memory use")
+    memory_command.add_argument("statements", nargs="?", type=int, default=40000)
+    cache_command = commands.add_parser("cache", help="time repeated runs with and without the parse cache")
+    cache_command.add_argument("runs", nargs="?", type=int, default=200)
+    startup_command = commands.add_parser("startup", help="time a fresh process from import to first statement")
+    startup_command.add_argument("runs", nargs="?", type=int, default=20)
+    commands.add_parser("scaling", help="check that parse time grows linearly with program size")
+    lex_command = commands.add_parser("lex", help="compare whole-text and streaming lexing")
+    lex_command.add_argument("statements", nargs="?", type=int, default=200000)
+    budget_command = commands.add_parser("budget", help="time loop workloads with and without a budget")
+    budget_command.add_argument("modes", nargs="*", default=["tree", "closure", "python", "vm"])
+    suite_command = commands.add_parser("suite", help="time tokenizing, parsing and executing each workload")
+    suite_command.add_argument("workloads", nargs="*", default=list(SUITE_WORKLOADS))
+    suite_command.add_argument("--modes", nargs="+", default=["tree"],
+                               choices=["tree", "closure", "python", "vm", "stackless"])
+    suite_command.add_argument("--repeats", type=int, default=5)
+    suite_command.add_argument("--json", help="save the results to this file")
+    suite_command.add_argument("--compare", help="results file of an earlier run to compare medians with")
+    suite_command.add_argument("--no-memo", action="store_true", help="do not memoize pure recursive functions")
+    suite_command.add_argument("--no-specialize", action="store_true",
+                               help="run counting loops and reductions as written (loops.py)")
+    tailcall_command = commands.add_parser("tailcall", help="check that tail calls keep the stack flat")
+    tailcall_command.add_argument("modes", nargs="*", default=["tree", "closure", "python", "vm", "stackless"])
+    recursion_command = commands.add_parser("recursion", help="check deep recursion against the KA stack limit")
+    recursion_command.add_argument("depth", nargs="?", type=int, default=100000)
+    arrays_command = commands.add_parser("arrays", help="time loops against whole-array operations")
+    arrays_command.add_argument("size", nargs="?", type=int, default=100000)
+    arrays_command.add_argument("--modes", nargs="+", default=["tree", "closure", "python", "vm", "stackless"],
+                                choices=["tree", "closure", "python", "vm", "stackless"])
+    loops_command = commands.add_parser("loops", help="time loop workloads with and without loop specialization")
+    loops_command.add_argument("modes", nargs="*", default=["tree", "closure", "stackless"])
+    conformance_command = commands.add_parser("conformance", help="check small programs' output in every mode")
+    conformance_command.add_argument("modes", nargs="*", default=["tree", "closure", "python", "vm", "stackless"])
+    args = arg_parser.parse_args()
+    if args.command == "execute":
+        run_execute(args.modes, args.optimize)
+    elif args.command == "cache":
+        run_cache(args.runs)
+    elif args.command == "startup":
+        run_startup(args.runs)
+    elif args.command == "scaling":
+        run_scaling()
+    elif args.command == "lex":
+        run_lex(args.statements)
+    elif args.command == "budget":
+        run_budget(args.modes)
+    elif args.command == "suite":
+        run_suite(args.workloads, args.modes, args.repeats, args.json, args.compare, not args.no_memo,
+                  not args.no_specialize)
+    elif args.command == "tailcall":
+        run_tailcall(args.modes)
+    elif args.command == "recursion":
+        run_recursion(args.depth)
+    elif args.command == "arrays":
+        run_arrays(args.size, args.modes)
+    elif args.command == "loops":
+        run_loops(args.modes)
+    elif args.command == "conformance":
+        run_conformance(args.modes)
+    else:
+        run_memory(args.statements)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import sys
+import time
+from itertools import chain, repeat
+from operator import length_hint
+
+
+# Per-run limits for programs we do not trust: a number of executed
+# statements, a wall-clock timeout and a cap on the memory held by variables.
+# Hand a Budget to KannadaInterpreter(budget=...); every execution mode
+# charges it at the only places a program can run for long, loop iterations
+# and calls of recursive functions (see resolver.py), by the number of
+# statements in the loop or function body. The charge is a countdown; the clock and memory are looked at only
+# when it runs out, every CHECK_INTERVAL statements (every
+# MEMORY_CHECK_INTERVAL with a memory cap). Memory is sampled, so it bounds
+# steady growth; a value that doubles on every statement can still outrun
+# it between samples, which a step or time limit then has to stop.
+#
+# Counting every iteration costs more than a cheap loop body, so loops
+# iterate over iterations(): pieces of as many iterations as fit before the
+# next check, chained in C, each charged once when it is used up or
+# abandoned. When several are under way at once, such as a loop nested in
+# another, each counts its piece only as it finishes with it, so the step
+# limit may be passed by up to one check interval for each; for a single
+# loop it is exact.
+#
+# A run over budget stops with BudgetExceeded. Like KeyboardInterrupt it is
+# not an Exception, so a KA try block cannot catch it.
+
+CHECK_INTERVAL = 10000
+MEMORY_CHECK_INTERVAL = 1000
+
+STEPS = "steps"
+TIME = "time"
+MEMORY = "memory"
+
+
+class BudgetExceeded(BaseException):
+    def __init__(self, kind, message):
+        super().__init__(message)
+        self.kind = kind
+
+
+def body_cost(body):
+    if isinstance(body, list):
+        return max(len(body), 1)
+    return 1
+
+
+def environment_size(interpreter):
+    # Bytes held by global variables and the current call's locals, one
+    # level deep (a value's own size, not what it refers to). The locals are
+    # whatever iterable the execution mode keeps as the interpreter's frame.
+    size = sum(sys.getsizeof(value) for value in interpreter.variables.values())
+    if interpreter.frame is not None:
+        size += sum(sys.getsizeof(value) for value in interpreter.frame)
+    return size
+
+
+class Budget:
+    def __init__(self, max_steps=None, timeout=None, max_memory=None):
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.start()
+
+    def start(self):
+        # Called by the execution modes when a run begins.
+        self.steps = 0
+        self.deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        self._reset()
+
+    def _reset(self):
+        interval = CHECK_INTERVAL if self.max_memory is None else MEMORY_CHECK_INTERVAL
+        if self.max_steps is not None:
+            interval = max(min(interval, self.max_steps - self.steps + 1), 1)
+        self.interval = self.countdown = interval
+
+    def iterations(self, interpreter, cost, stop=None, start=0):
+        # Stands in for range(start, stop), or for an endless loop when
+        # stop is None, in a loop whose body costs `cost`.
+        return chain.from_iterable(self.pieces(interpreter, cost, stop, start))
+
+    def pieces(self, interpreter, cost, stop=None, start=0):
+        while stop is None or start < stop:
+            count = (self.countdown - 1) // cost
+            prepaid = 0
+            if count < 1:
+                # The next iteration reaches the check: pay for it first.
+                self.countdown -= cost
+                self.check(interpreter)
+                count = prepaid = 1
+            if stop is None:
+                piece = repeat(None, count)
+            else:
+                count = min(count, stop - start)
+                piece = iter(range(start, start + count))
+                start += count
+            try:
+                yield piece
+            finally:
+                # Also runs when the loop is left early and the generator is
+                # closed, where raising would be lost: the check waits.
+                self.countdown -= (count - length_hint(piece) - prepaid) * cost
+
+    def check(self, interpreter):
+        self.steps += self.interval - self.countdown
+        if self.max_steps is not None and self.steps > self.max_steps:
+            raise BudgetExceeded(STEPS, f"ಹಂತಗಳ ಮಿತಿ ಮೀರಿದೆ/Step limit exceeded: {self.max_steps} statements")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise BudgetExceeded(TIME, f"ಸಮಯ ಮಿತಿ ಮೀರಿದೆ/Time limit exceeded: {self.timeout} s")
+        if self.max_memory is not None and environment_size(interpreter) > self.max_memory:
+            raise BudgetExceeded(MEMORY, f"ಸ್ಮೃತಿ ಮಿತಿ ಮೀರಿದೆ/Memory limit exceeded: {self.max_memory} bytes")
+        self._reset()
@@ -0,0 +1,441 @@
+import operator
+from itertools import repeat
+
+from ast_nodes import (
+    PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS,
+    TRY_EXCEPT, IMPORT, FROM_IMPORT, CLASS, NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP,
+    ARRAY, INDEX, SLICE,
+)
+from parser import KannadaInterpreter
+from resolver import new_frame, UNSET
+from signals import RETURN_SIGNAL, BREAK_SIGNAL, CONTINUE_SIGNAL, TAIL_CALL_SIGNAL
+from budget import body_cost
+from memo import MISSING
+from arrays import BUILTINS, make_array, get_item, get_slice
+from loops import run_reduction
+
+
+# Compiles the AST produced by parser.parse into a tree of closures.
+# Every closure takes the interpreter whose `variables` and `functions`
+# hold the program state, so one compiled program can be run many times.
+# Statement closures return None or a control-flow signal (signals.py).
+# Loops that reduce in closed form (loops.py) try that first.
+
+BINARY_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': operator.floordiv,
+    '**': operator.pow,
+    '%': operator.mod,
+}
+
+COMPARISON_OPS = {
+    'LESS': operator.lt,
+    'GREATER': operator.gt,
+    'EQUAL': operator.eq,
+    'NOTEQUAL': operator.ne,
+    'LESSEQUAL': operator.le,
+    'GREATEREQUAL': operator.ge,
+}
+
+
+def format_values(values):
+    return " ".join(str(value) if not isinstance(value, bool) else str(value).capitalize() for value in values)
+
+
+def _constant(value):
+    def constant(it):
+        return value
+    return constant
+
+
+def _none(it):
+    return None
+
+
+def compile_expression(expr):
+    if not expr:
+        return _none
+
+    if isinstance(expr, (int, float, str, bool)):
+        return _constant(expr)
+
+    expr_type = expr.kind
+
+    if expr_type == NUMBER:
+        return _constant(int(expr.value))
+
+    elif expr_type == STRING or expr_type == BOOLEAN:
+        return _constant(expr.value)
+
+    elif expr_type == IDENTIFIER:
+        name = expr.name
+        slot = expr.slot
+        if slot >= 0:
+            def load_local(it):
+                value = it.frame[slot]
+                if value is UNSET:
+                    try:
+                        return it.variables[name]
+                    except KeyError:
+                        raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}") from None
+                return value
+            return load_local
+
+        def load(it):
+            try:
+                return it.variables[name]
+            except KeyError:
+                raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}") from None
+        return load
+
+    elif expr_type == BINARY_OP or expr_type == COMPARISON:
+        ops = BINARY_OPS if expr_type == BINARY_OP else COMPARISON_OPS
+        op = ops.get(expr.op)
+        if op is None:
+            return _none
+        left = compile_expression(expr.left)
+        right = compile_expression(expr.right)
+
+        def binary(it):
+            return op(left(it), right(it))
+        return binary
+
+    elif expr_type == UNARY_OP:
+        operand = compile_expression(expr.operand)
+        if expr.op == 'NEGATE':
+            def negate(it):
+                return -operand(it)
+            return negate
+        elif expr.op == 'NOT':
+            def logical_not(it):
+                return not operand(it)
+            return logical_not
+        return _none
+
+    elif expr_type == FUNCTION_CALL:
+        if expr.builtin:
+            return _compile_builtin_call(expr)
+        return _compile_call(expr)
+
+    elif expr_type == ARRAY:
+        elements = [compile_expression(element) for element in expr.elements]
+
+        def array_literal(it):
+            return make_array([element(it) for element in elements])
+        return array_literal
+
+    elif expr_type == INDEX:
+        value = compile_expression(expr.value)
+        index = compile_expression(expr.index)
+
+        def item(it):
+            return get_item(value(it), index(it))
+        return item
+
+    elif expr_type == SLICE:
+        value = compile_expression(expr.value)
+        start = compile_expression(expr.start)
+        stop = compile_expression(expr.stop)
+
+        def array_slice(it):
+            return get_slice(value(it), start(it), stop(it))
+        return array_slice
+
+    return _none
+
+
+def _compile_builtin_call(node):
+    function = BUILTINS[node.name]
+    args = [compile_expression(arg) for arg in node.args]
+
+    def builtin(it):
+        return function(*[arg(it) for arg in args])
+    return builtin
+
+
+def _compile_call(node):
+    func_name = node.name
+    args = [compile_expression(arg) for arg in node.args]
+
+    def call(it):
+        func = it.functions.get(func_name)
+        if func is None:
+            raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {func_name}")
+        values = [arg(it) for arg in args]
+        memo = it.memo
+        if memo is None or not func[3]:
+            return _invoke(it, func, values)
+        return _remember(it, memo, func, values)
+    return call
+
+
+def _compile_tail_call(node):
+    func_name = node.name
+    args = [compile_expression(arg) for arg in node.args]
+
+    def tail_call(it):
+        func = it.functions.get(func_name)
+        if func is None:
+            raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {func_name}")
+        it.tail_call = (func, [arg(it) for arg in args])
+        return TAIL_CALL_SIGNAL
+    return tail_call
+
+
+def _remember(it, memo, func, values):
+    key, value = memo.lookup(func[0], func[0].name, values)
+    if value is MISSING:
+        value = _invoke(it, func, values)
+        memo.store(func[0], key, value)
+    return value
+
+
+def _invoke(it, func, values):
+    # Tail calls run here in turn, each in a fresh frame, until one
+    # returns; a memoized one is called as usual.
+    old_frame = it.frame
+    try:
+        while True:
+            func_def, body, cost, _ = func
+            it.frame = new_frame(func_def, values)
+            budget = it.budget
+            if budget is not None and cost:
+                budget.countdown -= cost
+                if budget.countdown <= 0:
+                    budget.check(it)
+            signal = body(it)
+            if signal is not TAIL_CALL_SIGNAL:
+                break
+            func, values = it.tail_call
+            it.tail_call = None
+            if func[3] and it.memo is not None:
+                return _remember(it, it.memo, func, values)
+    finally:
+        it.frame = old_frame
+    if signal is RETURN_SIGNAL:
+        value = it.return_value
+        it.return_value = None
+        return value
+    return None
+
+
+def compile_block(statements):
+    compiled = [compile_statement(statement) for statement in statements]
+    if len(compiled) == 1:
+        return compiled[0]
+
+    def block(it):
+        for statement in compiled:
+            signal = statement(it)
+            if signal is not None:
+                return signal
+        return None
+    return block
+
+
+def _store(slot, name):
+    if slot >= 0:
+        def store_local(it, value):
+            it.frame[slot] = value
+        return store_local
+
+    def store(it, value):
+        it.variables[name] = value
+    return store
+
+
+def _compile_body(node):
+    if isinstance(node, list):
+        return compile_block(node)
+    return compile_statement(node)
+
+
+def compile_statement(node):
+    if not node:
+        return _none
+
+    node_type = node.kind
+
+    if node_type == PRINT:
+        values = [compile_expression(value) for value in node.values if value is not None]
+
+        def print_values(it):
+            output = format_values([value(it) for value in values])
+            it.output.write(output if '\n' in output else output + " ")
+        return print_values
+
+    elif node_type == ASSIGNMENT:
+        target = node.target
+        slot = node.slot
+        value = compile_expression(node.value)
+        if slot >= 0:
+            def assign_local(it):
+                it.frame[slot] = value(it)
+            return assign_local
+
+        def assign(it):
+            it.variables[target] = value(it)
+        return assign
+
+    elif node_type == INPUT:
+        store = _store(node.slot, node.target)
+
+        def read_input(it):
+            it.output.flush()
+            user_input = input("ಒಡ್ಡಿ/Enter input: ")
+            it.output.write("\n")
+            store(it, user_input)
+        return read_input
+
+    elif node_type == IF:
+        return _compile_if(node)
+
+    elif node_type == WHILE:
+        condition = compile_expression(node.condition)
+        body = _compile_body(node.body)
+        cost = body_cost(node.body)
+        reduction = node.plan.reduction if node.plan is not None else None
+
+        # A budgeted run iterates over the budget's iterations() instead.
+        def while_loop(it):
+            budget = it.budget
+            if reduction is not None and budget is None and it.specialize and run_reduction(reduction, it):
+                return None
+            for _ in repeat(None) if budget is None else budget.iterations(it, cost):
+                if not condition(it):
+                    break
+                signal = body(it)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
+        return while_loop
+
+    elif node_type == FOR:
+        store = _store(node.slot, node.var)
+        start = int(node.start)
+        end = int(node.end)
+        body = _compile_body(node.body)
+        cost = body_cost(node.body)
+        reduction = node.plan.reduction if node.plan is not None else None
+
+        def for_loop(it):
+            budget = it.budget
+            if reduction is not None and budget is None and it.specialize and run_reduction(reduction, it):
+                return None
+            for i in range(start, end) if budget is None else budget.iterations(it, cost, end, start):
+                store(it, i)
+                signal = body(it)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
+        return for_loop
+
+    elif node_type == FUNCTION_DEF:
+        name = node.name
+        func = (node, _compile_body(node.body), body_cost(node.body) if node.recursive else 0,
+                node.memoized)
+
+        def define(it):
+            it.functions[name] = func
+        return define
+
+    elif node_type == RETURN:
+        if node.tail:
+            return _compile_tail_call(node.value)
+        value = compile_expression(node.value)
+
+        def return_value(it):
+            it.return_value = value(it)
+            return RETURN_SIGNAL
+        return return_value
+
+    elif node_type == BREAK:
+        return _constant(BREAK_SIGNAL)
+
+    elif node_type == CONTINUE:
+        return _constant(CONTINUE_SIGNAL)
+
+    elif node_type == PASS:
+        return _none
+
+    elif node_type == TRY_EXCEPT:
+        try_body = _compile_body(node.try_body)
+        except_body = _compile_body(node.except_body)
+        finally_body = _compile_body(node.finally_body) if node.finally_body is not None else None
+
+        def try_except(it):
+            try:
+                return try_body(it)
+            except Exception:
+                return except_body(it)
+            finally:
+                if finally_body is not None:
+                    return_value = it.return_value
+                    finally_body(it)
+                    it.return_value = return_value
+        return try_except
+
+    elif node_type == IMPORT:
+        message = f"Imported module: {node.module}"
+    elif node_type == FROM_IMPORT:
+        message = f"Imported {node.name} from {node.module}"
+    elif node_type == CLASS:
+        message = f"Defined class: {node.name}"
+    else:
+        expression = compile_expression(node)
+
+        def expression_statement(it):
+            expression(it)
+        return expression_statement
+
+    message += " "
+
+    def announce(it):
+        it.output.write(message)
+    return announce
+
+
+def _compile_if(node):
+    branches = [(compile_expression(node.condition), _compile_body(node.body))]
+    for elif_clause in node.elif_clauses or ():
+        branches.append((compile_expression(elif_clause.condition), _compile_body(elif_clause.body)))
+    else_body = _compile_body(node.else_body) if node.else_body is not None else _none
+
+    if len(branches) == 1:
+        condition, body = branches[0]
+
+        def if_statement(it):
+            if condition(it):
+                return body(it)
+            return else_body(it)
+        return if_statement
+
+    def if_chain(it):
+        for condition, body in branches:
+            if condition(it):
+                return body(it)
+        return else_body(it)
+    return if_chain
+
+
+def compile_program(ast):
+    run = compile_block(ast or [])
+
+    def program(interpreter=None):
+        if interpreter is None:
+            interpreter = KannadaInterpreter()
+        if interpreter.budget is not None:
+            interpreter.budget.start()
+        try:
+            run(interpreter)
+        finally:
+            interpreter.output.flush()
+        return interpreter
+    return program
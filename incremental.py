@@ -0,0 +1,125 @@
+import bisect
+import contextlib
+import io
+
+from ast_nodes import Node, FUNCTION_DEF, TRY_EXCEPT
+from parser import Parser, parse
+from resolver import resolve
+
+
+# Incremental re-parse for the IDE. The last source (as lines) and its AST
+# are kept; on the next parse() the changed lines are found by comparing
+# against them, and only the top-level statements those lines fall in are
+# re-lexed and re-parsed, as a program of their own padded so that line
+# numbers match. The new statements are spliced between the untouched ones,
+# whose line numbers are shifted by the number of lines added or removed.
+# The spliced list is resolved again as a whole: what the resolver marks on
+# calls and functions (builtin, pure, recursive, ...) depends on the whole
+# program, not only the statements that changed.
+#
+# A full parse is done instead when there is no previous tree, the edit
+# touches the START or END line, the re-parsed region does not parse on its
+# own (e.g. an unbalanced block), or a function definition or try block is
+# involved: neither has an END of its own, so its body runs on to the end of
+# the enclosing block and an edit there can change the block structure.
+
+_START = "ಪ್ರಾರಂಭಿಸಿ"
+_END = "ಮುಗಿಯಿರಿ"
+_OPEN_ENDED = (FUNCTION_DEF, TRY_EXCEPT)
+
+
+def _shift_lines(value, delta):
+    if isinstance(value, list):
+        for item in value:
+            _shift_lines(item, delta)
+    elif isinstance(value, Node):
+        if value.line:
+            value.line += delta
+        for field in value.fields:
+            _shift_lines(getattr(value, field), delta)
+
+
+class IncrementalParser:
+    def __init__(self):
+        self.lines = None
+        self.ast = None
+        self.parser = None
+        # How the last parse() was done ("full", "incremental" or
+        # "unchanged") and how many top-level statements it parsed.
+        self.mode = None
+        self.reparsed = 0
+
+    def parse(self, code):
+        lines = code.split("\n")
+        if self.ast is not None and lines == self.lines:
+            self.mode = "unchanged"
+            self.reparsed = 0
+            return self.ast
+        ast = self._reparse(lines) if self.ast is not None else None
+        if ast is None:
+            ast = parse(code)
+            self.mode = "full"
+            self.reparsed = len(ast) if ast is not None else 0
+        else:
+            self.mode = "incremental"
+        self.lines = lines
+        self.ast = ast
+        return ast
+
+    def _reparse(self, lines):
+        old_lines, statements = self.lines, self.ast
+        old_count, new_count = len(old_lines), len(lines)
+        if not statements:
+            return None
+
+        # Lines are numbered from 1; old lines first..last changed.
+        limit = min(old_count, new_count)
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[old_count - 1 - suffix] == lines[new_count - 1 - suffix]:
+            suffix += 1
+        first, last = prefix + 1, old_count - suffix
+        if first <= 1 or last >= old_count:
+            return None
+        if last < first:
+            # Pure insertion between lines `last` and `first`.
+            first = last = max(last, 2)
+
+        starts = [node.line for node in statements]
+        first_index = max(bisect.bisect_right(starts, first) - 1, 0)
+        last_index = max(bisect.bisect_right(starts, last) - 1, 0)
+        replaced = statements[first_index:last_index + 1]
+        if any(node.kind in _OPEN_ENDED for node in replaced):
+            return None
+
+        delta = new_count - old_count
+        region_start = 2 if first_index == 0 else starts[first_index]
+        if last_index + 1 < len(statements):
+            region_end = starts[last_index + 1] - 1 + delta
+        else:
+            region_end = new_count - 1
+        fragment = self._parse_region(lines, region_start, region_end)
+        if fragment is None:
+            return None
+        if any(node.kind in _OPEN_ENDED or not region_start <= node.line <= region_end for node in fragment):
+            return None
+
+        following = statements[last_index + 1:]
+        if delta:
+            _shift_lines(following, delta)
+        self.reparsed = len(fragment)
+        return resolve(statements[:first_index] + fragment + following)
+
+    def _parse_region(self, lines, start, end):
+        if self.parser is None:
+            self.parser = Parser()
+        text = _START + "\n" * (start - 1) + "\n".join(lines[start - 1:end]) + "\n" + _END
+        # A region that does not parse alone falls back to a full parse,
+        # which reports the error; keep this attempt's messages quiet.
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                return self.parser.parse(text)
+        except Exception:
+            return None
@@ -1,4 +1,4 @@
-import ply.lex as lex
+import threading
 
 tokens = (
     'NUMBER', 'PLUS', 'MINUS', 'TIMES', 'DIVIDE', 'ID', 'NEWLINE', 'GREATER',
@@ -7,7 +7,7 @@ tokens = (
     'IF', 'ELSE', 'ELIF', 'WHILE', 'FOR', 'DEF', 'RETURN', 'CLASS', 'TRY',
     'EXCEPT', 'FINALLY', 'BREAK', 'CONTINUE', 'PASS', 'IN', 'RANGE', 'IMPORT',
     'FROM', 'AS', 'GLOBAL', 'NONLOCAL', 'START', 'END', 'INPUT', 'TRUE', 'FALSE',
-    'NOT', 'FLOOR_DIVIDE', 'POWER', 'MODULO', 'END_IF'
+    'NOT', 'FLOOR_DIVIDE', 'POWER', 'MODULO', 'END_IF', 'LBRACKET', 'RBRACKET'
 )
 
 # Operator tokens
@@ -27,6 +27,8 @@ t_LESSEQUAL = r'<='
 t_GREATEREQUAL = r'>='
 t_LPAREN = r'\('
 t_RPAREN = r'\)'
+t_LBRACKET = r'\['
+t_RBRACKET = r'\]'
 t_COLON = r':'
 t_COMMA = r','
 t_NOT = r'!'
@@ -194,9 +196,72 @@ def t_NONLOCAL(t):
 
 t_ID = r'[\u0C80-\u0CFFa-zA-Z_][\u0C80-\u0CFFa-zA-Z_0-9]*'
 
-lexer = lex.lex()
+# The lexer is built on first use rather than at import. With optimize=True
+# PLY loads the master regex from the frozen lextab.py instead of
+# re-validating every rule; run `python parser.py --tables` after editing a
+# token rule to regenerate it.
+_lexer = None
+_lexer_lock = threading.Lock()
+
+def get_lexer():
+    global _lexer
+    if _lexer is None:
+        with _lexer_lock:
+            if _lexer is None:
+                import ply.lex as lex
+                lexer = lex.lex(optimize=True, lextab='lextab')
+                if lexer.lextokens != set(tokens):
+                    lexer = lex.lex()
+                _lexer = lexer
+    return _lexer
+
+def write_lextab():
+    import os
+    import ply.lex as lex
+    lex.lex().writetab('lextab', os.path.dirname(os.path.abspath(__file__)))
+
+def __getattr__(name):
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Streaming mode: tokenize_stream() reads the source in chunks and yields
+# the same tokens, with the same lineno and lexpos, as lexing the whole text
+# at once. Each piece handed to the scanner ends just before the last run of
+# newlines read so far, so no token is split between pieces; a single-quoted
+# string (the only token that can span lines) still open at the end of a
+# piece is carried over into the next one.
+CHUNK_SIZE = 1 << 16
+
+def tokenize_stream(stream, chunk_size=CHUNK_SIZE):
+    from scanner import Scanner
+    scanner = Scanner()
+    buffer = ""
+    offset = 0
+    final = False
+    while not final:
+        chunk = stream.read(chunk_size)
+        final = not chunk
+        buffer += chunk
+        if final:
+            cut = len(buffer)
+        else:
+            cut = buffer.rfind("\n")
+            while cut > 0 and buffer[cut - 1] == "\n":
+                cut -= 1
+            if cut <= 0:
+                continue
+        yield from scanner.scan(buffer[:cut], offset, partial=not final)
+        cut = scanner.end
+        buffer = buffer[cut:]
+        offset += cut
+
+def tokenize_file(path, chunk_size=CHUNK_SIZE):
+    with open(path, encoding="utf-8") as stream:
+        yield from tokenize_stream(stream, chunk_size)
 
 def test_lexer(data):
+    lexer = get_lexer().clone()
     lexer.input(data)
     tokens_list = []
     while True:
@@ -208,6 +273,11 @@ def test_lexer(data):
     return tokens_list
 
 if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1:
+        for token in tokenize_file(sys.argv[1]):
+            print(token)
+        sys.exit()
     test_data = """
     ಪ್ರಾರಂಭಿಸಿ
         a = 5
@@ -218,4 +288,4 @@ if __name__ == "__main__":
     """
     tokens = test_lexer(test_data)
     for token in tokens:
-        print(token)
\ No newline at end of file
+        print(token)
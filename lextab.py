@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AS', 'ASSIGN', 'BREAK', 'CLASS', 'COLON', 'COMMA', 'CONTINUE', 'DEF', 'DIVIDE', 'ELIF', 'ELSE', 'END', 'END_IF', 'EQUAL', 'EXCEPT', 'FALSE', 'FINALLY', 'FLOOR_DIVIDE', 'FOR', 'FROM', 'GLOBAL', 'GREATER', 'GREATEREQUAL', 'ID', 'IF', 'IMPORT', 'IN', 'INPUT', 'LBRACKET', 'LESS', 'LESSEQUAL', 'LPAREN', 'MINUS', 'MODULO', 'NEWLINE', 'NONLOCAL', 'NOT', 'NOTEQUAL', 'NUMBER', 'PASS', 'PLUS', 'POWER', 'PRINT', 'RANGE', 'RBRACKET', 'RETURN', 'RPAREN', 'START', 'STRING', 'TIMES', 'TRUE', 'TRY', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>\\d+)|(?P<t_NEWLINE>\\n+)|(?P<t_START>ಪ್ರಾರಂಭಿಸಿ)|(?P<t_END>ಮುಗಿಯಿರಿ)|(?P<t_END_IF>ಮುಗಿಸು_ನಂತರ)|(?P<t_PRINT>ಮುದ್ರಿಸಿ|ಮುದ್ರಣ)|(?P<t_INPUT>ಆಗು)|(?P<t_TRUE>true)|(?P<t_FALSE>false)|(?P<t_IF>ನಂತರ)|(?P<t_ELSE>ಇಲ್ಲದಿದ್ದರೆ)|(?P<t_ELIF>ಇಲ್ಲದಿದ್ದರೆನಂತರ)|(?P<t_WHILE>ಯಾವಾಗ)|(?P<t_FOR>ನಿಮಿತ್ತ)|(?P<t_DEF>ನಿರ್ಧರಿಸು|ಕಾರ್ಯ)|(?P<t_RETURN>ಹಿಂತಿರುಗಿಸು)|(?P<t_CLASS>ವರ್ಗ)|(?P<t_TRY>ಪ್ರಯತ್ನಿಸು)|(?P<t_EXCEPT>ಹೊರಹಾಕು)|(?P<t_FINALLY>ಕೊನೆಗೂ)|(?P<t_BREAK>ಮುರಿದುಬಿಡು)|(?P<t_CONTINUE>ಮುಂದುವರಿಸು)|(?P<t_PASS>ಹೋದರೂ)|(?P<t_IN>ಒಳಗೆ)|(?P<t_RANGE>ವ್ಯಾಪ್ತಿ)|(?P<t_IMPORT>ಆಮದು)|(?P<t_FROM>ಇಂದ)|(?P<t_AS>ಆಗಿ)|(?P<t_GLOBAL>ಜಾಗತಿಕ)|(?P<t_NONLOCAL>ಸ್ಥಳೀಯವಲ್ಲದ)|(?P<t_ID>[\\u0C80-\\u0CFFa-zA-Z_][\\u0C80-\\u0CFFa-zA-Z_0-9]*)|(?P<t_STRING>\\".*?\\"|\\\'[^\\\']*\\\')|(?P<t_POWER>\\*\\*)|(?P<t_PLUS>\\+)|(?P<t_TIMES>\\*)|(?P<t_FLOOR_DIVIDE>//)|(?P<t_EQUAL>==)|(?P<t_NOTEQUAL>!=)|(?P<t_LESSEQUAL><=)|(?P<t_GREATEREQUAL>>=)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACKET>\\[)|(?P<t_RBRACKET>\\])|(?P<t_MINUS>-)|(?P<t_DIVIDE>/)|(?P<t_MODULO>%)|(?P<t_ASSIGN>=)|(?P<t_GREATER>>)|(?P<t_LESS><)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_NOT>!)', [None, ('t_NUMBER', 'NUMBER'), ('t_NEWLINE', 'NEWLINE'), ('t_START', 'START'), ('t_END', 'END'), ('t_END_IF', 'END_IF'), ('t_PRINT', 'PRINT'), ('t_INPUT', 'INPUT'), ('t_TRUE', 'TRUE'), ('t_FALSE', 'FALSE'), ('t_IF', 'IF'), ('t_ELSE', 'ELSE'), ('t_ELIF', 'ELIF'), ('t_WHILE', 'WHILE'), ('t_FOR', 'FOR'), ('t_DEF', 'DEF'), ('t_RETURN', 'RETURN'), ('t_CLASS', 'CLASS'), ('t_TRY', 'TRY'), ('t_EXCEPT', 'EXCEPT'), ('t_FINALLY', 'FINALLY'), ('t_BREAK', 'BREAK'), ('t_CONTINUE', 'CONTINUE'), ('t_PASS', 'PASS'), ('t_IN', 'IN'), ('t_RANGE', 'RANGE'), ('t_IMPORT', 'IMPORT'), ('t_FROM', 'FROM'), ('t_AS', 'AS'), ('t_GLOBAL', 'GLOBAL'), ('t_NONLOCAL', 'NONLOCAL'), (None, 'ID'), (None, 'STRING'), (None, 'POWER'), (None, 'PLUS'), (None, 'TIMES'), (None, 'FLOOR_DIVIDE'), (None, 'EQUAL'), (None, 'NOTEQUAL'), (None, 'LESSEQUAL'), (None, 'GREATEREQUAL'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACKET'), (None, 'RBRACKET'), (None, 'MINUS'), (None, 'DIVIDE'), (None, 'MODULO'), (None, 'ASSIGN'), (None, 'GREATER'), (None, 'LESS'), (None, 'COLON'), (None, 'COMMA'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
@@ -0,0 +1,280 @@
+from ast_nodes import (
+    Node, ASSIGNMENT, FOR, FUNCTION_CALL, NUMBER, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP,
+)
+
+
+# Loop specialization. The resolver gives every for and while loop whose
+# body only assigns variables, and which calls no KA function, a LoopPlan
+# (`plan`). Tree mode runs such a loop on closures compiled from it once
+# (compiler.py) instead of dispatching each statement. When the loop also
+# matches a counting pattern, the plan has a Reduction, which tree and
+# closure mode try first:
+#
+#   for (i in range(a, b))         while (i < n)       (or <=; > and >= with
+#       s = s + t                      s = s + t        a falling counter)
+#                                      i = i + c
+#
+# with any number of distinct accumulators `s`, a literal step c, and t a
+# chain of terms added or subtracted (s = s + a - b ...), each either an
+# integer polynomial in i of degree at most 2 or a call-free expression of
+# names the loop does not assign. run_reduction() then computes the values
+# the loop would leave in closed form, from power sums of the counter,
+# instead of iterating. It does so only where the closed form is exact: an
+# integer counter and limit, and integer accumulators and terms, or a string
+# term added to a string. With anything else (a float or array, an unset
+# variable, an error) it declines and the loop runs as usual.
+#
+# Loops under an execution budget are never collapsed, so that they are
+# charged as before.
+
+
+_COUNTING = ('LESS', 'LESSEQUAL', 'GREATER', 'GREATEREQUAL')
+
+
+class Accumulation:
+    __slots__ = ('target', 'slot', 'load', 'polynomial', 'terms')
+
+    def __init__(self, assignment, load, polynomial, terms):
+        self.target = assignment.target
+        self.slot = assignment.slot
+        self.load = load
+        # The polynomial terms summed as coefficients, and (sign, expression)
+        # for each invariant term.
+        self.polynomial = polynomial
+        self.terms = terms
+
+
+class Reduction:
+    __slots__ = ('accumulations', 'counter', 'slot', 'start', 'stop', 'load', 'limit', 'step', 'inclusive')
+
+    def __init__(self, accumulations, counter, slot, step=1, start=0, stop=0, load=None, limit=None,
+                 inclusive=False):
+        self.accumulations = accumulations
+        self.counter = counter
+        self.slot = slot
+        self.step = step
+        # A for loop's constant range, or a while loop's counter and limit.
+        self.start = start
+        self.stop = stop
+        self.load = load
+        self.limit = limit
+        self.inclusive = inclusive
+
+
+class LoopPlan:
+    __slots__ = ('condition', 'assignments', 'reduction', 'compiled')
+
+    def __init__(self, condition, assignments, reduction=None):
+        self.condition = condition
+        self.assignments = assignments
+        self.reduction = reduction
+        self.compiled = None
+
+    def closures(self):
+        # The condition (None for a for loop) and (slot, name, value) for
+        # each assignment, compiled on first use.
+        if self.compiled is None:
+            from compiler import compile_expression
+            condition = compile_expression(self.condition) if self.condition is not None else None
+            steps = tuple((assignment.slot, assignment.target, compile_expression(assignment.value))
+                          for assignment in self.assignments)
+            self.compiled = (condition, steps)
+        return self.compiled
+
+
+def plan_loop(node, assigned):
+    # `assigned`: the names the loop body assigns.
+    body = node.body if isinstance(node.body, list) else [node.body]
+    if not body or not all(isinstance(statement, Node) and statement.kind == ASSIGNMENT for statement in body):
+        return None
+    condition = node.condition if node.kind != FOR else None
+    if _calls_function(body) or _calls_function(condition):
+        return None
+    return LoopPlan(condition, tuple(body), _reduction(node, body, assigned))
+
+
+def _reduction(node, body, assigned):
+    if node.kind == FOR:
+        counter = node.var
+        assigned = set(assigned)
+        assigned.add(counter)
+        accumulations = _accumulations(body, counter, assigned)
+        if not accumulations:
+            return None
+        return Reduction(accumulations, counter, node.slot, start=int(node.start), stop=int(node.end))
+
+    condition = node.condition
+    if (condition.kind != COMPARISON or condition.op not in _COUNTING or not _is_name(condition.left) or
+            _has_call(condition.right) or _reads(condition.right, assigned)):
+        return None
+    counter = condition.left.name
+    update = body[-1]
+    step = _step(update, counter)
+    if step is None or (step > 0) != (condition.op in ('LESS', 'LESSEQUAL')):
+        return None
+    accumulations = _accumulations(body[:-1], counter, assigned)
+    if accumulations is None:
+        return None
+    return Reduction(accumulations, counter, update.slot, step, load=condition.left, limit=condition.right,
+                     inclusive=condition.op in ('LESSEQUAL', 'GREATEREQUAL'))
+
+
+def _is_name(expr, name=None):
+    return isinstance(expr, Node) and expr.kind == IDENTIFIER and (name is None or expr.name == name)
+
+
+def _step(update, counter):
+    value = update.value
+    if (update.target != counter or value.kind != BINARY_OP or value.op not in ('+', '-') or
+            not _is_name(value.left, counter) or value.right.kind != NUMBER):
+        return None
+    step = int(value.right.value)
+    return (step if value.op == '+' else -step) or None
+
+
+def _accumulations(statements, counter, assigned):
+    accumulations = []
+    targets = {counter}
+    for statement in statements:
+        parts = []
+        value = statement.value
+        while isinstance(value, Node) and value.kind == BINARY_OP and value.op in ('+', '-'):
+            parts.append((1 if value.op == '+' else -1, value.right))
+            value = value.left
+        if statement.target in targets or not parts or not _is_name(value, statement.target):
+            return None
+        targets.add(statement.target)
+        polynomial = None
+        terms = []
+        for sign, part in reversed(parts):
+            coefficients = _polynomial(part, counter)
+            if coefficients is None:
+                if _has_call(part) or _reads(part, assigned):
+                    return None
+                terms.append((sign, part))
+            else:
+                polynomial = tuple(a + sign * c for a, c in zip(polynomial or (0, 0, 0), coefficients))
+        accumulations.append(Accumulation(statement, value, polynomial, tuple(terms)))
+    return accumulations
+
+
+def _polynomial(expr, counter):
+    # Coefficients (c0, c1, c2) of `expr` as an integer polynomial in the
+    # counter, or None.
+    if not isinstance(expr, Node):
+        return None
+    kind = expr.kind
+    if kind == NUMBER:
+        return (int(expr.value), 0, 0)
+    if kind == IDENTIFIER:
+        return (0, 1, 0) if expr.name == counter else None
+    if kind == UNARY_OP and expr.op == 'NEGATE':
+        operand = _polynomial(expr.operand, counter)
+        return None if operand is None else tuple(-c for c in operand)
+    if kind == BINARY_OP and expr.op in ('+', '-', '*'):
+        left = _polynomial(expr.left, counter)
+        right = _polynomial(expr.right, counter)
+        if left is None or right is None:
+            return None
+        if expr.op == '+':
+            return tuple(a + b for a, b in zip(left, right))
+        if expr.op == '-':
+            return tuple(a - b for a, b in zip(left, right))
+        product = [0] * 5
+        for i, a in enumerate(left):
+            for j, b in enumerate(right):
+                product[i + j] += a * b
+        return None if product[3] or product[4] else tuple(product[:3])
+    return None
+
+
+def _has_call(value):
+    if isinstance(value, list):
+        return any(_has_call(item) for item in value)
+    if isinstance(value, Node):
+        return value.kind == FUNCTION_CALL or any(_has_call(getattr(value, field)) for field in value.fields)
+    return False
+
+
+def _calls_function(value):
+    # Whether `value` calls a KA function; builtins do not count.
+    if isinstance(value, list):
+        return any(_calls_function(item) for item in value)
+    if isinstance(value, Node):
+        if value.kind == FUNCTION_CALL and not value.builtin:
+            return True
+        return any(_calls_function(getattr(value, field)) for field in value.fields)
+    return False
+
+
+def _reads(value, names):
+    if isinstance(value, list):
+        return any(_reads(item, names) for item in value)
+    if isinstance(value, Node):
+        if value.kind == IDENTIFIER:
+            return value.name in names
+        return any(_reads(getattr(value, field), names) for field in value.fields)
+    return False
+
+
+def iterations(first, limit, step, inclusive):
+    # How many times `while (i < limit)` (<=, >, >=) runs from i = first.
+    distance = limit - first if step > 0 else first - limit
+    stride = abs(step)
+    if inclusive:
+        return distance // stride + 1 if distance >= 0 else 0
+    return (distance + stride - 1) // stride if distance > 0 else 0
+
+
+def power_sums(first, step, count):
+    # Sums of x**0, x**1 and x**2 over x = first, first + step, ... (count
+    # values).
+    k1 = count * (count - 1) // 2
+    k2 = (count - 1) * count * (2 * count - 1) // 6
+    return (count,
+            count * first + step * k1,
+            count * first * first + 2 * first * step * k1 + step * step * k2)
+
+
+def run_reduction(reduction, it):
+    # Leaves the variables as running the loop would and returns True, or
+    # returns False having changed nothing.
+    evaluate = it.evaluate_expression
+    try:
+        if reduction.limit is None:
+            first = reduction.start
+            count = max(reduction.stop - first, 0)
+        else:
+            first = evaluate(reduction.load)
+            limit = evaluate(reduction.limit)
+            if type(first) is not int or type(limit) is not int:
+                return False
+            count = iterations(first, limit, reduction.step, reduction.inclusive)
+        if not count:
+            return True
+        sums = None
+        values = []
+        for accumulation in reduction.accumulations:
+            value = evaluate(accumulation.load)
+            terms = [(sign, evaluate(term)) for sign, term in accumulation.terms]
+            if (accumulation.polynomial is None and len(terms) == 1 and terms[0][0] > 0 and
+                    type(terms[0][1]) is str and type(value) is str):
+                values.append(value + terms[0][1] * count)
+                continue
+            if type(value) is not int or any(type(term) is not int for _, term in terms):
+                return False
+            total = sum(sign * term for sign, term in terms) * count
+            if accumulation.polynomial is not None:
+                if sums is None:
+                    sums = power_sums(first, reduction.step, count)
+                total += sum(c * s for c, s in zip(accumulation.polynomial, sums))
+            values.append(value + total)
+    except Exception:
+        return False
+    for accumulation, value in zip(reduction.accumulations, values):
+        it.store(accumulation.slot, accumulation.target, value)
+    if reduction.limit is None:
+        it.store(reduction.slot, reduction.counter, first + count - 1)
+    else:
+        it.store(reduction.slot, reduction.counter, first + reduction.step * count)
+    return True
@@ -1,9 +1,31 @@
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, font, scrolledtext, simpledialog
-from parser import parse
+from incremental import IncrementalParser
+from ast_nodes import (
+    PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS,
+    TRY_EXCEPT, IMPORT, FROM_IMPORT, CLASS, NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP,
+    ARRAY, INDEX, SLICE,
+)
+from signals import RETURN_SIGNAL, BREAK_SIGNAL, CONTINUE_SIGNAL, TAIL_CALL_SIGNAL
+from resolver import new_frame, UNSET
+from arrays import BUILTINS, make_array, get_item, get_slice
 import os
 
 
+# Output is drained from the worker's queue this often, and for at most this
+# long per tick, so a program printing in a tight loop cannot starve the UI.
+OUTPUT_POLL_MS = 50
+OUTPUT_DRAIN_SECONDS = 0.02
+
+
+class ProgramStopped(BaseException):
+    # Not an Exception, so a KA try block cannot swallow it.
+    pass
+
+
 class KannadaProgrammingIDE:
     def __init__(self, root):
         self.root = root
@@ -11,6 +33,10 @@ class KannadaProgrammingIDE:
         self.root.geometry("1000x800")
         self.kannada_font = font.Font(family="Noto Sans Kannada", size=12)
         self.current_file = None
+        self.incremental = IncrementalParser()
+        self.output_queue = queue.Queue()
+        self.stop_event = threading.Event()
+        self.worker = None
         self.create_menu()
         self.create_toolbar()
         self.create_editor_area()
@@ -36,14 +62,17 @@ class KannadaProgrammingIDE:
         menubar.add_cascade(label="ಸಂಪಾದನೆ / Edit", menu=edit_menu)
         run_menu = tk.Menu(menubar, tearoff=0)
         run_menu.add_command(label="ಚಲಾಯಿಸು / Run", command=self.run_code)
+        run_menu.add_command(label="ನಿಲ್ಲಿಸು / Stop", command=self.stop_code)
         menubar.add_cascade(label="ಚಲಾಯಿಸು / Run", menu=run_menu)
         self.root.config(menu=menubar)
 
     def create_toolbar(self):
         self.toolbar = tk.Frame(self.root, bd=1, relief=tk.RAISED)
         self.toolbar.pack(side=tk.TOP, fill=tk.X)
-        run_button = tk.Button(self.toolbar, text="ಚಲಾಯಿಸು / Run", command=self.run_code)
-        run_button.pack(side=tk.LEFT, padx=5, pady=2)
+        self.run_button = tk.Button(self.toolbar, text="ಚಲಾಯಿಸು / Run", command=self.run_code)
+        self.run_button.pack(side=tk.LEFT, padx=5, pady=2)
+        self.stop_button = tk.Button(self.toolbar, text="ನಿಲ್ಲಿಸು / Stop", command=self.stop_code, state=tk.DISABLED)
+        self.stop_button.pack(side=tk.LEFT, padx=5, pady=2)
 
     def create_editor_area(self):
         self.code_editor = scrolledtext.ScrolledText(self.root, font=self.kannada_font, wrap=tk.WORD, height=20)
@@ -105,31 +134,45 @@ class KannadaProgrammingIDE:
             self.status_bar.config(text=f"ಉಳಿಸಲಾಗಿದೆ: {os.path.basename(file_path)}")
 
     def run_code(self):
+        if self.worker is not None:
+            return
         code = self.code_editor.get(1.0, tk.END).strip()
         print(f"Input code:\n{code}")
         self.output_area.configure(state="normal")
         self.output_area.delete(1.0, tk.END)
+        self.output_area.configure(state="disabled")
 
+        output_queue = self.output_queue
+        stop_event = self.stop_event
+
+        # Runs on the worker thread: ask the Tk thread for the dialog and
+        # wait for its answer.
         def gui_input(prompt):
-            value = simpledialog.askstring("ಒಡ್ಡಿ/Input", prompt, parent=self.root) or ""
-            return value
+            reply = queue.Queue(maxsize=1)
+            output_queue.put(("input", (prompt, reply)))
+            return reply.get()
 
         class KannadaInterpreter:
-            def __init__(self, output_area, root):
+            def __init__(self):
                 self.variables = {}
                 self.functions = {}
+                self.frame = None
+                self.return_value = None
+                self.tail_call = None
                 self.call_stack = []
-                self.output_area = output_area
-                self.root = root
+
+            def write(self, text):
+                output_queue.put(("output", text))
 
             def evaluate(self, node):
                 if isinstance(node, list):
-                    result = None
                     for statement in node:
-                        result = self.evaluate_statement(statement)
-                        if result and result.get('type') == 'return':
-                            return result
-                    return result
+                        if stop_event.is_set():
+                            raise ProgramStopped()
+                        signal = self.evaluate_statement(statement)
+                        if signal is not None:
+                            return signal
+                    return None
                 else:
                     return self.evaluate_statement(node)
 
@@ -137,113 +180,110 @@ class KannadaProgrammingIDE:
                 if not node:
                     return None
 
-                node_type = node.get('type', '')
+                node_type = node.kind
 
-                if node_type == 'print':
-                    values = [self.evaluate_expression(value) for value in node['values']]
+                if node_type == PRINT:
+                    values = [self.evaluate_expression(value) for value in node.values]
                     # Preserve 'True'/'False' for booleans
                     output = " ".join(
                         str(value) if not isinstance(value, bool) else str(value).capitalize() for value in values)
-                    self.output_area.configure(state="normal")
-                    if '\n' in output:
-                        self.output_area.insert(tk.END, output)
-                    else:
-                        self.output_area.insert(tk.END, output + " ")
-                    self.output_area.configure(state="disabled")
-                    self.output_area.see(tk.END)
-                    self.root.update()
+                    self.write(output if '\n' in output else output + " ")
                     return None
 
-                elif node_type == 'assignment':
-                    value = self.evaluate_expression(node['value'])
-                    self.variables[node['target']] = value
+                elif node_type == ASSIGNMENT:
+                    value = self.evaluate_expression(node.value)
+                    self.store(node.slot, node.target, value)
                     return None
 
-                elif node_type == 'input':
+                elif node_type == INPUT:
                     user_input = gui_input("ಒಡ್ಡಿ/Enter input:")
-                    self.variables[node['target']] = user_input
+                    self.store(node.slot, node.target, user_input)
                     return None
 
-                elif node_type == 'if':
-                    condition = self.evaluate_expression(node['condition'])
+                elif node_type == IF:
+                    condition = self.evaluate_expression(node.condition)
                     if condition:
-                        return self.evaluate(node['body'])
-                    elif 'else_body' in node:
-                        return self.evaluate(node['else_body'])
-
-                elif node_type == 'while':
-                    condition = self.evaluate_expression(node['condition'])
-                    result = None
-                    while condition:
-                        result = self.evaluate(node['body'])
-                        if result and (result.get('type') == 'return' or
-                                       result.get('type') == 'break'):
-                            break
-                        condition = self.evaluate_expression(node['condition'])
-                    return None if result and result.get('type') == 'break' else result
-
-                elif node_type == 'for':
-                    var_name = node['var']
-                    start = int(node['start'])
-                    end = int(node['end'])
-                    result = None
+                        return self.evaluate(node.body)
+                    elif node.else_body is not None:
+                        return self.evaluate(node.else_body)
+
+                elif node_type == WHILE:
+                    while self.evaluate_expression(node.condition):
+                        signal = self.evaluate(node.body)
+                        if signal is not None and signal is not CONTINUE_SIGNAL:
+                            if signal is BREAK_SIGNAL:
+                                break
+                            return signal
+                    return None
+
+                elif node_type == FOR:
+                    var_name = node.var
+                    start = int(node.start)
+                    end = int(node.end)
                     for i in range(start, end):
-                        self.variables[var_name] = i
-                        result = self.evaluate(node['body'])
-                        if result and (result.get('type') == 'return' or
-                                       result.get('type') == 'break'):
-                            break
-                    return None if result and result.get('type') == 'break' else result
-
-                elif node_type == 'function_def':
-                    self.functions[node['name']] = node
+                        self.store(node.slot, var_name, i)
+                        signal = self.evaluate(node.body)
+                        if signal is not None and signal is not CONTINUE_SIGNAL:
+                            if signal is BREAK_SIGNAL:
+                                break
+                            return signal
+                    return None
+
+                elif node_type == FUNCTION_DEF:
+                    self.functions[node.name] = node
                     return None
 
-                elif node_type == 'function_call':
-                    return self.call_function(node)
+                elif node_type == FUNCTION_CALL:
+                    self.call_function(node)
+                    return None
 
-                elif node_type == 'return':
-                    return {'type': 'return', 'value': self.evaluate_expression(node['value'])}
+                elif node_type == RETURN:
+                    if node.tail:
+                        call = node.value
+                        func_def = self.functions.get(call.name)
+                        if func_def is None:
+                            raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {call.name}")
+                        self.tail_call = (func_def, [self.evaluate_expression(arg) for arg in call.args])
+                        return TAIL_CALL_SIGNAL
+                    self.return_value = self.evaluate_expression(node.value)
+                    return RETURN_SIGNAL
 
-                elif node_type == 'break':
-                    return {'type': 'break'}
+                elif node_type == BREAK:
+                    return BREAK_SIGNAL
 
-                elif node_type == 'continue':
-                    return {'type': 'continue'}
+                elif node_type == CONTINUE:
+                    return CONTINUE_SIGNAL
 
-                elif node_type == 'pass':
+                elif node_type == PASS:
                     return None
 
-                elif node_type == 'try_except':
+                elif node_type == TRY_EXCEPT:
                     try:
-                        return self.evaluate(node['try_body'])
+                        return self.evaluate(node.try_body)
                     except Exception as e:
-                        return self.evaluate(node['except_body'])
+                        return self.evaluate(node.except_body)
                     finally:
-                        if 'finally_body' in node:
-                            self.evaluate(node['finally_body'])
+                        if node.finally_body is not None:
+                            return_value = self.return_value
+                            self.evaluate(node.finally_body)
+                            self.return_value = return_value
 
-                elif node_type == 'import':
-                    self.output_area.configure(state="normal")
-                    self.output_area.insert(tk.END, f"Imported module: {node['module']} ")
-                    self.output_area.configure(state="disabled")
+                elif node_type == IMPORT:
+                    self.write(f"Imported module: {node.module} ")
                     return None
 
-                elif node_type == 'from_import':
-                    self.output_area.configure(state="normal")
-                    self.output_area.insert(tk.END, f"Imported {node['name']} from {node['module']} ")
-                    self.output_area.configure(state="disabled")
+                elif node_type == FROM_IMPORT:
+                    self.write(f"Imported {node.name} from {node.module} ")
                     return None
 
-                elif node_type == 'class':
-                    class_name = node['name']
-                    self.output_area.configure(state="normal")
-                    self.output_area.insert(tk.END, f"Defined class: {class_name} ")
-                    self.output_area.configure(state="disabled")
+                elif node_type == CLASS:
+                    class_name = node.name
+                    self.write(f"Defined class: {class_name} ")
                     return None
 
                 else:
-                    return self.evaluate_expression(node)
+                    self.evaluate_expression(node)
+                    return None
 
             def evaluate_expression(self, expr):
                 if not expr:
@@ -252,27 +292,31 @@ class KannadaProgrammingIDE:
                 if isinstance(expr, (int, float, str, bool)):
                     return expr
 
-                expr_type = expr.get('type', '')
+                expr_type = expr.kind
 
-                if expr_type == 'number':
-                    return int(expr['value'])
+                if expr_type == NUMBER:
+                    return int(expr.value)
 
-                elif expr_type == 'string':
-                    return expr['value']
+                elif expr_type == STRING:
+                    return expr.value
 
-                elif expr_type == 'boolean':
-                    return expr['value']
+                elif expr_type == BOOLEAN:
+                    return expr.value
 
-                elif expr_type == 'identifier':
-                    name = expr['name']
+                elif expr_type == IDENTIFIER:
+                    name = expr.name
+                    if expr.slot >= 0:
+                        value = self.frame[expr.slot]
+                        if value is not UNSET:
+                            return value
                     if name in self.variables:
                         return self.variables[name]
                     raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}")
 
-                elif expr_type == 'binary_op':
-                    left = self.evaluate_expression(expr['left'])
-                    right = self.evaluate_expression(expr['right'])
-                    op = expr['op']
+                elif expr_type == BINARY_OP:
+                    left = self.evaluate_expression(expr.left)
+                    right = self.evaluate_expression(expr.right)
+                    op = expr.op
                     if op == '+':
                         return left + right
                     elif op == '-':
@@ -282,16 +326,16 @@ class KannadaProgrammingIDE:
                     elif op == '/':
                         return left / right
 
-                elif expr_type == 'unary_op':
-                    operand = self.evaluate_expression(expr['operand'])
-                    op = expr['op']
+                elif expr_type == UNARY_OP:
+                    operand = self.evaluate_expression(expr.operand)
+                    op = expr.op
                     if op == 'NEGATE':
                         return -operand
 
-                elif expr_type == 'comparison':
-                    left = self.evaluate_expression(expr['left'])
-                    right = self.evaluate_expression(expr['right'])
-                    op = expr['op']
+                elif expr_type == COMPARISON:
+                    left = self.evaluate_expression(expr.left)
+                    right = self.evaluate_expression(expr.right)
+                    op = expr.op
                     if op == 'LESS':
                         return left < right
                     elif op == 'GREATER':
@@ -305,45 +349,118 @@ class KannadaProgrammingIDE:
                     elif op == 'GREATEREQUAL':
                         return left >= right
 
-                elif expr_type == 'function_call':
+                elif expr_type == FUNCTION_CALL:
                     return self.call_function(expr)
 
+                elif expr_type == ARRAY:
+                    return make_array([self.evaluate_expression(element) for element in expr.elements])
+
+                elif expr_type == INDEX:
+                    return get_item(self.evaluate_expression(expr.value), self.evaluate_expression(expr.index))
+
+                elif expr_type == SLICE:
+                    return get_slice(self.evaluate_expression(expr.value), self.evaluate_expression(expr.start),
+                                     self.evaluate_expression(expr.stop))
+
                 return None
 
+            def store(self, slot, name, value):
+                if slot >= 0:
+                    self.frame[slot] = value
+                else:
+                    self.variables[name] = value
+
             def call_function(self, node):
-                func_name = node['name']
+                func_name = node.name
+                if node.builtin:
+                    return BUILTINS[func_name](*[self.evaluate_expression(arg) for arg in node.args])
                 if func_name in self.functions:
                     func_def = self.functions[func_name]
-                    args = [self.evaluate_expression(arg) for arg in node['args']]
-                    old_vars = self.variables.copy()
-                    for i, param in enumerate(func_def['params']):
-                        if i < len(args):
-                            self.variables[param] = args[i]
-                        else:
-                            self.variables[param] = None
-                    result = self.evaluate(func_def['body'])
-                    self.variables = old_vars
-                    if result and result.get('type') == 'return':
-                        return result['value']
+                    args = [self.evaluate_expression(arg) for arg in node.args]
+                    old_frame = self.frame
+                    try:
+                        # Tail calls run here in turn, each in a fresh frame.
+                        while True:
+                            self.frame = new_frame(func_def, args)
+                            result = self.evaluate(func_def.body)
+                            if result is not TAIL_CALL_SIGNAL:
+                                break
+                            func_def, args = self.tail_call
+                            self.tail_call = None
+                    finally:
+                        self.frame = old_frame
+                    if result is RETURN_SIGNAL:
+                        value = self.return_value
+                        self.return_value = None
+                        return value
                     return None
                 raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {func_name}")
 
-        try:
-            ast = parse(code)
-            if ast is None:
-                self.output_area.insert(tk.END, "ದೋಷ/Error: Parsing failed due to syntax error\n")
-            else:
-                interpreter = KannadaInterpreter(self.output_area, self.root)
-                interpreter.evaluate(ast)
-                self.output_area.configure(state="normal")
-                self.output_area.insert(tk.END, "\nಯಶಸ್ವಿಯಾಗಿ ಕಾರ್ಯಗತಗೊಂಡಿದೆ/Successfully executed\n")
-                self.output_area.configure(state="disabled")
-        except Exception as e:
-            self.output_area.insert(tk.END, f"ದೋಷ/Error: {str(e)}\n")
+        ast = self.incremental.parse(code)
+        self.status_bar.config(text=f"ಪಾರ್ಸ್/Parse: {self.incremental.mode}, {self.incremental.reparsed} statements")
+        if ast is None:
+            self.append_output("ದೋಷ/Error: Parsing failed due to syntax error\n")
+            print(f"Output:\n{self.output_area.get(1.0, tk.END).strip()}")
+            return
+
+        def work():
+            try:
+                KannadaInterpreter().evaluate(ast)
+                message = "\nಯಶಸ್ವಿಯಾಗಿ ಕಾರ್ಯಗತಗೊಂಡಿದೆ/Successfully executed\n"
+            except ProgramStopped:
+                message = "\nನಿಲ್ಲಿಸಲಾಗಿದೆ/Stopped\n"
+            except Exception as e:
+                message = f"ದೋಷ/Error: {str(e)}\n"
+            output_queue.put(("done", message))
+
+        stop_event.clear()
+        self.run_button.config(state=tk.DISABLED)
+        self.stop_button.config(state=tk.NORMAL)
+        self.worker = threading.Thread(target=work, daemon=True)
+        self.worker.start()
+        self.root.after(OUTPUT_POLL_MS, self.drain_output)
+
+    def stop_code(self):
+        if self.worker is not None:
+            self.stop_event.set()
+
+    def append_output(self, text):
+        if text:
+            self.output_area.configure(state="normal")
+            self.output_area.insert(tk.END, text)
             self.output_area.configure(state="disabled")
-
-        print(f"Output:\n{self.output_area.get(1.0, tk.END).strip()}")
-
+            self.output_area.see(tk.END)
+
+    def drain_output(self):
+        # Everything queued since the last tick goes into the text widget in
+        # one insert; input requests are answered here on the Tk thread.
+        deadline = time.perf_counter() + OUTPUT_DRAIN_SECONDS
+        pieces = []
+        finished = None
+        while time.perf_counter() < deadline:
+            try:
+                kind, payload = self.output_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "output":
+                pieces.append(payload)
+            elif kind == "input":
+                self.append_output("".join(pieces))
+                pieces = []
+                prompt, reply = payload
+                reply.put(simpledialog.askstring("ಒಡ್ಡಿ/Input", prompt, parent=self.root) or "")
+            else:
+                finished = payload
+                break
+        self.append_output("".join(pieces))
+        if finished is None:
+            self.root.after(OUTPUT_POLL_MS, self.drain_output)
+        else:
+            self.append_output(finished)
+            self.worker = None
+            self.run_button.config(state=tk.NORMAL)
+            self.stop_button.config(state=tk.DISABLED)
+            print(f"Output:\n{self.output_area.get(1.0, tk.END).strip()}")
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,79 @@
+# Per-run memo tables for KA functions that are both pure and recursive
+# (see resolver.py): a call with argument values seen before returns the
+# remembered result instead of running the body again. Recursion is where
+# the same arguments come back; a cheap helper called with new ones each
+# time only pays for the lookups. Keys include the argument types, so f(1),
+# f(1.0) and f(true) stay apart; calls with unhashable arguments are not
+# remembered, and neither are calls that raise. A function's table holds at
+# most `max_entries` results and starts over when full.
+#
+# Every KannadaInterpreter has a Memo unless made with memoize=False.
+
+MAX_ENTRIES = 1 << 16
+
+
+class _Missing:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISSING"
+
+
+# Returned by lookup() when there is no remembered result.
+MISSING = _Missing()
+
+
+class Memo:
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        # Function -> its table and its KA name; name -> [hits, misses].
+        self.tables = {}
+        self.names = {}
+        self.counts = {}
+
+    def lookup(self, function, name, args):
+        # Returns (key, result); pass the key to store() once a missing
+        # result has been computed. `function` identifies the definition.
+        table = self.tables.get(function)
+        if table is None:
+            table = self.tables[function] = {}
+            self.names[function] = name
+        counts = self.counts.get(name)
+        if counts is None:
+            counts = self.counts[name] = [0, 0]
+        key = (*args, *map(type, args))
+        try:
+            value = table.get(key, MISSING)
+        except TypeError:
+            return None, MISSING
+        counts[value is MISSING] += 1
+        return key, value
+
+    def store(self, function, key, value):
+        if key is None:
+            return
+        table = self.tables[function]
+        if len(table) >= self.max_entries:
+            table.clear()
+        table[key] = value
+
+    def wrap(self, function, name):
+        # `function` taking the arguments of a call, remembering results.
+        lookup = self.lookup
+        store = self.store
+
+        def memoized(*args):
+            key, value = lookup(function, name, args)
+            if value is MISSING:
+                value = function(*args)
+                store(function, key, value)
+            return value
+        return memoized
+
+    def stats(self):
+        entries = {}
+        for function, table in self.tables.items():
+            name = self.names[function]
+            entries[name] = entries.get(name, 0) + len(table)
+        return {name: {"hits": hits, "misses": misses, "entries": entries.get(name, 0)}
+                for name, (hits, misses) in self.counts.items()}
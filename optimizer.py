@@ -0,0 +1,651 @@
+import copy
+
+from ast_nodes import (
+    PRINT, ASSIGNMENT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS, TRY_EXCEPT, CLASS,
+    NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP, ARRAY, INDEX, SLICE,
+    Assignment, If, Number, String, Boolean, Identifier, BinaryOp, Comparison, UnaryOp, FunctionCall,
+    ArrayLiteral,
+)
+from compiler import BINARY_OPS, COMPARISON_OPS
+from resolver import resolve, assigned_names
+
+
+# Optional AST optimizer, run between parser.parse() and execute():
+#
+#   fold       evaluate operators whose operands are literals
+#   dead_code  drop constant if/while branches, empty for ranges and
+#              statements after return/break/continue
+#   cse        compute an operator subexpression repeated within one
+#              statement once, into a `$cse` temporary, when nothing the
+#              statement evaluates before it can fail
+#   hoist      compute loop-invariant subexpressions once before the loop,
+#              into a `$loop` temporary
+#
+# optimize() works on a copy, so the tree it is given (which may be shared,
+# e.g. by a parse cache) is left untouched, and re-runs the resolver on the
+# result because temporaries add names. `$` cannot appear in a KA name, so
+# temporaries never clash with program variables. Only call-free
+# expressions are moved, since a call can print or fail.
+
+PASSES = ('fold', 'dead_code', 'cse', 'hoist')
+
+_KEYWORDS = {RETURN: "return", BREAK: "break", CONTINUE: "continue"}
+
+_COMPARISON_SYMBOLS = {
+    'LESS': '<', 'GREATER': '>', 'EQUAL': '==', 'NOTEQUAL': '!=', 'LESSEQUAL': '<=', 'GREATEREQUAL': '>=',
+}
+
+# Folding stops at results this large; they are cheaper to build at run time
+# than to keep in the tree.
+_MAX_FOLDED_BITS = 4096
+_MAX_FOLDED_STRING = 4096
+
+
+class OptimizationReport:
+    def __init__(self):
+        self.changes = []
+
+    def add(self, pass_name, line, message):
+        self.changes.append((pass_name, line, message))
+
+    def counts(self):
+        counts = dict.fromkeys(PASSES, 0)
+        for pass_name, _, _ in self.changes:
+            counts[pass_name] += 1
+        return counts
+
+    def __str__(self):
+        if not self.changes:
+            return "no changes"
+        return "\n".join(f"{pass_name:<10} line {line or '?':>4}: {message}"
+                         for pass_name, line, message in self.changes)
+
+
+def source(expr):
+    if expr is None:
+        return "None"
+    kind = expr.kind
+    if kind == NUMBER:
+        return str(expr.value)
+    elif kind == STRING:
+        return '"' + expr.value.encode("unicode_escape").decode("ascii").replace('"', '\\"') + '"'
+    elif kind == BOOLEAN:
+        return "true" if expr.value else "false"
+    elif kind == IDENTIFIER:
+        return expr.name
+    elif kind == BINARY_OP:
+        return f"({source(expr.left)} {expr.op} {source(expr.right)})"
+    elif kind == COMPARISON:
+        return f"({source(expr.left)} {_COMPARISON_SYMBOLS.get(expr.op, expr.op)} {source(expr.right)})"
+    elif kind == UNARY_OP:
+        return ("-" if expr.op == 'NEGATE' else "!") + source(expr.operand)
+    elif kind == FUNCTION_CALL:
+        return f"{expr.name}({', '.join(source(arg) for arg in expr.args)})"
+    elif kind == ARRAY:
+        return f"[{', '.join(source(element) for element in expr.elements)}]"
+    elif kind == INDEX:
+        return f"{source(expr.value)}[{source(expr.index)}]"
+    elif kind == SLICE:
+        start = source(expr.start) if expr.start is not None else ""
+        stop = source(expr.stop) if expr.stop is not None else ""
+        return f"{source(expr.value)}[{start}:{stop}]"
+    return "?"
+
+
+def optimize(ast, passes=PASSES):
+    for pass_name in passes:
+        if pass_name not in PASSES:
+            raise ValueError(f"Unknown optimization pass: {pass_name}")
+    report = OptimizationReport()
+    if ast is None:
+        return None, report
+    tree = copy.deepcopy(_as_list(ast))
+    optimizer = _Optimizer(report)
+    if 'fold' in passes:
+        tree = optimizer.fold_block(tree)
+    if 'dead_code' in passes:
+        tree = optimizer.dead_code_block(tree)
+    if 'cse' in passes:
+        tree = optimizer.cse_block(tree)
+    if 'hoist' in passes:
+        tree = optimizer.hoist_block(tree)
+    return resolve(tree), report
+
+
+def _as_list(statements):
+    return statements if isinstance(statements, list) else [statements]
+
+
+def _is_node(value):
+    return value is not None and hasattr(value, 'kind')
+
+
+def _is_constant(expr):
+    return _is_node(expr) and expr.kind in (NUMBER, STRING, BOOLEAN)
+
+
+def _constant_value(expr):
+    return int(expr.value) if expr.kind == NUMBER else expr.value
+
+
+def _make_constant(value, line):
+    if isinstance(value, bool):
+        return Boolean(value, line=line)
+    if isinstance(value, int):
+        if value.bit_length() > _MAX_FOLDED_BITS:
+            return None
+        return Number(value, line=line)
+    if isinstance(value, str) and len(value) <= _MAX_FOLDED_STRING:
+        return String(value, line=line)
+    # Float results stay unfolded: Number holds an int for every backend.
+    return None
+
+
+def _is_operator(expr):
+    return _is_node(expr) and expr.kind in (BINARY_OP, COMPARISON, UNARY_OP)
+
+
+def _children(expr):
+    if expr.kind == UNARY_OP:
+        return (expr.operand,)
+    if expr.kind in (BINARY_OP, COMPARISON):
+        return (expr.left, expr.right)
+    if expr.kind == FUNCTION_CALL:
+        return tuple(expr.args)
+    if expr.kind == ARRAY:
+        return tuple(expr.elements)
+    if expr.kind == INDEX:
+        return (expr.value, expr.index)
+    if expr.kind == SLICE:
+        return tuple(child for child in (expr.value, expr.start, expr.stop) if child is not None)
+    return ()
+
+
+def _has_call(expr):
+    if not _is_node(expr):
+        return False
+    if expr.kind == FUNCTION_CALL:
+        return True
+    return any(_has_call(child) for child in _children(expr))
+
+
+def _key(expr):
+    kind = expr.kind
+    if kind in (NUMBER, STRING, BOOLEAN):
+        return (kind, type(expr.value), expr.value)
+    elif kind == IDENTIFIER:
+        return (kind, expr.name)
+    elif kind == UNARY_OP:
+        return (kind, expr.op, _key(expr.operand))
+    elif kind in (BINARY_OP, COMPARISON):
+        return (kind, expr.op, _key(expr.left), _key(expr.right))
+    elif kind in (ARRAY, INDEX, SLICE):
+        children = expr.elements if kind == ARRAY else [getattr(expr, field) for field in expr.fields]
+        return (kind,) + tuple(_key(child) if child is not None else None for child in children)
+    return (kind, id(expr))
+
+
+def _statement_expressions(node):
+    # (holder, attribute or index) pairs for the expressions a statement
+    # evaluates unconditionally, before anything in its nested blocks.
+    kind = node.kind
+    if kind == PRINT:
+        return [(node.values, i) for i, value in enumerate(node.values) if value is not None]
+    elif kind in (ASSIGNMENT, RETURN):
+        return [(node, 'value')]
+    elif kind in (IF, WHILE):
+        return [(node, 'condition')]
+    elif kind == FUNCTION_CALL:
+        return [(node.args, i) for i in range(len(node.args))]
+    return []
+
+
+def _get(holder, field):
+    return holder[field] if isinstance(holder, list) else getattr(holder, field)
+
+
+def _set(holder, field, value):
+    if isinstance(holder, list):
+        holder[field] = value
+    else:
+        setattr(holder, field, value)
+
+
+def _nested_blocks(node):
+    # (holder, attribute) pairs of the statement lists nested in a node, not
+    # counting function bodies, which have their own scope.
+    kind = node.kind
+    if kind == IF:
+        blocks = [(node, 'body')]
+        blocks += [(clause, 'body') for clause in node.elif_clauses or ()]
+        if node.else_body is not None:
+            blocks.append((node, 'else_body'))
+        return blocks
+    elif kind in (WHILE, FOR, CLASS):
+        return [(node, 'body')]
+    elif kind == TRY_EXCEPT:
+        blocks = [(node, 'try_body'), (node, 'except_body')]
+        if node.finally_body is not None:
+            blocks.append((node, 'finally_body'))
+        return blocks
+    return []
+
+
+def _all_expressions(statements):
+    # Every expression slot in a block, including nested blocks but not
+    # nested function bodies.
+    slots = []
+    for node in _as_list(statements):
+        if not _is_node(node):
+            continue
+        slots.extend(_statement_expressions(node))
+        if node.kind == IF:
+            slots.extend((clause, 'condition') for clause in node.elif_clauses or ())
+        for holder, field in _nested_blocks(node):
+            slots.extend(_all_expressions(getattr(holder, field)))
+    return slots
+
+
+def _has_effect(node):
+    # Whether running a statement may do anything a later error would leave
+    # visible: assign, print, read input, call, or leave the iteration.
+    if not _is_node(node) or node.kind == PASS:
+        return False
+    if node.kind != IF:
+        return True
+    conditions = [node.condition] + [clause.condition for clause in node.elif_clauses or ()]
+    return any(_has_call(condition) for condition in conditions) or any(
+        _has_effect(child) for holder, field in _nested_blocks(node) for child in _as_list(getattr(holder, field)))
+
+
+class _Optimizer:
+    def __init__(self, report):
+        self.report = report
+        self.temporaries = 0
+
+    def temporary(self, prefix):
+        name = f"${prefix}{self.temporaries}"
+        self.temporaries += 1
+        return name
+
+    def each_block(self, statements, transform):
+        # Applies `transform` to every nested statement list, function bodies
+        # included.
+        for node in statements:
+            if not _is_node(node):
+                continue
+            blocks = _nested_blocks(node)
+            if node.kind == FUNCTION_DEF:
+                blocks = [(node, 'body')]
+            for holder, field in blocks:
+                setattr(holder, field, transform(_as_list(getattr(holder, field))))
+
+    # Constant folding
+
+    def fold_block(self, statements):
+        for node in statements:
+            if not _is_node(node):
+                continue
+            slots = _statement_expressions(node)
+            if node.kind == IF:
+                slots.extend((clause, 'condition') for clause in node.elif_clauses or ())
+            for holder, field in slots:
+                expr = _get(holder, field)
+                folded = self.fold(expr)
+                if folded is not expr:
+                    self.report_folds(expr, folded, node.line)
+                    _set(holder, field, folded)
+        self.each_block(statements, self.fold_block)
+        return statements
+
+    def fold(self, expr):
+        if not _is_node(expr):
+            return expr
+        kind = expr.kind
+        if kind == FUNCTION_CALL:
+            args = [self.fold(arg) for arg in expr.args]
+            if all(new is old for new, old in zip(args, expr.args)):
+                return expr
+            clone = copy.copy(expr)
+            clone.args = args
+            return clone
+        if kind == ARRAY:
+            elements = [self.fold(element) for element in expr.elements]
+            if all(new is old for new, old in zip(elements, expr.elements)):
+                return expr
+            clone = copy.copy(expr)
+            clone.elements = elements
+            return clone
+        if kind in (INDEX, SLICE):
+            clone = copy.copy(expr)
+            for field in expr.fields:
+                setattr(clone, field, self.fold(getattr(expr, field)))
+            if all(getattr(clone, field) is getattr(expr, field) for field in expr.fields):
+                return expr
+            return clone
+        if kind == UNARY_OP:
+            operand = self.fold(expr.operand)
+            if _is_constant(operand):
+                value = _constant_value(operand)
+                if expr.op == 'NEGATE' and not isinstance(value, str):
+                    constant = _make_constant(-value, expr.line)
+                elif expr.op == 'NOT':
+                    constant = _make_constant(not value, expr.line)
+                else:
+                    constant = None
+                if constant is not None:
+                    return constant
+            return expr if operand is expr.operand else UnaryOp(expr.op, operand, line=expr.line)
+        if kind in (BINARY_OP, COMPARISON):
+            left = self.fold(expr.left)
+            right = self.fold(expr.right)
+            ops = BINARY_OPS if kind == BINARY_OP else COMPARISON_OPS
+            op = ops.get(expr.op)
+            if op is not None and _is_constant(left) and _is_constant(right):
+                constant = self.compute(expr.op, op, _constant_value(left), _constant_value(right), expr.line)
+                if constant is not None:
+                    return constant
+            if left is expr.left and right is expr.right:
+                return expr
+            node_class = BinaryOp if kind == BINARY_OP else Comparison
+            return node_class(expr.op, left, right, line=expr.line)
+        return expr
+
+    def compute(self, symbol, op, left, right, line):
+        if symbol == '**' and isinstance(right, int) and not -64 <= right <= 256:
+            return None
+        if symbol == '*' and (isinstance(left, str) or isinstance(right, str)):
+            count = right if isinstance(left, str) else left
+            if not isinstance(count, int) or count > _MAX_FOLDED_STRING:
+                return None
+        try:
+            value = op(left, right)
+        except Exception:
+            # Left for run time, which reports the error with its line.
+            return None
+        return _make_constant(value, line)
+
+    def report_folds(self, old, new, line):
+        if _is_constant(new) and not _is_constant(old):
+            self.report.add('fold', old.line or line, f"{source(old)} -> {source(new)}")
+            return
+        if _is_node(old) and _is_node(new) and old.kind == new.kind:
+            for old_child, new_child in zip(_children(old), _children(new)):
+                if new_child is not old_child:
+                    self.report_folds(old_child, new_child, line)
+
+    # Dead-code elimination
+
+    def dead_code_block(self, statements):
+        result = []
+        for i, node in enumerate(statements):
+            if not _is_node(node):
+                result.append(node)
+                continue
+            kind = node.kind
+            if kind == IF and not node.elif_clauses and _is_constant(node.condition):
+                if _constant_value(node.condition):
+                    self.report.add('dead_code', node.line, "if (true): body inlined")
+                    kept = _as_list(node.body)
+                elif node.else_body is not None:
+                    self.report.add('dead_code', node.line, "if (false): else body inlined")
+                    kept = _as_list(node.else_body)
+                else:
+                    self.report.add('dead_code', node.line, "if (false): removed")
+                    kept = []
+                result.extend(self.dead_code_block(list(kept)))
+            elif kind == WHILE and _is_constant(node.condition) and not _constant_value(node.condition):
+                self.report.add('dead_code', node.line, "while (false): removed")
+            elif kind == FOR and int(node.start) >= int(node.end):
+                self.report.add('dead_code', node.line,
+                                f"for over empty range({int(node.start)}, {int(node.end)}): removed")
+            else:
+                self.each_block([node], self.dead_code_block)
+                result.append(node)
+            if result and _is_node(result[-1]) and result[-1].kind in (RETURN, BREAK, CONTINUE):
+                unreachable = len(statements) - i - 1
+                if unreachable:
+                    self.report.add('dead_code', result[-1].line,
+                                    f"{unreachable} unreachable statement(s) after "
+                                    f"{_KEYWORDS[result[-1].kind]} removed")
+                break
+        return result
+
+    # Common subexpressions
+
+    def cse_block(self, statements):
+        result = []
+        for node in statements:
+            if _is_node(node):
+                self.each_block([node], self.cse_block)
+                if node.kind != WHILE:
+                    result.extend(self.cse_statement(node))
+            result.append(node)
+        return result
+
+    def cse_statement(self, node):
+        slots = _statement_expressions(node)
+        expressions = [_get(holder, field) for holder, field in slots]
+        if not expressions or any(_has_call(expr) for expr in expressions):
+            return []
+        counts = {}
+        sizes = {}
+        for expr in expressions:
+            self.count_operators(expr, counts, sizes)
+        # A subexpression that only repeats because an enclosing repeated
+        # expression does is covered by that expression's temporary.
+        for key in sorted(counts, key=lambda key: -sizes[key]):
+            if counts[key] >= 2:
+                inner = {}
+                self.count_operators(self.find(expressions, key), inner, {})
+                for inner_key, occurrences in inner.items():
+                    if inner_key != key:
+                        counts[inner_key] -= occurrences * (counts[key] - 1)
+        definitions = []
+        temporaries = {}
+        # Whether something evaluated so far, outside the temporaries, may
+        # fail: a temporary computed ahead of it would fail first.
+        self.may_fail = False
+        for holder, field in slots:
+            _set(holder, field, self.share(_get(holder, field), counts, temporaries, definitions, node.line))
+        for definition, uses in definitions:
+            self.report.add('cse', node.line, f"{definition.target} = {source(definition.value)} (used {uses} times)")
+        return [definition for definition, _ in definitions]
+
+    def count_operators(self, expr, counts, sizes):
+        if not _is_operator(expr):
+            return 1
+        size = 1 + sum(self.count_operators(child, counts, sizes) for child in _children(expr))
+        key = _key(expr)
+        counts[key] = counts.get(key, 0) + 1
+        sizes[key] = size
+        return size
+
+    def find(self, expressions, key):
+        for expr in expressions:
+            if _is_operator(expr):
+                if _key(expr) == key:
+                    return expr
+                found = self.find(list(_children(expr)), key)
+                if found is not None:
+                    return found
+        return None
+
+    def share(self, expr, counts, temporaries, definitions, line):
+        if not _is_operator(expr):
+            if _is_node(expr) and not _is_constant(expr):
+                # A variable may be unassigned, an index out of range.
+                self.may_fail = True
+            return expr
+        key = _key(expr)
+        if counts.get(key, 0) >= 2 and key in temporaries:
+            return Identifier(temporaries[key], line=expr.line)
+        may_fail_before = self.may_fail
+        if expr.kind == UNARY_OP:
+            rebuilt = UnaryOp(expr.op, self.share(expr.operand, counts, temporaries, definitions, line),
+                              line=expr.line)
+        else:
+            rebuilt = type(expr)(expr.op, self.share(expr.left, counts, temporaries, definitions, line),
+                                 self.share(expr.right, counts, temporaries, definitions, line), line=expr.line)
+        if counts.get(key, 0) < 2 or may_fail_before:
+            self.may_fail = True
+            return rebuilt
+        # Evaluated among the definitions, in the same order as before.
+        self.may_fail = False
+        name = temporaries[key] = self.temporary('cse')
+        definitions.append((Assignment(name, rebuilt, line=line), counts[key]))
+        return Identifier(name, line=expr.line)
+
+    # Loop-invariant hoisting
+
+    def hoist_block(self, statements):
+        result = []
+        for node in statements:
+            if not _is_node(node):
+                result.append(node)
+                continue
+            self.each_block([node], self.hoist_block)
+            if node.kind == WHILE or node.kind == FOR:
+                result.extend(self.hoist_loop(node))
+            else:
+                result.append(node)
+        return result
+
+    def hoist_loop(self, loop):
+        body = _as_list(loop.body)
+        # Only loops known to run at least once are hoisted from, so the
+        # temporaries never evaluate anything the loop would not.
+        if loop.kind == FOR and int(loop.start) >= int(loop.end):
+            return [loop]
+        if loop.kind == WHILE and _has_call(loop.condition):
+            return [loop]
+        assigned = assigned_names(body)
+        if loop.kind == FOR:
+            assigned[loop.var] = None
+
+        # The temporaries are computed before the loop, so only expressions
+        # the first iteration evaluates before it has any effect are
+        # candidates: an error in one must not overtake an earlier print,
+        # assignment or call.
+        candidates = []
+        if loop.kind == WHILE:
+            candidates.append(loop.condition)
+        for node in body:
+            if not _is_node(node):
+                continue
+            candidates.extend(_get(holder, field) for holder, field in _statement_expressions(node))
+            if _has_effect(node):
+                break
+        invariant = {}
+        for expr in candidates:
+            self.collect_invariant(expr, assigned, invariant)
+            if _has_call(expr):
+                break
+        if not invariant:
+            return [loop]
+
+        guard = loop.condition if loop.kind == WHILE else None
+        temporaries = {}
+        definitions = []
+        for key, expr in invariant.items():
+            # Earlier temporaries are reused inside later ones.
+            value = self.replace(expr, temporaries)
+            name = temporaries[key] = self.temporary('loop')
+            definitions.append(Assignment(name, value, line=loop.line))
+            self.report.add('hoist', loop.line, f"{name} = {source(value)} moved out of the "
+                            f"{'while' if loop.kind == WHILE else 'for'} loop")
+        slots = _all_expressions(body)
+        if loop.kind == WHILE:
+            slots.append((loop, 'condition'))
+        for holder, field in slots:
+            _set(holder, field, self.replace(_get(holder, field), temporaries))
+        if loop.kind == FOR:
+            # The loop variable is set before the body runs, error or not.
+            first = Assignment(loop.var, Number(int(loop.start), line=loop.line), line=loop.line)
+            return [first] + definitions + [loop]
+        return [If(guard, definitions + [loop], line=loop.line)]
+
+    def collect_invariant(self, expr, assigned, invariant):
+        # Returns whether `expr` is invariant; records the largest invariant
+        # operator subexpressions that read at least one variable. Arrays,
+        # indexing and slicing are only looked into.
+        if not _is_node(expr):
+            return True
+        kind = expr.kind
+        if kind in (NUMBER, STRING, BOOLEAN):
+            return True
+        if kind == IDENTIFIER:
+            return expr.name not in assigned
+        children = _children(expr)
+        found = {}
+        results = []
+        for child in children:
+            # Nothing evaluated after a call is moved ahead of it.
+            called = any(_has_call(earlier) for earlier in children[:len(results)])
+            results.append(self.collect_invariant(child, assigned, {} if called else found))
+        if kind == FUNCTION_CALL:
+            invariant.update((key, value) for key, value in found.items() if key not in invariant)
+            return False
+        if all(results) and _is_operator(expr) and any(self.reads_variable(child) for child in children):
+            invariant.setdefault(_key(expr), expr)
+            return True
+        invariant.update((key, value) for key, value in found.items() if key not in invariant)
+        return all(results)
+
+    def reads_variable(self, expr):
+        if not _is_node(expr):
+            return False
+        if expr.kind == IDENTIFIER:
+            return True
+        return any(self.reads_variable(child) for child in _children(expr))
+
+    def replace(self, expr, temporaries):
+        if not _is_node(expr):
+            return expr
+        if _is_operator(expr):
+            name = temporaries.get(_key(expr))
+            if name is not None:
+                return Identifier(name, line=expr.line)
+            if expr.kind == UNARY_OP:
+                operand = self.replace(expr.operand, temporaries)
+                return expr if operand is expr.operand else UnaryOp(expr.op, operand, line=expr.line)
+            left = self.replace(expr.left, temporaries)
+            right = self.replace(expr.right, temporaries)
+            if left is expr.left and right is expr.right:
+                return expr
+            return type(expr)(expr.op, left, right, line=expr.line)
+        # Nodes are rebuilt rather than changed in place: the loop guard and
+        # the temporaries' definitions share subtrees with the loop.
+        if expr.kind == FUNCTION_CALL:
+            args = [self.replace(arg, temporaries) for arg in expr.args]
+            if all(new is old for new, old in zip(args, expr.args)):
+                return expr
+            call = FunctionCall(expr.name, args, line=expr.line)
+            call.builtin = expr.builtin
+            return call
+        elif expr.kind == ARRAY:
+            elements = [self.replace(element, temporaries) for element in expr.elements]
+            if all(new is old for new, old in zip(elements, expr.elements)):
+                return expr
+            return ArrayLiteral(elements, line=expr.line)
+        elif expr.kind in (INDEX, SLICE):
+            values = [self.replace(getattr(expr, field), temporaries) for field in expr.fields]
+            if all(new is getattr(expr, field) for new, field in zip(values, expr.fields)):
+                return expr
+            return type(expr)(*values, line=expr.line)
+        return expr
+
+
+if __name__ == "__main__":
+    import sys
+    from parser import parse
+
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    if path is None:
+        print("usage: python optimizer.py program.kn [pass ...]")
+        sys.exit(1)
+    with open(path, encoding="utf-8") as file:
+        program = parse(file.read().strip())
+    _, optimization_report = optimize(program, sys.argv[2:] or PASSES)
+    print(optimization_report)
+    print(optimization_report.counts())
@@ -0,0 +1,33 @@
+import sys
+
+
+# Buffered sink for program output. Print statements in every execution
+# mode write to the interpreter's sink instead of calling print(); the text
+# is passed on to `stream` (sys.stdout as it is at flush time when None) once
+# buffer_size characters have collected, and whenever flush() is called: at
+# the end of a run, before reading input and when a run stops with an error.
+# buffer_size=0 writes through on every call.
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class OutputSink:
+    def __init__(self, stream=None, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.parts = []
+        self.size = 0
+
+    def write(self, text):
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.parts:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("".join(self.parts))
+            self.parts.clear()
+            self.size = 0
+            stream.flush()
@@ -0,0 +1,101 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from parser import parse, prepare
+
+
+# Bounded LRU cache in front of parser.parse, keyed by a hash of the source
+# text. Each entry holds the AST and, per (mode, passes, max_depth), the
+# prepared program from parser.prepare, so running the same script again
+# skips lexing, parsing, optimizing and compiling. Sources that fail to
+# parse are not cached. Cached trees are shared and must not be mutated.
+
+DEFAULT_MAX_SIZE = 128
+
+
+class _Entry:
+    __slots__ = ('ast', 'prepared')
+
+    def __init__(self, ast):
+        self.ast = ast
+        self.prepared = {}
+
+
+class ParseCache:
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(code):
+        return hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+
+    def entry(self, code):
+        key = self.key(code)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+        ast = parse(code)
+        if ast is None:
+            return None
+        entry = _Entry(ast)
+        with self.lock:
+            if self.max_size > 0:
+                self.entries[key] = entry
+                self.entries.move_to_end(key)
+                self._evict()
+        return entry
+
+    def parse(self, code):
+        entry = self.entry(code)
+        return entry.ast if entry is not None else None
+
+    def prepared(self, code, mode="closure", passes=(), max_depth=None):
+        entry = self.entry(code)
+        if entry is None:
+            return None
+        variant = (mode, tuple(passes), max_depth)
+        run = entry.prepared.get(variant)
+        if run is None:
+            ast = entry.ast
+            if passes:
+                from optimizer import optimize
+                ast, _ = optimize(ast, passes)
+            run = entry.prepared[variant] = prepare(ast, mode, max_depth)
+        return run
+
+    def resize(self, max_size):
+        with self.lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        while len(self.entries) > max(self.max_size, 0):
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {
+            "size": len(self.entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+default_cache = ParseCache()
@@ -1,5 +1,25 @@
-import ply.yacc as yacc
-from lexer import tokens, lexer
+import copy
+import functools
+import sys
+import threading
+from itertools import repeat
+from lexer import tokens, get_lexer, write_lextab, tokenize_file
+from scanner import tokenize
+from ast_nodes import (
+    Node, Print, Assignment, Input, If, While, For, FunctionDef, FunctionCall, Return, Break, Continue, Pass,
+    TryExcept, Import, FromImport, ClassDef, Number, String, Boolean, Identifier, BinaryOp, Comparison, UnaryOp,
+    ArrayLiteral, Index, Slice,
+    PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS,
+    TRY_EXCEPT, IMPORT, FROM_IMPORT, CLASS, NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP,
+    ARRAY, INDEX, SLICE,
+)
+from signals import RETURN_SIGNAL, BREAK_SIGNAL, CONTINUE_SIGNAL, TAIL_CALL_SIGNAL
+from resolver import resolve, new_frame, UNSET
+from output import OutputSink
+from budget import BudgetExceeded, body_cost
+from memo import Memo, MISSING
+from loops import run_reduction
+from arrays import BUILTINS, make_array, get_item, get_slice
 
 precedence = (
     ('left', 'PLUS', 'MINUS'),
@@ -7,6 +27,7 @@ precedence = (
     ('right', 'POWER'),
     ('left', 'GREATER', 'LESS', 'GREATEREQUAL', 'LESSEQUAL', 'EQUAL', 'NOTEQUAL'),
     ('right', 'NOT'),
+    ('left', 'LBRACKET'),
 )
 
 def p_program(p):
@@ -18,12 +39,14 @@ def p_statements(p):
                   | statements statement
                   | statements NEWLINE
                   | NEWLINE'''
-    if len(p) == 2 and p[1] != '\n':
-        p[0] = [p[1]]
-    elif len(p) == 3 and p[2] != '\n':
-        p[0] = p[1] + [p[2]]
+    if len(p) == 2:
+        p[0] = [p[1]] if isinstance(p[1], Node) else []
     else:
-        p[0] = p[1] if len(p) == 3 else []
+        # Extend the list in place; p[1] + [p[2]] copied it on every
+        # reduction, making a block of N statements O(N^2) to build.
+        if isinstance(p[2], Node):
+            p[1].append(p[2])
+        p[0] = p[1]
 
 def p_statement(p):
     '''statement : print_statement
@@ -45,7 +68,7 @@ def p_statement(p):
 
 def p_print_statement(p):
     '''print_statement : PRINT LPAREN expression_list RPAREN NEWLINE'''
-    p[0] = {"type": "print", "values": p[3]}
+    p[0] = Print(p[3], line=p.lineno(1))
 
 def p_expression_list(p):
     '''expression_list : expression
@@ -53,15 +76,16 @@ def p_expression_list(p):
     if len(p) == 2:
         p[0] = [p[1]]
     else:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_assignment_statement(p):
     '''assignment_statement : ID ASSIGN expression'''
-    p[0] = {"type": "assignment", "target": p[1], "value": p[3]}
+    p[0] = Assignment(p[1], p[3], line=p.lineno(1))
 
 def p_input_statement(p):
     '''input_statement : ID ASSIGN INPUT LPAREN RPAREN'''
-    p[0] = {"type": "input", "target": p[1]}
+    p[0] = Input(p[1], line=p.lineno(1))
 
 def p_expression(p):
     '''expression : expression PLUS term
@@ -73,9 +97,9 @@ def p_expression(p):
     if len(p) == 2:
         p[0] = p[1]
     elif p[1] == '!':
-        p[0] = {"type": "unary_op", "op": "NOT", "operand": p[2]}
+        p[0] = UnaryOp("NOT", p[2])
     else:
-        p[0] = {"type": "binary_op", "op": p[2], "left": p[1], "right": p[3]}
+        p[0] = BinaryOp(p[2], p[1], p[3])
 
 def p_term(p):
     '''term : term TIMES factor
@@ -86,7 +110,7 @@ def p_term(p):
     if len(p) == 2:
         p[0] = p[1]
     else:
-        p[0] = {"type": "binary_op", "op": p[2], "left": p[1], "right": p[3]}
+        p[0] = BinaryOp(p[2], p[1], p[3])
 
 def p_factor(p):
     '''factor : NUMBER
@@ -95,41 +119,61 @@ def p_factor(p):
               | FALSE
               | ID
               | LPAREN expression RPAREN
-              | MINUS factor'''
+              | MINUS factor
+              | function_call'''
     if len(p) == 2:
         token = p[1]
-        if hasattr(token, 'type'):
+        if isinstance(token, FunctionCall):
+            p[0] = token
+        elif hasattr(token, 'type'):
             if token.type == 'TRUE':
-                p[0] = {"type": "boolean", "value": True}
+                p[0] = Boolean(True)
             elif token.type == 'FALSE':
-                p[0] = {"type": "boolean", "value": False}
+                p[0] = Boolean(False)
             elif token.type == 'NUMBER':
-                p[0] = {"type": "number", "value": token.value}
+                p[0] = Number(token.value)
             elif token.type == 'STRING':
                 raw_str = token.value[1:-1]
-                p[0] = {"type": "string", "value": bytes(raw_str, "utf-8").decode("unicode_escape")}
+                p[0] = String(bytes(raw_str, "utf-8").decode("unicode_escape"))
             elif token.type == 'ID':
-                p[0] = {"type": "identifier", "name": token.value}
+                p[0] = Identifier(token.value)
             else:
                 raise SyntaxError(f"Unexpected token type: {token.type}")
         else:
             if isinstance(token, bool):
-                p[0] = {"type": "boolean", "value": token}
+                p[0] = Boolean(token)
             elif isinstance(token, int):
-                p[0] = {"type": "number", "value": token}
+                p[0] = Number(token)
             elif isinstance(token, str) and (token.startswith('"') or token.startswith("'")):
                 raw_str = token[1:-1]
-                p[0] = {"type": "string", "value": bytes(raw_str, "utf-8").decode("unicode_escape")}
+                p[0] = String(bytes(raw_str, "utf-8").decode("unicode_escape"))
             elif isinstance(token, str):
-                p[0] = {"type": "identifier", "name": token}
+                p[0] = Identifier(token)
             else:
                 raise SyntaxError(f"Unexpected value: {token}")
     else:
         if p[1] == '-':
-            p[0] = {"type": "unary_op", "op": "NEGATE", "operand": p[2]}
+            p[0] = UnaryOp("NEGATE", p[2])
         elif p[1] == '(':
             p[0] = p[2]
 
+def p_factor_array(p):
+    '''factor : LBRACKET argument_list RBRACKET'''
+    p[0] = ArrayLiteral(p[2], line=p.lineno(1))
+
+def p_factor_index(p):
+    '''factor : factor LBRACKET expression RBRACKET
+              | factor LBRACKET slice_bound COLON slice_bound RBRACKET'''
+    if len(p) == 5:
+        p[0] = Index(p[1], p[3], line=p.lineno(2))
+    else:
+        p[0] = Slice(p[1], p[3], p[5], line=p.lineno(2))
+
+def p_slice_bound(p):
+    '''slice_bound : empty
+                   | expression'''
+    p[0] = p[1]
+
 def p_comparison(p):
     '''comparison : expression LESS expression
                   | expression GREATER expression
@@ -145,31 +189,31 @@ def p_comparison(p):
         '<=': 'LESSEQUAL',
         '>=': 'GREATEREQUAL'
     }
-    p[0] = {"type": "comparison", "op": op_map[p[2]], "left": p[1], "right": p[3]}
+    p[0] = Comparison(op_map[p[2]], p[1], p[3])
 
 def p_if_statement(p):
     '''if_statement : IF LPAREN expression RPAREN statements END
                     | IF LPAREN expression RPAREN statements ELSE statements END
                     | IF LPAREN expression RPAREN statements ELIF LPAREN expression RPAREN statements ELSE statements END'''
     if len(p) == 7:  # if (condition) block end
-        p[0] = {"type": "if", "condition": p[3], "body": p[5]}
+        p[0] = If(p[3], p[5], line=p.lineno(1))
     elif len(p) == 9:  # if (condition) block else block end
-        p[0] = {"type": "if", "condition": p[3], "body": p[5], "else_body": p[7]}
+        p[0] = If(p[3], p[5], else_body=p[7], line=p.lineno(1))
     elif len(p) == 13:  # if (condition) block elif (condition) block else block end
-        elif_clause = {"type": "if", "condition": p[8], "body": p[10]}
-        p[0] = {"type": "if", "condition": p[3], "body": p[5], "elif_clauses": [elif_clause], "else_body": p[12]}
+        elif_clause = If(p[8], p[10], line=p.lineno(6))
+        p[0] = If(p[3], p[5], elif_clauses=[elif_clause], else_body=p[12], line=p.lineno(1))
 
 def p_while_statement(p):
     '''while_statement : WHILE LPAREN expression RPAREN statements END'''
-    p[0] = {"type": "while", "condition": p[3], "body": p[5]}
+    p[0] = While(p[3], p[5], line=p.lineno(1))
 
 def p_for_statement(p):
     '''for_statement : FOR LPAREN ID IN RANGE LPAREN NUMBER COMMA NUMBER RPAREN RPAREN statements END'''
-    p[0] = {"type": "for", "var": p[3], "start": p[7], "end": p[9], "body": p[12]}
+    p[0] = For(p[3], p[7], p[9], p[12], line=p.lineno(1))
 
 def p_function_def(p):
     '''function_def : DEF ID LPAREN parameter_list RPAREN COLON statements'''
-    p[0] = {"type": "function_def", "name": p[2], "params": p[4], "body": p[7]}
+    p[0] = FunctionDef(p[2], p[4], p[7], line=p.lineno(1))
 
 def p_parameter_list(p):
     '''parameter_list : empty
@@ -180,11 +224,12 @@ def p_parameter_list(p):
     elif len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_function_call(p):
     '''function_call : ID LPAREN argument_list RPAREN'''
-    p[0] = {"type": "function_call", "name": p[1], "args": p[3]}
+    p[0] = FunctionCall(p[1], p[3], line=p.lineno(1))
 
 def p_argument_list(p):
     '''argument_list : empty
@@ -195,47 +240,48 @@ def p_argument_list(p):
     elif len(p) == 2:
         p[0] = [p[1]]
     elif len(p) == 4:
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
 
 def p_return_statement(p):
     '''return_statement : RETURN expression'''
-    p[0] = {"type": "return", "value": p[2]}
+    p[0] = Return(p[2], line=p.lineno(1))
 
 def p_break_statement(p):
     '''break_statement : BREAK'''
-    p[0] = {"type": "break"}
+    p[0] = Break(line=p.lineno(1))
 
 def p_continue_statement(p):
     '''continue_statement : CONTINUE'''
-    p[0] = {"type": "continue"}
+    p[0] = Continue(line=p.lineno(1))
 
 def p_pass_statement(p):
     '''pass_statement : PASS'''
-    p[0] = {"type": "pass"}
+    p[0] = Pass(line=p.lineno(1))
 
 def p_try_except_statement(p):
     '''try_except_statement : TRY COLON statements EXCEPT COLON statements
                             | TRY COLON statements EXCEPT COLON statements FINALLY COLON statements'''
     if len(p) == 7:
-        p[0] = {"type": "try_except", "try_body": p[3], "except_body": p[6]}
+        p[0] = TryExcept(p[3], p[6], line=p.lineno(1))
     else:
-        p[0] = {"type": "try_except", "try_body": p[3], "except_body": p[6], "finally_body": p[10]}
+        p[0] = TryExcept(p[3], p[6], finally_body=p[9], line=p.lineno(1))
 
 def p_import_statement(p):
     '''import_statement : IMPORT ID
                         | FROM ID IMPORT ID'''
     if len(p) == 3:
-        p[0] = {"type": "import", "module": p[2]}
+        p[0] = Import(p[2], line=p.lineno(1))
     else:
-        p[0] = {"type": "from_import", "module": p[2], "name": p[4]}
+        p[0] = FromImport(p[2], p[4], line=p.lineno(1))
 
 def p_class_definition(p):
     '''class_definition : CLASS ID COLON statements
                         | CLASS ID LPAREN ID RPAREN COLON statements'''
     if len(p) == 5:
-        p[0] = {"type": "class", "name": p[2], "body": p[4]}
+        p[0] = ClassDef(p[2], p[4], line=p.lineno(1))
     else:
-        p[0] = {"type": "class", "name": p[2], "parent": p[4], "body": p[7]}
+        p[0] = ClassDef(p[2], p[7], parent=p[4], line=p.lineno(1))
 
 def p_empty(p):
     'empty :'
@@ -247,15 +293,92 @@ def p_error(p):
     else:
         print("ವಾಕ್ಯ ರಚನಾ ದೋಷ/Syntax error at EOF")
 
-parser = yacc.yacc()
+# Startup-optimized construction: the LALR parser is built on the first
+# parse() from the prebuilt parsetab.py, and nothing is written to disk at
+# run time (no parser.out, no table regeneration). If the grammar no longer
+# matches parsetab.py the tables are rebuilt in memory; `python parser.py
+# --tables` refreshes the frozen lexer and parser tables on disk.
+_parser = None
+_parser_lock = threading.Lock()
+
+def get_parser():
+    global _parser
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                import ply.yacc as yacc
+                _parser = yacc.yacc(debug=False, write_tables=False)
+    return _parser
+
+def write_tables():
+    import ply.yacc as yacc
+    write_lextab()
+    yacc.yacc(debug=False, write_tables=True)
+
+def __getattr__(name):
+    if name == 'parser':
+        return get_parser()
+    if name == 'lexer':
+        return get_lexer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Reentrant front end. The LALR tables are built once and shared read-only;
+# every parse() call runs its own scanner (scanner.py, which yields the same
+# tokens as the PLY lexer) and its own copy of the parser driver, so one
+# Parser can serve any number of threads at once.
+class Parser:
+    def __init__(self):
+        self.parser = get_parser()
+
+    def parse(self, code):
+        return self.parse_tokens(tokenize(code))
+
+    def parse_file(self, path):
+        # Parses straight from the streaming tokenizer, never holding the
+        # whole source text. Leading and trailing newlines are dropped, as
+        # the IDE strips the source before parsing; lines keep their file
+        # numbers.
+        return self.parse_tokens(_strip_newlines(tokenize_file(path)))
+
+    def parse_tokens(self, stream):
+        # Parses tokens already produced by scanner.tokenize() or the lexer.
+        stream = iter(stream)
+        source = _TokenSource(functools.partial(next, stream, None))
+        return resolve(copy.copy(self.parser).parse(lexer=source, debug=False))
+
+class _TokenSource:
+    __slots__ = ('token',)
+
+    def __init__(self, token):
+        self.token = token
+
+def _strip_newlines(stream):
+    started = False
+    newline = None
+    for tok in stream:
+        if tok.type == 'NEWLINE':
+            if started:
+                newline = tok
+            continue
+        if newline is not None:
+            yield newline
+            newline = None
+        started = True
+        yield tok
 
 def parse(code):
     try:
-        lexer.input(code)
-        result = parser.parse(code, lexer=lexer, debug=False)
-        print("Parsed AST:")
-        print(result)
-        return result
+        return Parser().parse(code)
+    except SyntaxError as e:
+        print(f"ವಾಕ್ಯ ರಚನಾ ದೋಷ/Syntax error: {e}")
+        return None
+    except Exception as e:
+        print(f"ಅನಿರೀಕ್ಷಿತ ದೋಷ/Unexpected error: {e}")
+        return None
+
+def parse_file(path):
+    try:
+        return Parser().parse_file(path)
     except SyntaxError as e:
         print(f"ವಾಕ್ಯ ರಚನಾ ದೋಷ/Syntax error: {e}")
         return None
@@ -264,19 +387,25 @@ def parse(code):
         return None
 
 class KannadaInterpreter:
-    def __init__(self):
+    def __init__(self, output=None, budget=None, memoize=True, specialize=True):
         self.variables = {}
         self.functions = {}
+        self.frame = None
+        self.return_value = None
+        self.tail_call = None
         self.call_stack = []
+        self.output = output if output is not None else OutputSink()
+        self.budget = budget
+        self.memo = Memo() if memoize else None
+        self.specialize = specialize
 
     def evaluate(self, node):
         if isinstance(node, list):
-            result = None
             for statement in node:
-                result = self.evaluate_statement(statement)
-                if result and result.get('type') == 'return':
-                    return result
-            return result
+                signal = self.evaluate_statement(statement)
+                if signal is not None:
+                    return signal
+            return None
         else:
             return self.evaluate_statement(node)
 
@@ -284,104 +413,123 @@ class KannadaInterpreter:
         if not node:
             return None
 
-        node_type = node.get('type', '')
+        node_type = node.kind
 
-        if node_type == 'print':
-            values = [self.evaluate_expression(value) for value in node['values'] if value is not None]
+        if node_type == PRINT:
+            values = [self.evaluate_expression(value) for value in node.values if value is not None]
             output = " ".join(str(value) if not isinstance(value, bool) else str(value).capitalize() for value in values)
-            print(output, end="" if '\n' in output else " ")
+            self.output.write(output if '\n' in output else output + " ")
             return None
 
-        elif node_type == 'assignment':
-            value = self.evaluate_expression(node['value'])
-            self.variables[node['target']] = value
+        elif node_type == ASSIGNMENT:
+            value = self.evaluate_expression(node.value)
+            self.store(node.slot, node.target, value)
             return None
 
-        elif node_type == 'input':
+        elif node_type == INPUT:
+            self.output.flush()
             user_input = input("ಒಡ್ಡಿ/Enter input: ")
-            print()
-            self.variables[node['target']] = user_input
+            self.output.write("\n")
+            self.store(node.slot, node.target, user_input)
             return None
 
-        elif node_type == 'if':
-            condition = self.evaluate_expression(node['condition'])
+        elif node_type == IF:
+            condition = self.evaluate_expression(node.condition)
             if condition:
-                return self.evaluate(node['body'])
-            elif 'elif_clauses' in node:
-                for elif_clause in node['elif_clauses']:
-                    if self.evaluate_expression(elif_clause['condition']):
-                        return self.evaluate(elif_clause['body'])
-            if 'else_body' in node:
-                return self.evaluate(node['else_body'])
+                return self.evaluate(node.body)
+            elif node.elif_clauses:
+                for elif_clause in node.elif_clauses:
+                    if self.evaluate_expression(elif_clause.condition):
+                        return self.evaluate(elif_clause.body)
+            if node.else_body is not None:
+                return self.evaluate(node.else_body)
             return None
 
-        elif node_type == 'while':
-            condition = self.evaluate_expression(node['condition'])
-            result = None
-            while condition:
-                result = self.evaluate(node['body'])
-                if result and (result.get('type') == 'return' or
-                               result.get('type') == 'break'):
+        elif node_type == WHILE:
+            budget = self.budget
+            if node.plan is not None and self.specialize:
+                return self.run_plan(node, budget)
+            for _ in repeat(None) if budget is None else budget.iterations(self, body_cost(node.body)):
+                if not self.evaluate_expression(node.condition):
                     break
-                condition = self.evaluate_expression(node['condition'])
-            return None if result and result.get('type') == 'break' else result
-
-        elif node_type == 'for':
-            var_name = node['var']
-            start = int(node['start'])
-            end = int(node['end'])
-            result = None
-            for i in range(start, end):
-                self.variables[var_name] = i
-                result = self.evaluate(node['body'])
-                if result and (result.get('type') == 'return' or
-                               result.get('type') == 'break'):
-                    break
-            return None if result and result.get('type') == 'break' else result
+                signal = self.evaluate(node.body)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
+
+        elif node_type == FOR:
+            var_name = node.var
+            start = int(node.start)
+            end = int(node.end)
+            budget = self.budget
+            if node.plan is not None and self.specialize:
+                return self.run_plan(node, budget)
+            for i in range(start, end) if budget is None else budget.iterations(self, body_cost(node.body), end, start):
+                self.store(node.slot, var_name, i)
+                signal = self.evaluate(node.body)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
 
-        elif node_type == 'function_def':
-            self.functions[node['name']] = node
+        elif node_type == FUNCTION_DEF:
+            self.functions[node.name] = node
             return None
 
-        elif node_type == 'function_call':
-            return self.call_function(node)
+        elif node_type == FUNCTION_CALL:
+            self.call_function(node)
+            return None
 
-        elif node_type == 'return':
-            return {'type': 'return', 'value': self.evaluate_expression(node['value'])}
+        elif node_type == RETURN:
+            if node.tail:
+                call = node.value
+                func_def = self.functions.get(call.name)
+                if func_def is None:
+                    raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {call.name}")
+                self.tail_call = (func_def, [self.evaluate_expression(arg) for arg in call.args])
+                return TAIL_CALL_SIGNAL
+            self.return_value = self.evaluate_expression(node.value)
+            return RETURN_SIGNAL
 
-        elif node_type == 'break':
-            return {'type': 'break'}
+        elif node_type == BREAK:
+            return BREAK_SIGNAL
 
-        elif node_type == 'continue':
-            return {'type': 'continue'}
+        elif node_type == CONTINUE:
+            return CONTINUE_SIGNAL
 
-        elif node_type == 'pass':
+        elif node_type == PASS:
             return None
 
-        elif node_type == 'try_except':
+        elif node_type == TRY_EXCEPT:
             try:
-                return self.evaluate(node['try_body'])
+                return self.evaluate(node.try_body)
             except Exception as e:
-                return self.evaluate(node['except_body'])
+                return self.evaluate(node.except_body)
             finally:
-                if 'finally_body' in node:
-                    self.evaluate(node['finally_body'])
+                if node.finally_body is not None:
+                    return_value = self.return_value
+                    self.evaluate(node.finally_body)
+                    self.return_value = return_value
 
-        elif node_type == 'import':
-            print(f"Imported module: {node['module']}", end=" ")
+        elif node_type == IMPORT:
+            self.output.write(f"Imported module: {node.module} ")
             return None
 
-        elif node_type == 'from_import':
-            print(f"Imported {node['name']} from {node['module']}", end=" ")
+        elif node_type == FROM_IMPORT:
+            self.output.write(f"Imported {node.name} from {node.module} ")
             return None
 
-        elif node_type == 'class':
-            class_name = node['name']
-            print(f"Defined class: {class_name}", end=" ")
+        elif node_type == CLASS:
+            class_name = node.name
+            self.output.write(f"Defined class: {class_name} ")
             return None
 
         else:
-            return self.evaluate_expression(node)
+            self.evaluate_expression(node)
+            return None
 
     def evaluate_expression(self, expr):
         if not expr:
@@ -390,27 +538,31 @@ class KannadaInterpreter:
         if isinstance(expr, (int, float, str, bool)):
             return expr
 
-        expr_type = expr.get('type', '')
+        expr_type = expr.kind
 
-        if expr_type == 'number':
-            return int(expr['value'])
+        if expr_type == NUMBER:
+            return int(expr.value)
 
-        elif expr_type == 'string':
-            return expr['value']
+        elif expr_type == STRING:
+            return expr.value
 
-        elif expr_type == 'boolean':
-            return expr['value']
+        elif expr_type == BOOLEAN:
+            return expr.value
 
-        elif expr_type == 'identifier':
-            name = expr['name']
+        elif expr_type == IDENTIFIER:
+            name = expr.name
+            if expr.slot >= 0:
+                value = self.frame[expr.slot]
+                if value is not UNSET:
+                    return value
             if name in self.variables:
                 return self.variables[name]
             raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}")
 
-        elif expr_type == 'binary_op':
-            left = self.evaluate_expression(expr['left'])
-            right = self.evaluate_expression(expr['right'])
-            op = expr['op']
+        elif expr_type == BINARY_OP:
+            left = self.evaluate_expression(expr.left)
+            right = self.evaluate_expression(expr.right)
+            op = expr.op
             if op == '+':
                 return left + right
             elif op == '-':
@@ -426,10 +578,10 @@ class KannadaInterpreter:
             elif op == '%':
                 return left % right
 
-        elif expr_type == 'comparison':
-            left = self.evaluate_expression(expr['left'])
-            right = self.evaluate_expression(expr['right'])
-            op = expr['op']
+        elif expr_type == COMPARISON:
+            left = self.evaluate_expression(expr.left)
+            right = self.evaluate_expression(expr.right)
+            op = expr.op
             if op == 'LESS':
                 return left < right
             elif op == 'GREATER':
@@ -443,51 +595,183 @@ class KannadaInterpreter:
             elif op == 'GREATEREQUAL':
                 return left >= right
 
-        elif expr_type == 'unary_op':
-            operand = self.evaluate_expression(expr['operand'])
-            op = expr['op']
+        elif expr_type == UNARY_OP:
+            operand = self.evaluate_expression(expr.operand)
+            op = expr.op
             if op == 'NEGATE':
                 return -operand
             elif op == 'NOT':
                 return not operand
 
-        elif expr_type == 'function_call':
+        elif expr_type == FUNCTION_CALL:
             return self.call_function(expr)
 
+        elif expr_type == ARRAY:
+            return make_array([self.evaluate_expression(element) for element in expr.elements])
+
+        elif expr_type == INDEX:
+            return get_item(self.evaluate_expression(expr.value), self.evaluate_expression(expr.index))
+
+        elif expr_type == SLICE:
+            return get_slice(self.evaluate_expression(expr.value), self.evaluate_expression(expr.start),
+                             self.evaluate_expression(expr.stop))
+
+        return None
+
+    def run_plan(self, node, budget):
+        # A loop whose body only assigns (loops.py): collapsed when it
+        # reduces, else run on its compiled closures.
+        plan = node.plan
+        if plan.reduction is not None and budget is None and run_reduction(plan.reduction, self):
+            return None
+        condition, steps = plan.closures()
+        frame = self.frame
+        variables = self.variables
+        if condition is not None:
+            for _ in repeat(None) if budget is None else budget.iterations(self, body_cost(node.body)):
+                if not condition(self):
+                    break
+                for slot, name, value in steps:
+                    if slot >= 0:
+                        frame[slot] = value(self)
+                    else:
+                        variables[name] = value(self)
+            return None
+        start = int(node.start)
+        end = int(node.end)
+        counter = node.slot
+        for i in range(start, end) if budget is None else budget.iterations(self, body_cost(node.body), end, start):
+            if counter >= 0:
+                frame[counter] = i
+            else:
+                variables[node.var] = i
+            for slot, name, value in steps:
+                if slot >= 0:
+                    frame[slot] = value(self)
+                else:
+                    variables[name] = value(self)
         return None
 
+    def store(self, slot, name, value):
+        if slot >= 0:
+            self.frame[slot] = value
+        else:
+            self.variables[name] = value
+
     def call_function(self, node):
-        func_name = node['name']
+        func_name = node.name
+        if node.builtin:
+            return BUILTINS[func_name](*[self.evaluate_expression(arg) for arg in node.args])
         if func_name in self.functions:
             func_def = self.functions[func_name]
-            args = [self.evaluate_expression(arg) for arg in node['args']]
-            old_vars = self.variables.copy()
-            for i, param in enumerate(func_def['params']):
-                if i < len(args):
-                    self.variables[param] = args[i]
-                else:
-                    self.variables[param] = None
-            result = self.evaluate(func_def['body'])
-            self.variables = old_vars
-            if result and result.get('type') == 'return':
-                return result['value']
-            return None
+            return self.invoke(func_def, [self.evaluate_expression(arg) for arg in node.args])
         raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {func_name}")
 
-def run_compiler(code):
+    def invoke(self, func_def, args):
+        memo = self.memo
+        if memo is None or not func_def.memoized:
+            return self.run_function(func_def, args)
+        key, value = memo.lookup(func_def, func_def.name, args)
+        if value is MISSING:
+            value = self.run_function(func_def, args)
+            memo.store(func_def, key, value)
+        return value
+
+    def run_function(self, func_def, args):
+        # Tail calls run here in turn, each in a fresh frame, until one
+        # returns; a memoized one is called as usual.
+        old_frame = self.frame
+        try:
+            while True:
+                self.frame = new_frame(func_def, args)
+                if self.budget is not None and func_def.recursive:
+                    self.charge(func_def.body)
+                result = self.evaluate(func_def.body)
+                if result is not TAIL_CALL_SIGNAL:
+                    break
+                func_def, args = self.tail_call
+                self.tail_call = None
+                if func_def.memoized and self.memo is not None:
+                    return self.invoke(func_def, args)
+        finally:
+            self.frame = old_frame
+        if result is RETURN_SIGNAL:
+            value = self.return_value
+            self.return_value = None
+            return value
+        return None
+
+    def charge(self, body):
+        budget = self.budget
+        budget.countdown -= body_cost(body)
+        if budget.countdown <= 0:
+            budget.check(self)
+
+def prepare(ast, mode="closure", max_depth=None):
+    # Returns run(interpreter) executing `ast` in the given mode; the
+    # compiled form can be run any number of times. Every mode flushes the
+    # interpreter's output when the run ends, normally or not. `max_depth`
+    # is the stackless and vm modes' limit on nested KA calls
+    # (stackless.MAX_DEPTH by default); the other modes are bounded by the
+    # Python stack instead.
+    if mode == "tree":
+        def run(interpreter):
+            if interpreter.budget is not None:
+                interpreter.budget.start()
+            try:
+                interpreter.evaluate(ast)
+            finally:
+                interpreter.output.flush()
+        return run
+    elif mode == "closure":
+        from compiler import compile_program
+        return compile_program(ast)
+    elif mode == "python":
+        from transpiler import transpile
+        return transpile(ast).run
+    elif mode == "vm":
+        from vm import VirtualMachine, compile_bytecode
+        from stackless import MAX_DEPTH
+        code = compile_bytecode(ast)
+        depth = MAX_DEPTH if max_depth is None else max_depth
+
+        def run(interpreter):
+            VirtualMachine(interpreter, depth).run(code)
+        return run
+    elif mode == "stackless":
+        from stackless import StacklessProgram, MAX_DEPTH
+        return StacklessProgram(ast, MAX_DEPTH if max_depth is None else max_depth).run
+    raise ValueError(f"ಅಪರಿಚಿತ ವಿಧಾನ/Unknown execution mode: {mode}")
+
+def execute(ast, interpreter=None, mode="closure"):
+    if interpreter is None:
+        interpreter = KannadaInterpreter()
+    prepare(ast, mode)(interpreter)
+    return interpreter
+
+def format_error(e):
+    line = getattr(e, 'ka_line', None)
+    if line:
+        return f"ದೋಷ/Error (ಸಾಲು/line {line}): {str(e)}"
+    return f"ದೋಷ/Error: {str(e)}"
+
+def run_compiler(code, mode="closure", passes=(), budget=None, memoize=True, max_depth=None):
+    from parse_cache import default_cache
     try:
-        ast = parse(code)
-        if ast is None:
+        run = default_cache.prepared(code, mode, passes, max_depth)
+        if run is None:
             print("ದೋಷ/Error: Parsing failed due to syntax error")
             return
-        interpreter = KannadaInterpreter()
-        interpreter.evaluate(ast)
+        run(KannadaInterpreter(budget=budget, memoize=memoize))
         print()
         print("ಯಶಸ್ವಿಯಾಗಿ ಕಾರ್ಯಗತಗೊಂಡಿದೆ/Successfully executed")
-    except Exception as e:
-        print(f"ದೋಷ/Error: {str(e)}")
+    except (Exception, BudgetExceeded) as e:
+        print(format_error(e))
 
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--tables"]:
+        write_tables()
+        sys.exit()
     test_code = """
     ಪ್ರಾರಂಭಿಸಿ
         ಹೆಸರು = ಆಗು()
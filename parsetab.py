@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftPLUSMINUSleftTIMESDIVIDEFLOOR_DIVIDEMODULOrightPOWERleftGREATERLESSGREATEREQUALLESSEQUALEQUALNOTEQUALrightNOTAS ASSIGN BREAK CLASS COLON COMMA CONTINUE DEF DIVIDE ELIF ELSE END END_IF EQUAL EXCEPT FALSE FINALLY FLOOR_DIVIDE FOR FROM GLOBAL GREATER GREATEREQUAL ID IF IMPORT IN INPUT LESS LESSEQUAL LPAREN MINUS MODULO NEWLINE NONLOCAL NOT NOTEQUAL NUMBER PASS PLUS POWER PRINT RANGE RETURN RPAREN START STRING TIMES TRUE TRY WHILEprogram : START NEWLINE statements ENDstatements : statement\n                  | statements statement\n                  | statements NEWLINE\n                  | NEWLINEstatement : print_statement\n                 | assignment_statement NEWLINE\n                 | input_statement NEWLINE\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | function_def\n                 | function_call\n                 | return_statement\n                 | break_statement\n                 | continue_statement\n                 | pass_statement\n                 | try_except_statement\n                 | import_statement\n                 | class_definitionprint_statement : PRINT LPAREN expression_list RPAREN NEWLINEexpression_list : expression\n                       | expression_list COMMA expressionassignment_statement : ID ASSIGN expressioninput_statement : ID ASSIGN INPUT LPAREN RPARENexpression : expression PLUS term\n                  | expression MINUS term\n                  | expression POWER term\n                  | comparison\n                  | term\n                  | NOT expressionterm : term TIMES factor\n            | term DIVIDE factor\n            | term FLOOR_DIVIDE factor\n            | term MODULO factor\n            | factorfactor : NUMBER\n              | STRING\n              | TRUE\n              | FALSE\n              | ID\n              | LPAREN expression RPAREN\n              | MINUS factorcomparison : expression LESS expression\n                  | expression GREATER expression\n                  | expression EQUAL expression\n                  | expression NOTEQUAL expression\n                  | expression LESSEQUAL expression\n                  | expression GREATEREQUAL expressionif_statement : IF LPAREN expression RPAREN statements END\n                    | IF LPAREN expression RPAREN statements ELSE statements END\n                    | IF LPAREN expression RPAREN statements ELIF LPAREN expression RPAREN statements ELSE statements ENDwhile_statement : WHILE LPAREN expression RPAREN statements ENDfor_statement : FOR LPAREN ID IN RANGE LPAREN NUMBER COMMA NUMBER RPAREN RPAREN statements ENDfunction_def : DEF ID LPAREN parameter_list RPAREN COLON statementsparameter_list : empty\n                      | ID\n                      | parameter_list COMMA IDfunction_call : ID LPAREN argument_list RPARENargument_list : empty\n                     | expression\n                     | argument_list COMMA expressionreturn_statement : RETURN expressionbreak_statement : BREAKcontinue_statement : CONTINUEpass_statement : PASStry_except_statement : TRY COLON statements EXCEPT COLON statements\n                            | TRY COLON statements EXCEPT COLON statements FINALLY COLON statementsimport_statement : IMPORT ID\n                        | FROM ID IMPORT IDclass_definition : CLASS ID COLON statements\n                        | CLASS ID LPAREN ID RPAREN COLON statementsempty :'
+_lr_signature = 'leftPLUSMINUSleftTIMESDIVIDEFLOOR_DIVIDEMODULOrightPOWERleftGREATERLESSGREATEREQUALLESSEQUALEQUALNOTEQUALrightNOTleftLBRACKETAS ASSIGN BREAK CLASS COLON COMMA CONTINUE DEF DIVIDE ELIF ELSE END END_IF EQUAL EXCEPT FALSE FINALLY FLOOR_DIVIDE FOR FROM GLOBAL GREATER GREATEREQUAL ID IF IMPORT IN INPUT LBRACKET LESS LESSEQUAL LPAREN MINUS MODULO NEWLINE NONLOCAL NOT NOTEQUAL NUMBER PASS PLUS POWER PRINT RANGE RBRACKET RETURN RPAREN START STRING TIMES TRUE TRY WHILEprogram : START NEWLINE statements ENDstatements : statement\n                  | statements statement\n                  | statements NEWLINE\n                  | NEWLINEstatement : print_statement\n                 | assignment_statement NEWLINE\n                 | input_statement NEWLINE\n                 | if_statement\n                 | while_statement\n                 | for_statement\n                 | function_def\n                 | function_call\n                 | return_statement\n                 | break_statement\n                 | continue_statement\n                 | pass_statement\n                 | try_except_statement\n                 | import_statement\n                 | class_definitionprint_statement : PRINT LPAREN expression_list RPAREN NEWLINEexpression_list : expression\n                       | expression_list COMMA expressionassignment_statement : ID ASSIGN expressioninput_statement : ID ASSIGN INPUT LPAREN RPARENexpression : expression PLUS term\n                  | expression MINUS term\n                  | expression POWER term\n                  | comparison\n                  | term\n                  | NOT expressionterm : term TIMES factor\n            | term DIVIDE factor\n            | term FLOOR_DIVIDE factor\n            | term MODULO factor\n            | factorfactor : NUMBER\n              | STRING\n              | TRUE\n              | FALSE\n              | ID\n              | LPAREN expression RPAREN\n              | MINUS factor\n              | function_callfactor : LBRACKET argument_list RBRACKETfactor : factor LBRACKET expression RBRACKET\n              | factor LBRACKET slice_bound COLON slice_bound RBRACKETslice_bound : empty\n                   | expressioncomparison : expression LESS expression\n                  | expression GREATER expression\n                  | expression EQUAL expression\n                  | expression NOTEQUAL expression\n                  | expression LESSEQUAL expression\n                  | expression GREATEREQUAL expressionif_statement : IF LPAREN expression RPAREN statements END\n                    | IF LPAREN expression RPAREN statements ELSE statements END\n                    | IF LPAREN expression RPAREN statements ELIF LPAREN expression RPAREN statements ELSE statements ENDwhile_statement : WHILE LPAREN expression RPAREN statements ENDfor_statement : FOR LPAREN ID IN RANGE LPAREN NUMBER COMMA NUMBER RPAREN RPAREN statements ENDfunction_def : DEF ID LPAREN parameter_list RPAREN COLON statementsparameter_list : empty\n                      | ID\n                      | parameter_list COMMA IDfunction_call : ID LPAREN argument_list RPARENargument_list : empty\n                     | expression\n                     | argument_list COMMA expressionreturn_statement : RETURN expressionbreak_statement : BREAKcontinue_statement : CONTINUEpass_statement : PASStry_except_statement : TRY COLON statements EXCEPT COLON statements\n                            | TRY COLON statements EXCEPT COLON statements FINALLY COLON statementsimport_statement : IMPORT ID\n                        | FROM ID IMPORT IDclass_definition : CLASS ID COLON statements\n                        | CLASS ID LPAREN ID RPAREN COLON statementsempty :'
     
-_lr_action_items = {'START':([0,],[2,]),'$end':([1,37,],[0,-1,]),'NEWLINE':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,66,88,89,91,93,95,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,126,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[3,4,-5,36,-2,-6,39,40,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,4,-69,-24,-43,-31,36,4,124,-59,4,4,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,36,-21,-25,36,36,4,-50,4,-53,4,36,4,36,36,36,-51,4,4,36,36,4,4,36,36,-52,-54,]),'PRINT':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[22,-5,22,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,22,-69,-43,-31,22,22,-59,22,22,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,22,-21,22,22,22,-50,22,-53,22,22,22,22,22,22,-51,22,22,22,22,22,22,22,22,-52,-54,]),'ID':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,27,28,29,30,31,33,34,35,36,38,39,40,41,42,43,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,91,92,93,94,96,98,99,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,132,133,135,136,138,140,142,143,144,145,147,149,150,153,154,156,157,159,160,161,162,163,164,],[23,-5,23,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,47,58,-64,-65,-66,61,62,63,-4,-3,-7,-8,58,58,58,58,58,73,-63,-30,58,-29,58,-36,-37,-38,-39,-40,-41,58,23,-69,103,58,58,58,58,58,58,58,58,58,58,58,58,58,-43,-31,23,121,23,123,58,-59,58,23,23,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,23,-21,23,23,141,23,-50,23,-53,23,23,23,23,58,23,23,-51,23,23,23,23,23,23,23,23,-52,-54,]),'IF':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[24,-5,24,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,24,-69,-43,-31,24,24,-59,24,24,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,24,-21,24,24,24,-50,24,-53,24,24,24,24,24,24,-51,24,24,24,24,24,24,24,24,-52,-54,]),'WHILE':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[25,-5,25,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,25,-69,-43,-31,25,25,-59,25,25,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,25,-21,25,25,25,-50,25,-53,25,25,25,25,25,25,-51,25,25,25,25,25,25,25,25,-52,-54,]),'FOR':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[26,-5,26,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,26,-69,-43,-31,26,26,-59,26,26,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,26,-21,26,26,26,-50,26,-53,26,26,26,26,26,26,-51,26,26,26,26,26,26,26,26,-52,-54,]),'DEF':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[27,-5,27,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,27,-69,-43,-31,27,27,-59,27,27,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,27,-21,27,27,27,-50,27,-53,27,27,27,27,27,27,-51,27,27,27,27,27,27,27,27,-52,-54,]),'RETURN':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[28,-5,28,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,28,-69,-43,-31,28,28,-59,28,28,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,28,-21,28,28,28,-50,28,-53,28,28,28,28,28,28,-51,28,28,28,28,28,28,28,28,-52,-54,]),'BREAK':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[29,-5,29,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,29,-69,-43,-31,29,29,-59,29,29,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,29,-21,29,29,29,-50,29,-53,29,29,29,29,29,29,-51,29,29,29,29,29,29,29,29,-52,-54,]),'CONTINUE':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[30,-5,30,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,30,-69,-43,-31,30,30,-59,30,30,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,30,-21,30,30,30,-50,30,-53,30,30,30,30,30,30,-51,30,30,30,30,30,30,30,30,-52,-54,]),'PASS':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[31,-5,31,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,31,-69,-43,-31,31,31,-59,31,31,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,31,-21,31,31,31,-50,31,-53,31,31,31,31,31,31,-51,31,31,31,31,31,31,31,31,-52,-54,]),'TRY':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[32,-5,32,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,32,-69,-43,-31,32,32,-59,32,32,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,32,-21,32,32,32,-50,32,-53,32,32,32,32,32,32,-51,32,32,32,32,32,32,32,32,-52,-54,]),'IMPORT':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,62,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[33,-5,33,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,33,-69,92,-43,-31,33,33,-59,33,33,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,33,-21,33,33,33,-50,33,-53,33,33,33,33,33,33,-51,33,33,33,33,33,33,33,33,-52,-54,]),'FROM':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[34,-5,34,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,34,-69,-43,-31,34,34,-59,34,34,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,34,-21,34,34,34,-50,34,-53,34,34,34,34,34,34,-51,34,34,34,34,34,34,34,34,-52,-54,]),'CLASS':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,61,88,89,91,93,98,100,101,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,133,135,136,138,140,142,143,144,147,149,150,153,154,156,157,159,160,161,162,163,164,],[35,-5,35,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,35,-69,-43,-31,35,35,-59,35,35,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,35,-21,35,35,35,-50,35,-53,35,35,35,35,35,35,-51,35,35,35,35,35,35,35,35,-52,-54,]),'END':([4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,61,88,89,98,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,129,135,138,142,144,147,149,150,156,161,162,163,164,],[-5,37,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,-69,-43,-31,-59,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,-71,-21,135,138,-50,-53,-67,150,-55,-72,-51,-68,163,164,-52,-54,]),'EXCEPT':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,61,88,89,91,98,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,135,138,142,147,149,150,156,163,164,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,-69,-43,-31,120,-59,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,-71,-21,-50,-53,-67,-55,-72,-51,-68,-52,-54,]),'ELSE':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,61,88,89,98,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,135,138,142,147,149,150,156,157,163,164,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,-69,-43,-31,-59,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,-71,-21,136,-50,-53,-67,-55,-72,-51,-68,159,-52,-54,]),'ELIF':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,61,88,89,98,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,128,135,138,142,147,149,150,156,163,164,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,-69,-43,-31,-59,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,-71,-21,137,-50,-53,-67,-55,-72,-51,-68,-52,-54,]),'FINALLY':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,61,88,89,98,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,122,124,135,138,142,147,149,150,156,163,164,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-64,-65,-66,-4,-3,-7,-8,-63,-30,-29,-36,-37,-38,-39,-40,-41,-69,-43,-31,-59,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-70,-71,-21,-50,-53,148,-55,-72,-51,-68,-52,-54,]),'LPAREN':([22,23,24,25,26,28,41,42,43,44,45,47,50,52,59,63,67,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,130,137,145,],[41,43,44,45,46,59,59,59,59,59,59,74,59,59,59,94,97,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,139,145,59,]),'ASSIGN':([23,],[42,]),'NOT':([28,41,42,43,44,45,52,59,78,79,80,81,82,83,96,99,145,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'NUMBER':([28,41,42,43,44,45,50,52,59,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,139,145,152,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,146,54,155,]),'STRING':([28,41,42,43,44,45,50,52,59,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,145,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'TRUE':([28,41,42,43,44,45,50,52,59,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,145,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'FALSE':([28,41,42,43,44,45,50,52,59,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,145,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'MINUS':([28,41,42,43,44,45,48,49,50,51,52,53,54,55,56,57,58,59,65,66,70,71,72,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,96,99,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,145,151,],[50,50,50,50,50,50,76,-30,50,-29,50,-36,-37,-38,-39,-40,-41,50,76,76,76,76,76,50,50,50,50,50,50,50,50,50,50,50,50,50,-43,-31,76,50,50,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,76,76,50,76,]),'COLON':([32,63,120,131,134,148,],[60,93,133,140,143,153,]),'INPUT':([42,],[67,]),'RPAREN':([43,49,51,53,54,55,56,57,58,64,65,68,69,70,71,72,74,88,89,90,97,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,123,125,127,141,151,155,158,],[-73,-30,-29,-36,-37,-38,-39,-40,-41,95,-22,98,-60,-61,100,101,-73,-43,-31,119,126,-57,131,-56,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,134,-23,-62,-58,154,158,160,]),'COMMA':([43,49,51,53,54,55,56,57,58,64,65,68,69,70,74,88,89,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,141,146,],[-73,-30,-29,-36,-37,-38,-39,-40,-41,96,-22,99,-60,-61,-73,-43,-31,-57,132,-56,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,-23,-62,-58,152,]),'PLUS':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[75,-30,-29,-36,-37,-38,-39,-40,-41,75,75,75,75,75,-43,-31,75,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,75,75,75,]),'POWER':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[77,-30,-29,-36,-37,-38,-39,-40,-41,77,77,77,77,77,-43,-31,77,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,77,77,77,]),'LESS':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[78,-30,-29,-36,-37,-38,-39,-40,-41,78,78,78,78,78,-43,-31,78,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,78,78,78,]),'GREATER':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[79,-30,-29,-36,-37,-38,-39,-40,-41,79,79,79,79,79,-43,-31,79,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,79,79,79,]),'EQUAL':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[80,-30,-29,-36,-37,-38,-39,-40,-41,80,80,80,80,80,-43,-31,80,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,80,80,80,]),'NOTEQUAL':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[81,-30,-29,-36,-37,-38,-39,-40,-41,81,81,81,81,81,-43,-31,81,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,81,81,81,]),'LESSEQUAL':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[82,-30,-29,-36,-37,-38,-39,-40,-41,82,82,82,82,82,-43,-31,82,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,82,82,82,]),'GREATEREQUAL':([48,49,51,53,54,55,56,57,58,65,66,70,71,72,88,89,90,106,107,108,109,110,111,112,113,114,115,116,117,118,119,125,127,151,],[83,-30,-29,-36,-37,-38,-39,-40,-41,83,83,83,83,83,-43,-31,83,-26,-27,-28,-44,-45,-46,-47,-48,-49,-32,-33,-34,-35,-42,83,83,83,]),'TIMES':([49,53,54,55,56,57,58,88,106,107,108,115,116,117,118,119,],[84,-36,-37,-38,-39,-40,-41,-43,84,84,84,-32,-33,-34,-35,-42,]),'DIVIDE':([49,53,54,55,56,57,58,88,106,107,108,115,116,117,118,119,],[85,-36,-37,-38,-39,-40,-41,-43,85,85,85,-32,-33,-34,-35,-42,]),'FLOOR_DIVIDE':([49,53,54,55,56,57,58,88,106,107,108,115,116,117,118,119,],[86,-36,-37,-38,-39,-40,-41,-43,86,86,86,-32,-33,-34,-35,-42,]),'MODULO':([49,53,54,55,56,57,58,88,106,107,108,115,116,117,118,119,],[87,-36,-37,-38,-39,-40,-41,-43,87,87,87,-32,-33,-34,-35,-42,]),'IN':([73,],[102,]),'RANGE':([102,],[130,]),}
+_lr_action_items = {'START':([0,],[2,]),'$end':([1,37,],[0,-1,]),'NEWLINE':([2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,68,90,91,95,97,99,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,134,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[3,4,-5,36,-2,-6,39,40,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,4,-75,-24,-43,-31,36,4,132,-65,4,4,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,36,-21,-25,36,36,-46,4,-56,4,-59,4,36,4,36,36,-47,36,-57,4,4,36,36,4,4,36,36,-58,-60,]),'PRINT':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[22,-5,22,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,22,-75,-43,-31,22,22,-65,22,22,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,22,-21,22,22,-46,22,-56,22,-59,22,22,22,22,22,-47,22,-57,22,22,22,22,22,22,22,22,-58,-60,]),'ID':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,27,28,29,30,31,33,34,35,36,38,39,40,41,42,43,44,45,46,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,95,96,97,98,100,102,103,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,140,141,142,143,145,146,148,150,154,155,156,157,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[23,-5,23,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,47,58,-70,-71,-72,63,64,65,-4,-3,-7,-8,58,58,58,58,58,75,-69,-30,58,-29,58,-36,-37,-38,-39,-40,-41,58,-44,58,23,-75,107,58,58,58,58,58,58,58,58,58,58,58,58,58,-43,-31,58,23,129,23,131,58,-65,58,23,23,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,23,-21,23,23,151,-46,58,23,-56,23,-59,23,23,23,23,58,23,-47,23,-57,23,23,23,23,23,23,23,23,-58,-60,]),'IF':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[24,-5,24,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,24,-75,-43,-31,24,24,-65,24,24,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,24,-21,24,24,-46,24,-56,24,-59,24,24,24,24,24,-47,24,-57,24,24,24,24,24,24,24,24,-58,-60,]),'WHILE':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[25,-5,25,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,25,-75,-43,-31,25,25,-65,25,25,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,25,-21,25,25,-46,25,-56,25,-59,25,25,25,25,25,-47,25,-57,25,25,25,25,25,25,25,25,-58,-60,]),'FOR':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[26,-5,26,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,26,-75,-43,-31,26,26,-65,26,26,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,26,-21,26,26,-46,26,-56,26,-59,26,26,26,26,26,-47,26,-57,26,26,26,26,26,26,26,26,-58,-60,]),'DEF':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[27,-5,27,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,27,-75,-43,-31,27,27,-65,27,27,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,27,-21,27,27,-46,27,-56,27,-59,27,27,27,27,27,-47,27,-57,27,27,27,27,27,27,27,27,-58,-60,]),'RETURN':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[28,-5,28,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,28,-75,-43,-31,28,28,-65,28,28,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,28,-21,28,28,-46,28,-56,28,-59,28,28,28,28,28,-47,28,-57,28,28,28,28,28,28,28,28,-58,-60,]),'BREAK':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[29,-5,29,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,29,-75,-43,-31,29,29,-65,29,29,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,29,-21,29,29,-46,29,-56,29,-59,29,29,29,29,29,-47,29,-57,29,29,29,29,29,29,29,29,-58,-60,]),'CONTINUE':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[30,-5,30,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,30,-75,-43,-31,30,30,-65,30,30,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,30,-21,30,30,-46,30,-56,30,-59,30,30,30,30,30,-47,30,-57,30,30,30,30,30,30,30,30,-58,-60,]),'PASS':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[31,-5,31,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,31,-75,-43,-31,31,31,-65,31,31,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,31,-21,31,31,-46,31,-56,31,-59,31,31,31,31,31,-47,31,-57,31,31,31,31,31,31,31,31,-58,-60,]),'TRY':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[32,-5,32,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,32,-75,-43,-31,32,32,-65,32,32,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,32,-21,32,32,-46,32,-56,32,-59,32,32,32,32,32,-47,32,-57,32,32,32,32,32,32,32,32,-58,-60,]),'IMPORT':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,64,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[33,-5,33,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,33,-75,96,-43,-31,33,33,-65,33,33,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,33,-21,33,33,-46,33,-56,33,-59,33,33,33,33,33,-47,33,-57,33,33,33,33,33,33,33,33,-58,-60,]),'FROM':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[34,-5,34,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,34,-75,-43,-31,34,34,-65,34,34,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,34,-21,34,34,-46,34,-56,34,-59,34,34,34,34,34,-47,34,-57,34,34,34,34,34,34,34,34,-58,-60,]),'CLASS':([3,4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,62,63,90,91,95,97,102,104,105,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,143,145,146,148,150,154,155,156,159,160,162,163,166,167,169,170,172,173,174,175,176,177,],[35,-5,35,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,35,-75,-43,-31,35,35,-65,35,35,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,35,-21,35,35,-46,35,-56,35,-59,35,35,35,35,35,-47,35,-57,35,35,35,35,35,35,35,35,-58,-60,]),'END':([4,5,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,63,90,91,102,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,137,141,145,148,154,156,159,160,162,163,169,174,175,176,177,],[-5,37,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,-75,-43,-31,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,-77,-21,145,148,-46,-56,-59,-73,163,-61,-47,-78,-57,-74,176,177,-58,-60,]),'EXCEPT':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,63,90,91,95,102,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,141,145,148,154,159,160,162,163,169,176,177,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,-75,-43,-31,128,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,-77,-21,-46,-56,-59,-73,-61,-47,-78,-57,-74,-58,-60,]),'ELSE':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,63,90,91,102,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,141,145,148,154,159,160,162,163,169,170,176,177,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,-75,-43,-31,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,-77,-21,146,-46,-56,-59,-73,-61,-47,-78,-57,-74,172,-58,-60,]),'ELIF':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,63,90,91,102,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,136,141,145,148,154,159,160,162,163,169,176,177,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,-75,-43,-31,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,-77,-21,147,-46,-56,-59,-73,-61,-47,-78,-57,-74,-58,-60,]),'FINALLY':([4,6,7,10,11,12,13,14,15,16,17,18,19,20,21,29,30,31,36,38,39,40,48,49,51,53,54,55,56,57,58,60,63,90,91,102,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,129,130,132,141,145,148,154,159,160,162,163,169,176,177,],[-5,-2,-6,-9,-10,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-70,-71,-72,-4,-3,-7,-8,-69,-30,-29,-36,-37,-38,-39,-40,-41,-44,-75,-43,-31,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-76,-77,-21,-46,-56,-59,161,-61,-47,-78,-57,-74,-58,-60,]),'LPAREN':([22,23,24,25,26,28,41,42,43,44,45,47,50,52,58,59,61,65,69,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,138,142,147,157,],[41,43,44,45,46,59,59,59,59,59,59,76,59,59,43,59,59,98,101,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,149,59,157,59,]),'ASSIGN':([23,],[42,]),'NOT':([28,41,42,43,44,45,52,59,61,80,81,82,83,84,85,92,100,103,142,157,],[52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'NUMBER':([28,41,42,43,44,45,50,52,59,61,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,142,149,157,165,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,158,54,168,]),'STRING':([28,41,42,43,44,45,50,52,59,61,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,142,157,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'TRUE':([28,41,42,43,44,45,50,52,59,61,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,142,157,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'FALSE':([28,41,42,43,44,45,50,52,59,61,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,142,157,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'MINUS':([28,41,42,43,44,45,48,49,50,51,52,53,54,55,56,57,58,59,60,61,67,68,72,73,74,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,100,102,103,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,142,153,157,160,164,],[50,50,50,50,50,50,78,-30,50,-29,50,-36,-37,-38,-39,-40,-41,50,-44,50,78,78,78,78,78,50,50,50,50,50,50,50,50,50,50,50,50,50,-43,-31,50,78,50,-65,50,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,78,-42,-45,78,78,-46,50,78,50,-47,78,]),'LBRACKET':([28,41,42,43,44,45,50,52,53,54,55,56,57,58,59,60,61,77,78,79,80,81,82,83,84,85,86,87,88,89,90,92,100,102,103,119,120,121,122,126,127,141,142,157,160,],[61,61,61,61,61,61,61,61,92,-37,-38,-39,-40,-41,61,-44,61,61,61,61,61,61,61,61,61,61,61,61,61,61,92,61,61,-65,61,92,92,92,92,-42,-45,-46,61,61,-47,]),'COLON':([32,49,51,53,54,55,56,57,58,60,65,90,91,92,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,139,141,144,160,161,],[62,-30,-29,-36,-37,-38,-39,-40,-41,-44,97,-43,-31,-79,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-49,142,-48,-42,-45,143,150,-46,155,-47,166,]),'INPUT':([42,],[69,]),'RPAREN':([43,49,51,53,54,55,56,57,58,60,66,67,70,71,72,73,74,76,90,91,93,101,102,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,131,133,135,141,151,160,164,168,171,],[-79,-30,-29,-36,-37,-38,-39,-40,-41,-44,99,-22,102,-66,-67,104,105,-79,-43,-31,126,134,-65,-63,139,-62,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,144,-23,-68,-46,-64,-47,167,171,173,]),'COMMA':([43,49,51,53,54,55,56,57,58,60,61,66,67,70,71,72,76,90,91,94,102,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,126,127,133,135,141,151,158,160,],[-79,-30,-29,-36,-37,-38,-39,-40,-41,-44,-79,100,-22,103,-66,-67,-79,-43,-31,103,-65,-63,140,-62,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,-42,-45,-23,-68,-46,-64,165,-47,]),'PLUS':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[77,-30,-29,-36,-37,-38,-39,-40,-41,-44,77,77,77,77,77,-43,-31,77,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,77,-42,-45,77,77,-46,77,-47,77,]),'POWER':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[79,-30,-29,-36,-37,-38,-39,-40,-41,-44,79,79,79,79,79,-43,-31,79,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,79,-42,-45,79,79,-46,79,-47,79,]),'LESS':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[80,-30,-29,-36,-37,-38,-39,-40,-41,-44,80,80,80,80,80,-43,-31,80,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,80,-42,-45,80,80,-46,80,-47,80,]),'GREATER':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[81,-30,-29,-36,-37,-38,-39,-40,-41,-44,81,81,81,81,81,-43,-31,81,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,81,-42,-45,81,81,-46,81,-47,81,]),'EQUAL':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[82,-30,-29,-36,-37,-38,-39,-40,-41,-44,82,82,82,82,82,-43,-31,82,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,82,-42,-45,82,82,-46,82,-47,82,]),'NOTEQUAL':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[83,-30,-29,-36,-37,-38,-39,-40,-41,-44,83,83,83,83,83,-43,-31,83,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,83,-42,-45,83,83,-46,83,-47,83,]),'LESSEQUAL':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[84,-30,-29,-36,-37,-38,-39,-40,-41,-44,84,84,84,84,84,-43,-31,84,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,84,-42,-45,84,84,-46,84,-47,84,]),'GREATEREQUAL':([48,49,51,53,54,55,56,57,58,60,67,68,72,73,74,90,91,93,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,126,127,133,135,141,153,160,164,],[85,-30,-29,-36,-37,-38,-39,-40,-41,-44,85,85,85,85,85,-43,-31,85,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,85,-42,-45,85,85,-46,85,-47,85,]),'RBRACKET':([49,51,53,54,55,56,57,58,60,61,71,72,90,91,94,102,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,127,135,141,142,152,153,160,],[-30,-29,-36,-37,-38,-39,-40,-41,-44,-79,-66,-67,-43,-31,127,-65,-26,-27,-28,-50,-51,-52,-53,-54,-55,-32,-33,-34,-35,141,-48,-42,-45,-68,-46,-79,160,-49,-47,]),'TIMES':([49,53,54,55,56,57,58,60,90,102,110,111,112,119,120,121,122,126,127,141,160,],[86,-36,-37,-38,-39,-40,-41,-44,-43,-65,86,86,86,-32,-33,-34,-35,-42,-45,-46,-47,]),'DIVIDE':([49,53,54,55,56,57,58,60,90,102,110,111,112,119,120,121,122,126,127,141,160,],[87,-36,-37,-38,-39,-40,-41,-44,-43,-65,87,87,87,-32,-33,-34,-35,-42,-45,-46,-47,]),'FLOOR_DIVIDE':([49,53,54,55,56,57,58,60,90,102,110,111,112,119,120,121,122,126,127,141,160,],[88,-36,-37,-38,-39,-40,-41,-44,-43,-65,88,88,88,-32,-33,-34,-35,-42,-45,-46,-47,]),'MODULO':([49,53,54,55,56,57,58,60,90,102,110,111,112,119,120,121,122,126,127,141,160,],[89,-36,-37,-38,-39,-40,-41,-44,-43,-65,89,89,89,-32,-33,-34,-35,-42,-45,-46,-47,]),'IN':([75,],[106,]),'RANGE':([106,],[138,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statements':([3,60,93,100,101,133,136,140,143,153,154,159,160,],[5,91,122,128,129,142,144,147,149,156,157,161,162,]),'statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[6,38,6,38,6,6,6,38,38,38,6,6,6,38,6,38,38,38,6,6,38,38,6,6,38,38,]),'print_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'assignment_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'input_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'if_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'while_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'for_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'function_def':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'function_call':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'return_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'break_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'continue_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'pass_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'try_except_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'import_statement':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'class_definition':([3,5,60,91,93,100,101,122,128,129,133,136,140,142,143,144,147,149,153,154,156,157,159,160,161,162,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'expression':([28,41,42,43,44,45,52,59,78,79,80,81,82,83,96,99,145,],[48,65,66,70,71,72,89,90,109,110,111,112,113,114,125,127,151,]),'term':([28,41,42,43,44,45,52,59,75,76,77,78,79,80,81,82,83,96,99,145,],[49,49,49,49,49,49,49,49,106,107,108,49,49,49,49,49,49,49,49,49,]),'comparison':([28,41,42,43,44,45,52,59,78,79,80,81,82,83,96,99,145,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'factor':([28,41,42,43,44,45,50,52,59,75,76,77,78,79,80,81,82,83,84,85,86,87,96,99,145,],[53,53,53,53,53,53,88,53,53,53,53,53,53,53,53,53,53,53,115,116,117,118,53,53,53,]),'expression_list':([41,],[64,]),'argument_list':([43,],[68,]),'empty':([43,74,],[69,105,]),'parameter_list':([74,],[104,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statements':([3,62,97,104,105,143,146,150,155,166,167,172,173,],[5,95,130,136,137,154,156,159,162,169,170,174,175,]),'statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[6,38,6,38,6,6,6,38,38,38,6,6,6,38,6,38,38,38,6,6,38,38,6,6,38,38,]),'print_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'assignment_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'input_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'if_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'while_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'for_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'function_def':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'function_call':([3,5,28,41,42,43,44,45,50,52,59,61,62,77,78,79,80,81,82,83,84,85,86,87,88,89,92,95,97,100,103,104,105,130,136,137,142,143,146,150,154,155,156,157,159,162,166,167,169,170,172,173,174,175,],[14,14,60,60,60,60,60,60,60,60,60,60,14,60,60,60,60,60,60,60,60,60,60,60,60,60,60,14,14,60,60,14,14,14,14,14,60,14,14,14,14,14,14,60,14,14,14,14,14,14,14,14,14,14,]),'return_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'break_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'continue_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'pass_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'try_except_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'import_statement':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'class_definition':([3,5,62,95,97,104,105,130,136,137,143,146,150,154,155,156,159,162,166,167,169,170,172,173,174,175,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'expression':([28,41,42,43,44,45,52,59,61,80,81,82,83,84,85,92,100,103,142,157,],[48,67,68,72,73,74,91,93,72,113,114,115,116,117,118,123,133,135,153,164,]),'term':([28,41,42,43,44,45,52,59,61,77,78,79,80,81,82,83,84,85,92,100,103,142,157,],[49,49,49,49,49,49,49,49,49,110,111,112,49,49,49,49,49,49,49,49,49,49,49,]),'comparison':([28,41,42,43,44,45,52,59,61,80,81,82,83,84,85,92,100,103,142,157,],[51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'factor':([28,41,42,43,44,45,50,52,59,61,77,78,79,80,81,82,83,84,85,86,87,88,89,92,100,103,142,157,],[53,53,53,53,53,53,90,53,53,53,53,53,53,53,53,53,53,53,53,119,120,121,122,53,53,53,53,53,]),'expression_list':([41,],[66,]),'argument_list':([43,61,],[70,94,]),'empty':([43,61,76,92,142,],[71,71,109,125,125,]),'parameter_list':([76,],[108,]),'slice_bound':([92,142,],[124,152,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,77 +27,83 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> START NEWLINE statements END','program',4,'p_program','parser.py',13),
-  ('statements -> statement','statements',1,'p_statements','parser.py',17),
-  ('statements -> statements statement','statements',2,'p_statements','parser.py',18),
-  ('statements -> statements NEWLINE','statements',2,'p_statements','parser.py',19),
-  ('statements -> NEWLINE','statements',1,'p_statements','parser.py',20),
-  ('statement -> print_statement','statement',1,'p_statement','parser.py',29),
-  ('statement -> assignment_statement NEWLINE','statement',2,'p_statement','parser.py',30),
-  ('statement -> input_statement NEWLINE','statement',2,'p_statement','parser.py',31),
-  ('statement -> if_statement','statement',1,'p_statement','parser.py',32),
-  ('statement -> while_statement','statement',1,'p_statement','parser.py',33),
-  ('statement -> for_statement','statement',1,'p_statement','parser.py',34),
-  ('statement -> function_def','statement',1,'p_statement','parser.py',35),
-  ('statement -> function_call','statement',1,'p_statement','parser.py',36),
-  ('statement -> return_statement','statement',1,'p_statement','parser.py',37),
-  ('statement -> break_statement','statement',1,'p_statement','parser.py',38),
-  ('statement -> continue_statement','statement',1,'p_statement','parser.py',39),
-  ('statement -> pass_statement','statement',1,'p_statement','parser.py',40),
-  ('statement -> try_except_statement','statement',1,'p_statement','parser.py',41),
-  ('statement -> import_statement','statement',1,'p_statement','parser.py',42),
-  ('statement -> class_definition','statement',1,'p_statement','parser.py',43),
-  ('print_statement -> PRINT LPAREN expression_list RPAREN NEWLINE','print_statement',5,'p_print_statement','parser.py',47),
-  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',51),
-  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',52),
-  ('assignment_statement -> ID ASSIGN expression','assignment_statement',3,'p_assignment_statement','parser.py',59),
-  ('input_statement -> ID ASSIGN INPUT LPAREN RPAREN','input_statement',5,'p_input_statement','parser.py',63),
-  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',67),
-  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',68),
-  ('expression -> expression POWER term','expression',3,'p_expression','parser.py',69),
-  ('expression -> comparison','expression',1,'p_expression','parser.py',70),
-  ('expression -> term','expression',1,'p_expression','parser.py',71),
-  ('expression -> NOT expression','expression',2,'p_expression','parser.py',72),
-  ('term -> term TIMES factor','term',3,'p_term','parser.py',81),
-  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',82),
-  ('term -> term FLOOR_DIVIDE factor','term',3,'p_term','parser.py',83),
-  ('term -> term MODULO factor','term',3,'p_term','parser.py',84),
-  ('term -> factor','term',1,'p_term','parser.py',85),
-  ('factor -> NUMBER','factor',1,'p_factor','parser.py',92),
-  ('factor -> STRING','factor',1,'p_factor','parser.py',93),
-  ('factor -> TRUE','factor',1,'p_factor','parser.py',94),
-  ('factor -> FALSE','factor',1,'p_factor','parser.py',95),
-  ('factor -> ID','factor',1,'p_factor','parser.py',96),
-  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',97),
-  ('factor -> MINUS factor','factor',2,'p_factor','parser.py',98),
-  ('comparison -> expression LESS expression','comparison',3,'p_comparison','parser.py',134),
-  ('comparison -> expression GREATER expression','comparison',3,'p_comparison','parser.py',135),
-  ('comparison -> expression EQUAL expression','comparison',3,'p_comparison','parser.py',136),
-  ('comparison -> expression NOTEQUAL expression','comparison',3,'p_comparison','parser.py',137),
-  ('comparison -> expression LESSEQUAL expression','comparison',3,'p_comparison','parser.py',138),
-  ('comparison -> expression GREATEREQUAL expression','comparison',3,'p_comparison','parser.py',139),
-  ('if_statement -> IF LPAREN expression RPAREN statements END','if_statement',6,'p_if_statement','parser.py',151),
-  ('if_statement -> IF LPAREN expression RPAREN statements ELSE statements END','if_statement',8,'p_if_statement','parser.py',152),
-  ('if_statement -> IF LPAREN expression RPAREN statements ELIF LPAREN expression RPAREN statements ELSE statements END','if_statement',13,'p_if_statement','parser.py',153),
-  ('while_statement -> WHILE LPAREN expression RPAREN statements END','while_statement',6,'p_while_statement','parser.py',163),
-  ('for_statement -> FOR LPAREN ID IN RANGE LPAREN NUMBER COMMA NUMBER RPAREN RPAREN statements END','for_statement',13,'p_for_statement','parser.py',167),
-  ('function_def -> DEF ID LPAREN parameter_list RPAREN COLON statements','function_def',7,'p_function_def','parser.py',171),
-  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',175),
-  ('parameter_list -> ID','parameter_list',1,'p_parameter_list','parser.py',176),
-  ('parameter_list -> parameter_list COMMA ID','parameter_list',3,'p_parameter_list','parser.py',177),
-  ('function_call -> ID LPAREN argument_list RPAREN','function_call',4,'p_function_call','parser.py',186),
-  ('argument_list -> empty','argument_list',1,'p_argument_list','parser.py',190),
-  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',191),
-  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',192),
-  ('return_statement -> RETURN expression','return_statement',2,'p_return_statement','parser.py',201),
-  ('break_statement -> BREAK','break_statement',1,'p_break_statement','parser.py',205),
-  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','parser.py',209),
-  ('pass_statement -> PASS','pass_statement',1,'p_pass_statement','parser.py',213),
-  ('try_except_statement -> TRY COLON statements EXCEPT COLON statements','try_except_statement',6,'p_try_except_statement','parser.py',217),
-  ('try_except_statement -> TRY COLON statements EXCEPT COLON statements FINALLY COLON statements','try_except_statement',9,'p_try_except_statement','parser.py',218),
-  ('import_statement -> IMPORT ID','import_statement',2,'p_import_statement','parser.py',225),
-  ('import_statement -> FROM ID IMPORT ID','import_statement',4,'p_import_statement','parser.py',226),
-  ('class_definition -> CLASS ID COLON statements','class_definition',4,'p_class_definition','parser.py',233),
-  ('class_definition -> CLASS ID LPAREN ID RPAREN COLON statements','class_definition',7,'p_class_definition','parser.py',234),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',241),
+  ('program -> START NEWLINE statements END','program',4,'p_program','parser.py',31),
+  ('statements -> statement','statements',1,'p_statements','parser.py',35),
+  ('statements -> statements statement','statements',2,'p_statements','parser.py',36),
+  ('statements -> statements NEWLINE','statements',2,'p_statements','parser.py',37),
+  ('statements -> NEWLINE','statements',1,'p_statements','parser.py',38),
+  ('statement -> print_statement','statement',1,'p_statement','parser.py',49),
+  ('statement -> assignment_statement NEWLINE','statement',2,'p_statement','parser.py',50),
+  ('statement -> input_statement NEWLINE','statement',2,'p_statement','parser.py',51),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',52),
+  ('statement -> while_statement','statement',1,'p_statement','parser.py',53),
+  ('statement -> for_statement','statement',1,'p_statement','parser.py',54),
+  ('statement -> function_def','statement',1,'p_statement','parser.py',55),
+  ('statement -> function_call','statement',1,'p_statement','parser.py',56),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',57),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',58),
+  ('statement -> continue_statement','statement',1,'p_statement','parser.py',59),
+  ('statement -> pass_statement','statement',1,'p_statement','parser.py',60),
+  ('statement -> try_except_statement','statement',1,'p_statement','parser.py',61),
+  ('statement -> import_statement','statement',1,'p_statement','parser.py',62),
+  ('statement -> class_definition','statement',1,'p_statement','parser.py',63),
+  ('print_statement -> PRINT LPAREN expression_list RPAREN NEWLINE','print_statement',5,'p_print_statement','parser.py',67),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',71),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',72),
+  ('assignment_statement -> ID ASSIGN expression','assignment_statement',3,'p_assignment_statement','parser.py',80),
+  ('input_statement -> ID ASSIGN INPUT LPAREN RPAREN','input_statement',5,'p_input_statement','parser.py',84),
+  ('expression -> expression PLUS term','expression',3,'p_expression','parser.py',88),
+  ('expression -> expression MINUS term','expression',3,'p_expression','parser.py',89),
+  ('expression -> expression POWER term','expression',3,'p_expression','parser.py',90),
+  ('expression -> comparison','expression',1,'p_expression','parser.py',91),
+  ('expression -> term','expression',1,'p_expression','parser.py',92),
+  ('expression -> NOT expression','expression',2,'p_expression','parser.py',93),
+  ('term -> term TIMES factor','term',3,'p_term','parser.py',102),
+  ('term -> term DIVIDE factor','term',3,'p_term','parser.py',103),
+  ('term -> term FLOOR_DIVIDE factor','term',3,'p_term','parser.py',104),
+  ('term -> term MODULO factor','term',3,'p_term','parser.py',105),
+  ('term -> factor','term',1,'p_term','parser.py',106),
+  ('factor -> NUMBER','factor',1,'p_factor','parser.py',113),
+  ('factor -> STRING','factor',1,'p_factor','parser.py',114),
+  ('factor -> TRUE','factor',1,'p_factor','parser.py',115),
+  ('factor -> FALSE','factor',1,'p_factor','parser.py',116),
+  ('factor -> ID','factor',1,'p_factor','parser.py',117),
+  ('factor -> LPAREN expression RPAREN','factor',3,'p_factor','parser.py',118),
+  ('factor -> MINUS factor','factor',2,'p_factor','parser.py',119),
+  ('factor -> function_call','factor',1,'p_factor','parser.py',120),
+  ('factor -> LBRACKET argument_list RBRACKET','factor',3,'p_factor_array','parser.py',158),
+  ('factor -> factor LBRACKET expression RBRACKET','factor',4,'p_factor_index','parser.py',162),
+  ('factor -> factor LBRACKET slice_bound COLON slice_bound RBRACKET','factor',6,'p_factor_index','parser.py',163),
+  ('slice_bound -> empty','slice_bound',1,'p_slice_bound','parser.py',170),
+  ('slice_bound -> expression','slice_bound',1,'p_slice_bound','parser.py',171),
+  ('comparison -> expression LESS expression','comparison',3,'p_comparison','parser.py',175),
+  ('comparison -> expression GREATER expression','comparison',3,'p_comparison','parser.py',176),
+  ('comparison -> expression EQUAL expression','comparison',3,'p_comparison','parser.py',177),
+  ('comparison -> expression NOTEQUAL expression','comparison',3,'p_comparison','parser.py',178),
+  ('comparison -> expression LESSEQUAL expression','comparison',3,'p_comparison','parser.py',179),
+  ('comparison -> expression GREATEREQUAL expression','comparison',3,'p_comparison','parser.py',180),
+  ('if_statement -> IF LPAREN expression RPAREN statements END','if_statement',6,'p_if_statement','parser.py',192),
+  ('if_statement -> IF LPAREN expression RPAREN statements ELSE statements END','if_statement',8,'p_if_statement','parser.py',193),
+  ('if_statement -> IF LPAREN expression RPAREN statements ELIF LPAREN expression RPAREN statements ELSE statements END','if_statement',13,'p_if_statement','parser.py',194),
+  ('while_statement -> WHILE LPAREN expression RPAREN statements END','while_statement',6,'p_while_statement','parser.py',204),
+  ('for_statement -> FOR LPAREN ID IN RANGE LPAREN NUMBER COMMA NUMBER RPAREN RPAREN statements END','for_statement',13,'p_for_statement','parser.py',208),
+  ('function_def -> DEF ID LPAREN parameter_list RPAREN COLON statements','function_def',7,'p_function_def','parser.py',212),
+  ('parameter_list -> empty','parameter_list',1,'p_parameter_list','parser.py',216),
+  ('parameter_list -> ID','parameter_list',1,'p_parameter_list','parser.py',217),
+  ('parameter_list -> parameter_list COMMA ID','parameter_list',3,'p_parameter_list','parser.py',218),
+  ('function_call -> ID LPAREN argument_list RPAREN','function_call',4,'p_function_call','parser.py',228),
+  ('argument_list -> empty','argument_list',1,'p_argument_list','parser.py',232),
+  ('argument_list -> expression','argument_list',1,'p_argument_list','parser.py',233),
+  ('argument_list -> argument_list COMMA expression','argument_list',3,'p_argument_list','parser.py',234),
+  ('return_statement -> RETURN expression','return_statement',2,'p_return_statement','parser.py',244),
+  ('break_statement -> BREAK','break_statement',1,'p_break_statement','parser.py',248),
+  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','parser.py',252),
+  ('pass_statement -> PASS','pass_statement',1,'p_pass_statement','parser.py',256),
+  ('try_except_statement -> TRY COLON statements EXCEPT COLON statements','try_except_statement',6,'p_try_except_statement','parser.py',260),
+  ('try_except_statement -> TRY COLON statements EXCEPT COLON statements FINALLY COLON statements','try_except_statement',9,'p_try_except_statement','parser.py',261),
+  ('import_statement -> IMPORT ID','import_statement',2,'p_import_statement','parser.py',268),
+  ('import_statement -> FROM ID IMPORT ID','import_statement',4,'p_import_statement','parser.py',269),
+  ('class_definition -> CLASS ID COLON statements','class_definition',4,'p_class_definition','parser.py',276),
+  ('class_definition -> CLASS ID LPAREN ID RPAREN COLON statements','class_definition',7,'p_class_definition','parser.py',277),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',284),
 ]
@@ -0,0 +1,171 @@
+import argparse
+import json
+import sys
+import time
+
+from parser import KannadaInterpreter, parse_file, prepare, format_error
+
+
+# Deterministic profiler for KA programs. ProfilingInterpreter runs a
+# program the way KannadaInterpreter does (tree mode) and times every
+# statement it evaluates and every KA function it calls:
+#
+#   per source line   hits, cumulative time (the statement and all it runs,
+#                     counted once when a line is re-entered by recursion)
+#                     and self time (less the statements nested in it,
+#                     including the bodies of functions it calls)
+#   per KA function   calls, cumulative time and self time (less the calls
+#                     it makes); arguments are evaluated by the caller
+#
+# A tail call runs in place of the call that makes it (see resolver.py), so
+# it counts as part of that call rather than as a call of its own.
+#
+# The timer's own cost is part of every self time, so compare lines with
+# each other rather than with an unprofiled run.
+#
+# python profiler.py program.kn [--json profile.json]
+#                               [--sort self|cumulative|hits] [--limit N] [--no-memo]
+#
+# The program runs with its output on stdout; the report goes to stderr.
+
+SORT_KEYS = {"hits": 0, "cumulative": 1, "self": 2}
+
+
+def _record(stats, elapsed, nested, active, key):
+    stats[0] += 1
+    stats[2] += elapsed - nested
+    depth = active[key] - 1
+    active[key] = depth
+    if not depth:
+        stats[1] += elapsed
+
+
+class ProfilingInterpreter(KannadaInterpreter):
+    def __init__(self, output=None, budget=None, memoize=True, timer=time.perf_counter):
+        # Specialized loops would run their bodies unseen.
+        super().__init__(output, budget, memoize, specialize=False)
+        self.timer = timer
+        self.total = 0.0
+        # line -> [hits, cumulative, self]; name -> [calls, cumulative,
+        # self, line of the definition].
+        self.line_stats = {}
+        self.function_stats = {}
+        # Time taken by nested statements (calls), one entry per statement
+        # (call) under way, and how deeply each line (function) is active.
+        self._nested_statements = []
+        self._nested_calls = []
+        self._active_lines = {}
+        self._active_functions = {}
+
+    def run(self, ast):
+        start = self.timer()
+        try:
+            prepare(ast, "tree")(self)
+        finally:
+            self.total += self.timer() - start
+        return self
+
+    def evaluate_statement(self, node):
+        if not node:
+            return None
+        line = node.line
+        stats = self.line_stats.get(line)
+        if stats is None:
+            stats = self.line_stats[line] = [0, 0.0, 0.0]
+        active = self._active_lines
+        active[line] = active.get(line, 0) + 1
+        nested = self._nested_statements
+        nested.append(0.0)
+        start = self.timer()
+        try:
+            return super().evaluate_statement(node)
+        finally:
+            elapsed = self.timer() - start
+            _record(stats, elapsed, nested.pop(), active, line)
+            if nested:
+                nested[-1] += elapsed
+
+    def invoke(self, func_def, args):
+        name = func_def.name
+        stats = self.function_stats.get(name)
+        if stats is None:
+            stats = self.function_stats[name] = [0, 0.0, 0.0, func_def.line]
+        active = self._active_functions
+        active[name] = active.get(name, 0) + 1
+        nested = self._nested_calls
+        nested.append(0.0)
+        start = self.timer()
+        try:
+            return super().invoke(func_def, args)
+        finally:
+            elapsed = self.timer() - start
+            _record(stats, elapsed, nested.pop(), active, name)
+            if nested:
+                nested[-1] += elapsed
+
+    def results(self, sort="self", source=None):
+        # The profile as plain data, lines and functions ordered by `sort`
+        # (most first); with the program's source each line carries its text.
+        index = SORT_KEYS[sort]
+        source_lines = source.split("\n") if source is not None else None
+        lines = []
+        for line, (hits, cumulative, self_time) in sorted(
+                self.line_stats.items(), key=lambda item: item[1][index], reverse=True):
+            entry = {"line": line, "hits": hits, "cumulative": cumulative, "self": self_time}
+            if source_lines is not None and 0 < line <= len(source_lines):
+                entry["source"] = source_lines[line - 1].strip()
+            lines.append(entry)
+        functions = [
+            {"name": name, "line": line, "calls": calls, "cumulative": cumulative, "self": self_time}
+            for name, (calls, cumulative, self_time, line) in sorted(
+                self.function_stats.items(), key=lambda item: item[1][index], reverse=True)
+        ]
+        return {"total": self.total, "sort": sort, "lines": lines, "functions": functions}
+
+    def report(self, source=None, sort="self", limit=None):
+        results = self.results(sort, source)
+        rows = [f"total {results['total']:.4f} s, sorted by {sort}", ""]
+        rows.append(f"{'line':>6} {'hits':>10} {'cumulative s':>13} {'self s':>10}  source")
+        for entry in results["lines"][:limit]:
+            rows.append(f"{entry['line']:>6} {entry['hits']:>10} {entry['cumulative']:>13.4f} "
+                        f"{entry['self']:>10.4f}  {entry.get('source', '')}")
+        functions = results["functions"][:limit]
+        if functions:
+            width = max(8, max(len(entry["name"]) for entry in functions))
+            rows.append("")
+            rows.append(f"{'function':<{width}} {'calls':>10} {'cumulative s':>13} {'self s':>10}  line")
+            for entry in functions:
+                rows.append(f"{entry['name']:<{width}} {entry['calls']:>10} {entry['cumulative']:>13.4f} "
+                            f"{entry['self']:>10.4f}  {entry['line']}")
+        return "\n".join(rows)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Profile a KA-Lang program line by line")
+    arg_parser.add_argument("program", help=".kn file to run")
+    arg_parser.add_argument("--json", help="also write the profile to this JSON file")
+    arg_parser.add_argument("--sort", default="self", choices=list(SORT_KEYS))
+    arg_parser.add_argument("--limit", type=int, default=None, help="most lines and functions to list")
+    arg_parser.add_argument("--no-memo", action="store_true", help="do not memoize pure recursive functions")
+    args = arg_parser.parse_args()
+    ast = parse_file(args.program)
+    if ast is None:
+        sys.exit(1)
+    with open(args.program, encoding="utf-8") as program:
+        source = program.read()
+    interpreter = ProfilingInterpreter(memoize=not args.no_memo)
+    try:
+        interpreter.run(ast)
+    except Exception as e:
+        print(format_error(e))
+    print(file=sys.stderr)
+    print(interpreter.report(source, args.sort, args.limit), file=sys.stderr)
+    if args.json:
+        results = interpreter.results(args.sort, source)
+        results["program"] = args.program
+        with open(args.json, "w", encoding="utf-8") as output:
+            json.dump(results, output, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+from ast_nodes import (
+    Node, PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, TRY_EXCEPT, IMPORT,
+    FROM_IMPORT, CLASS, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP, ARRAY, INDEX, SLICE,
+)
+from arrays import BUILTINS
+from loops import plan_loop
+
+
+# Assigns function locals to indexed frame slots. Inside a function body
+# its parameters and every name it assigns (assignment, input, for
+# variable) are locals; all other names, and every name used outside a
+# function, live in the interpreter's globals table. Nodes that name a
+# variable get `slot` set to the local index, or GLOBAL. A local read
+# before the function assigns it has the global of that name, if there is
+# one; functions list in `shadowed` the locals other than parameters that
+# share their name with a global.
+#
+# Function definitions also get `recursive`: whether a call of the function
+# can lead back to a function of the same name. Calls are by name, so every
+# definition of a name counts; only these calls can repeat without a loop,
+# and only they are charged to an execution budget (budget.py).
+#
+# And `pure`: the body neither prints, reads input, announces (import,
+# class) nor defines a function, uses no global variable (nor a shadowing
+# local, which may read one), and calls only
+# names with a single definition, itself pure. Such a call depends on its
+# arguments alone, so its result may be remembered (memo.py).
+#
+# A return of a call in a function body, outside any try block, is a tail
+# call (`tail`): the backends run it in place of the returning call rather
+# than inside it, so tail recursion needs no stack. Functions are
+# `memoized` when pure and recursive and they make no tail calls, which a
+# memo table around each call would turn back into nested ones.
+#
+# Calls of a builtin (arrays.BUILTINS) that the program defines no function
+# for are `builtin`: they run the Python function directly, are never tail
+# calls and leave the caller pure.
+#
+# Loops get `plan` from loops.plan_loop(): how tree and closure mode may
+# specialize them, or None.
+
+GLOBAL = -1
+
+
+class _Unset:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNSET"
+
+
+# Value of a local slot that has not been assigned yet.
+UNSET = _Unset()
+
+
+def resolve(ast):
+    if ast is not None:
+        _resolve_block(ast, None)
+        _mark_functions(ast)
+        _mark_loops(ast)
+    return ast
+
+
+def _mark_functions(ast):
+    definitions = []
+    call_nodes = []
+    _collect_calls(ast, definitions, set(), call_nodes)
+    global_names = assigned_names(ast)
+    for node, _ in definitions:
+        node.shadowed = frozenset(name for name in node.local_names[len(node.params):] if name in global_names)
+    defined = {node.name for node, _ in definitions}
+    for call in call_nodes:
+        call.builtin = call.name in BUILTINS and call.name not in defined
+    for _, called in definitions:
+        called.difference_update(name for name in BUILTINS if name not in defined)
+    calls = {}
+    for node, called in definitions:
+        calls.setdefault(node.name, set()).update(called)
+    for node, _ in definitions:
+        seen = set()
+        pending = list(calls[node.name])
+        while pending:
+            name = pending.pop()
+            if name not in seen:
+                seen.add(name)
+                pending.extend(calls.get(name, ()))
+        node.recursive = node.name in seen
+
+    # Start from every definition that touches no state itself and drop
+    # those calling anything but a pure function until none is left to drop.
+    definitions_of = {}
+    for node, _ in definitions:
+        definitions_of[node.name] = definitions_of.get(node.name, 0) + 1
+    pure = [(node, called) for node, called in definitions if not _touches_state(node.body, node.shadowed)]
+    while True:
+        names = {node.name for node, _ in pure if definitions_of[node.name] == 1}
+        still_pure = [(node, called) for node, called in pure if called <= names]
+        if len(still_pure) == len(pure):
+            break
+        pure = still_pure
+    pure = {id(node) for node, _ in pure}
+    for node, _ in definitions:
+        node.pure = id(node) in pure
+        tail_calls = _mark_tail_calls(node.body, True)
+        node.memoized = node.pure and node.recursive and not tail_calls
+
+
+def _mark_tail_calls(value, tail):
+    # Marks the returns in a function body, not those of functions defined
+    # in it; says whether any is a tail call.
+    found = False
+    if isinstance(value, list):
+        for item in value:
+            found = _mark_tail_calls(item, tail) or found
+    elif isinstance(value, Node) and value.kind != FUNCTION_DEF:
+        if value.kind == RETURN:
+            call = value.value
+            value.tail = tail and isinstance(call, Node) and call.kind == FUNCTION_CALL and not call.builtin
+            return value.tail
+        if value.kind == TRY_EXCEPT:
+            tail = False
+        for field in value.fields:
+            found = _mark_tail_calls(getattr(value, field), tail) or found
+    return found
+
+
+def _mark_loops(value):
+    if isinstance(value, list):
+        for item in value:
+            _mark_loops(item)
+    elif isinstance(value, Node):
+        if value.kind == WHILE or value.kind == FOR:
+            value.plan = plan_loop(value, assigned_names(value.body))
+        for field in value.fields:
+            _mark_loops(getattr(value, field))
+
+
+_STATEFUL = (PRINT, INPUT, IMPORT, FROM_IMPORT, CLASS, FUNCTION_DEF)
+
+
+def _touches_state(value, shadowed):
+    if isinstance(value, list):
+        return any(_touches_state(item, shadowed) for item in value)
+    if isinstance(value, Node):
+        if value.kind in _STATEFUL or getattr(value, 'slot', None) == GLOBAL:
+            return True
+        if value.kind == IDENTIFIER and value.name in shadowed:
+            return True
+        return any(_touches_state(getattr(value, field), shadowed) for field in value.fields)
+    return False
+
+
+def _collect_calls(value, definitions, called, call_nodes):
+    # Adds to `called` the names of functions called in `value`, to
+    # `definitions` every function definition in it with the names its
+    # own body calls, and to `call_nodes` every call.
+    if isinstance(value, list):
+        for item in value:
+            _collect_calls(item, definitions, called, call_nodes)
+    elif isinstance(value, Node):
+        if value.kind == FUNCTION_DEF:
+            body_calls = set()
+            definitions.append((value, body_calls))
+            _collect_calls(value.body, definitions, body_calls, call_nodes)
+            return
+        if value.kind == FUNCTION_CALL:
+            called.add(value.name)
+            call_nodes.append(value)
+        for field in value.fields:
+            _collect_calls(getattr(value, field), definitions, called, call_nodes)
+
+
+def new_frame(function, args):
+    params = len(function.params)
+    if len(args) >= params:
+        frame = args[:params]
+    else:
+        frame = args + [None] * (params - len(args))
+    if function.frame_size > params:
+        frame.extend([UNSET] * (function.frame_size - params))
+    return frame
+
+
+def assigned_names(statements):
+    names = {}
+    _collect_locals(statements, names)
+    return names
+
+
+def _as_list(statements):
+    return statements if isinstance(statements, list) else [statements]
+
+
+def _collect_locals(statements, names):
+    for node in _as_list(statements):
+        if not node or not hasattr(node, 'kind'):
+            continue
+        kind = node.kind
+        if kind == ASSIGNMENT or kind == INPUT:
+            names[node.target] = None
+        elif kind == FOR:
+            names[node.var] = None
+            _collect_locals(node.body, names)
+        elif kind == IF:
+            _collect_locals(node.body, names)
+            for elif_clause in node.elif_clauses or ():
+                _collect_locals(elif_clause.body, names)
+            if node.else_body is not None:
+                _collect_locals(node.else_body, names)
+        elif kind == WHILE or kind == CLASS:
+            _collect_locals(node.body, names)
+        elif kind == TRY_EXCEPT:
+            _collect_locals(node.try_body, names)
+            _collect_locals(node.except_body, names)
+            if node.finally_body is not None:
+                _collect_locals(node.finally_body, names)
+
+
+def _resolve_function(node):
+    # A repeated parameter name keeps its last slot, matching the order in
+    # which arguments are bound.
+    slots = {param: i for i, param in enumerate(node.params)}
+    names = list(node.params)
+    assigned = {}
+    _collect_locals(node.body, assigned)
+    for name in assigned:
+        if name not in slots:
+            slots[name] = len(names)
+            names.append(name)
+    node.local_names = tuple(names)
+    node.frame_size = len(names)
+    _resolve_block(node.body, slots)
+
+
+def _slot(name, slots):
+    if slots is None:
+        return GLOBAL
+    return slots.get(name, GLOBAL)
+
+
+def _resolve_block(statements, slots):
+    for node in _as_list(statements):
+        _resolve_node(node, slots)
+
+
+def _resolve_node(node, slots):
+    if not node or not hasattr(node, 'kind'):
+        return
+    kind = node.kind
+
+    if kind == IDENTIFIER:
+        node.slot = _slot(node.name, slots)
+
+    elif kind == ASSIGNMENT:
+        node.slot = _slot(node.target, slots)
+        _resolve_node(node.value, slots)
+
+    elif kind == INPUT:
+        node.slot = _slot(node.target, slots)
+
+    elif kind == PRINT:
+        for value in node.values:
+            _resolve_node(value, slots)
+
+    elif kind == BINARY_OP or kind == COMPARISON:
+        _resolve_node(node.left, slots)
+        _resolve_node(node.right, slots)
+
+    elif kind == UNARY_OP:
+        _resolve_node(node.operand, slots)
+
+    elif kind == ARRAY:
+        for element in node.elements:
+            _resolve_node(element, slots)
+
+    elif kind == INDEX:
+        _resolve_node(node.value, slots)
+        _resolve_node(node.index, slots)
+
+    elif kind == SLICE:
+        _resolve_node(node.value, slots)
+        _resolve_node(node.start, slots)
+        _resolve_node(node.stop, slots)
+
+    elif kind == FUNCTION_CALL:
+        for arg in node.args:
+            _resolve_node(arg, slots)
+
+    elif kind == RETURN:
+        _resolve_node(node.value, slots)
+
+    elif kind == IF:
+        _resolve_node(node.condition, slots)
+        _resolve_block(node.body, slots)
+        for elif_clause in node.elif_clauses or ():
+            _resolve_node(elif_clause, slots)
+        if node.else_body is not None:
+            _resolve_block(node.else_body, slots)
+
+    elif kind == WHILE:
+        _resolve_node(node.condition, slots)
+        _resolve_block(node.body, slots)
+
+    elif kind == FOR:
+        node.slot = _slot(node.var, slots)
+        _resolve_block(node.body, slots)
+
+    elif kind == FUNCTION_DEF:
+        _resolve_function(node)
+
+    elif kind == TRY_EXCEPT:
+        _resolve_block(node.try_body, slots)
+        _resolve_block(node.except_body, slots)
+        if node.finally_body is not None:
+            _resolve_block(node.finally_body, slots)
+
+    elif kind == CLASS:
+        _resolve_block(node.body, slots)
@@ -0,0 +1,161 @@
+import re
+
+import lexer as rules
+
+
+# Hand-written scanner producing the same token stream as the PLY lexer in
+# lexer.py, which stays the reference definition of the tokens. PLY tries
+# every keyword rule before t_ID at each position; here one regex matches a
+# whole word over the identifier character classes and a table then splits
+# it the way PLY would: at each position a number first, then the first
+# keyword (in rule order) that is a prefix, else an identifier. So
+# `trueish` is TRUE followed by ID `ish`, and `ಇಲ್ಲದಿದ್ದರೆನಂತರ` is ELSE
+# followed by IF. Each distinct word is split once.
+
+_WORD_START = '\u0C80-\u0CFFa-zA-Z_'
+_WORD_PART = '\u0C80-\u0CFFa-zA-Z_0-9'
+
+# One alternative per token class, most frequent first, with the blanks in
+# front of a token folded into its match (possessively, so trailing blanks
+# match nothing rather than an error). Words may not start with a
+# Kannada digit (U+0CE6-U+0CEF), which PLY lexes as a NUMBER first; they run
+# on over any digit so that _split() sees exactly the text PLY would.
+_TOKEN = re.compile(
+    r'[ \t]*+(?:'
+    r'([\u0C80-\u0CE5\u0CF0-\u0CFFa-zA-Z_][\u0C80-\u0CFFa-zA-Z_0-9\d]*)'
+    r'|(\*\*|//|==|!=|<=|>=|[-+*/%=<>():,!\[\]])'
+    r'|(\n+)'
+    r'|(\d+)'
+    r'|(".*?"|\'[^\']*\')'
+    r'|([\s\S]))'
+)
+(_WORD, _OP, _NEWLINE, _NUMBER_GROUP, _STRING, _ERROR) = range(1, 7)
+_NUMBER = re.compile(r'\d+')
+_ID = re.compile(f'[{_WORD_START}][{_WORD_PART}]*')
+
+OPERATORS = {
+    '**': 'POWER', '//': 'FLOOR_DIVIDE', '==': 'EQUAL', '!=': 'NOTEQUAL', '<=': 'LESSEQUAL',
+    '>=': 'GREATEREQUAL', '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '/': 'DIVIDE', '%': 'MODULO',
+    '=': 'ASSIGN', '>': 'GREATER', '<': 'LESS', '(': 'LPAREN', ')': 'RPAREN', ':': 'COLON',
+    ',': 'COMMA', '!': 'NOT', '[': 'LBRACKET', ']': 'RBRACKET',
+}
+
+# Rules that are not plain keyword alternations.
+_NOT_KEYWORDS = ('t_NUMBER', 't_NEWLINE', 't_error')
+
+
+class Token:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type, value, lineno, lexpos):
+        self.type = type
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+def _keyword_table():
+    # (literal, type, value) for every keyword alternative, in the order
+    # PLY tries the rules; the rule function itself supplies type and value.
+    functions = [value for name, value in vars(rules).items()
+                 if name.startswith('t_') and callable(value) and name not in _NOT_KEYWORDS]
+    functions.sort(key=lambda function: function.__code__.co_firstlineno)
+    table = []
+    for function in functions:
+        for literal in function.__doc__.split('|'):
+            token = function(Token(function.__name__[2:], literal, 0, 0))
+            table.append((literal, token.type, token.value))
+    return table
+
+
+KEYWORDS = _keyword_table()
+_KEYWORDS_BY_FIRST = {}
+for _keyword in KEYWORDS:
+    _KEYWORDS_BY_FIRST.setdefault(_keyword[0][0], []).append(_keyword)
+del _keyword
+
+# (type, value) of every word seen that is a single token, and the parts of
+# those that split into several; both are cleared past _WORDS_LIMIT.
+_single_words = {}
+_split_words = {}
+_WORDS_LIMIT = 4096
+
+
+def _split(word):
+    parts = []
+    pos = 0
+    while pos < len(word):
+        match = _NUMBER.match(word, pos)
+        if match:
+            parts.append(('NUMBER', int(match.group()), pos))
+            pos = match.end()
+            continue
+        for literal, type, value in _KEYWORDS_BY_FIRST.get(word[pos], ()):
+            if word.startswith(literal, pos):
+                parts.append((type, value, pos))
+                pos += len(literal)
+                break
+        else:
+            match = _ID.match(word, pos)
+            parts.append(('ID', match.group(), pos))
+            pos = match.end()
+    return tuple(parts)
+
+
+class Scanner:
+    # Holds the line count across calls, so a source can be scanned in
+    # pieces. With partial=True a single-quoted string left open at the end
+    # of `text` stops the scan instead of being reported; `end` is then the
+    # position to resume from once more text is available.
+    def __init__(self, lineno=1):
+        self.lineno = lineno
+        self.end = 0
+
+    def scan(self, text, offset=0, partial=False):
+        lineno = self.lineno
+        single_words = _single_words
+        operators = OPERATORS
+        self.end = len(text)
+        for match in _TOKEN.finditer(text):
+            group = match.lastindex
+            if group == _WORD:
+                word = match.group(_WORD)
+                entry = single_words.get(word)
+                if entry is None:
+                    parts = _split_words.get(word) or _split(word)
+                    if len(single_words) + len(_split_words) >= _WORDS_LIMIT:
+                        single_words.clear()
+                        _split_words.clear()
+                    if len(parts) > 1:
+                        _split_words[word] = parts
+                        start = match.start(_WORD) + offset
+                        for type, value, pos in parts:
+                            yield Token(type, value, lineno, start + pos)
+                        continue
+                    entry = single_words[word] = parts[0][:2]
+                yield Token(entry[0], entry[1], lineno, match.start(_WORD) + offset)
+            elif group == _OP:
+                value = match.group(_OP)
+                yield Token(operators[value], value, lineno, match.start(_OP) + offset)
+            elif group == _NEWLINE:
+                value = match.group(_NEWLINE)
+                yield Token('NEWLINE', value, lineno, match.start(_NEWLINE) + offset)
+                lineno += len(value)
+                self.lineno = lineno
+            elif group == _NUMBER_GROUP:
+                yield Token('NUMBER', int(match.group(_NUMBER_GROUP)), lineno, match.start(_NUMBER_GROUP) + offset)
+            elif group == _STRING:
+                yield Token('STRING', match.group(_STRING), lineno, match.start(_STRING) + offset)
+            else:
+                char = match.group(_ERROR)
+                if partial and char == "'" and text.find("'", match.end()) < 0:
+                    self.end = match.start(_ERROR)
+                    return
+                print(f"ಅಮಾನ್ಯ ಅಕ್ಷರ/Illegal character '{char}'")
+
+
+def tokenize(text):
+    return Scanner().scan(text)
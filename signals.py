@@ -0,0 +1,22 @@
+# Control-flow signals shared by the execution backends. Executing a
+# statement yields None to fall through to the next one, or one of these
+# preallocated sentinels; a returned value travels separately in the
+# interpreter's `return_value`, so no signal object is built per use.
+
+
+class Signal:
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"<{self.name} signal>"
+
+
+RETURN_SIGNAL = Signal('return')
+BREAK_SIGNAL = Signal('break')
+CONTINUE_SIGNAL = Signal('continue')
+# A tail call: the function and arguments wait in the interpreter's
+# `tail_call` for the call under way to run in its own place.
+TAIL_CALL_SIGNAL = Signal('tail call')
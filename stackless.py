@@ -0,0 +1,276 @@
+from itertools import repeat
+
+from ast_nodes import (
+    Node, PRINT, ASSIGNMENT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, TRY_EXCEPT,
+    BINARY_OP, COMPARISON, UNARY_OP, ARRAY, INDEX, SLICE,
+)
+from compiler import BINARY_OPS, COMPARISON_OPS, format_values
+from resolver import new_frame
+from signals import RETURN_SIGNAL, BREAK_SIGNAL, CONTINUE_SIGNAL, TAIL_CALL_SIGNAL
+from budget import body_cost
+from memo import MISSING
+from arrays import BUILTINS, make_array, get_item, get_slice
+
+
+# Runs the AST produced by parser.parse like tree mode, but without using
+# the Python stack for KA calls, so recursion is bounded by `max_depth` and
+# memory rather than by sys.getrecursionlimit(). A statement or expression
+# that contains no call is handed to the interpreter's own evaluate_*();
+# one that does runs as a generator, which yields (function, arguments)
+# when it reaches the call and is sent the result. The program and every
+# call under way are such generators, kept with their frames on an explicit
+# stack; Python recursion only goes as deep as statements nest within one
+# function body.
+#
+# A call that would make the stack deeper than `max_depth` raises
+# StackOverflow where it is made, which a KA try block can catch.
+
+MAX_DEPTH = 100000
+
+
+class StackOverflow(RuntimeError):
+    def __init__(self, limit):
+        super().__init__(f"ಸ್ಟ್ಯಾಕ್ ಮಿತಿ ಮೀರಿದೆ/Stack overflow: more than {limit} nested calls")
+        self.limit = limit
+
+
+def _mark_calls(value, calls):
+    # Adds to `calls` the ids of the nodes in `value` that contain a call of
+    # a KA function, function bodies aside, and says whether `value` does.
+    if isinstance(value, list):
+        found = False
+        for item in value:
+            found = _mark_calls(item, calls) or found
+        return found
+    if isinstance(value, Node):
+        if value.kind == FUNCTION_DEF:
+            _mark_calls(value.body, calls)
+            return False
+        found = value.kind == FUNCTION_CALL and not value.builtin
+        for field in value.fields:
+            found = _mark_calls(getattr(value, field), calls) or found
+        if found:
+            calls.add(id(value))
+        return found
+    return False
+
+
+class StacklessProgram:
+    def __init__(self, ast, max_depth=MAX_DEPTH):
+        self.ast = ast or []
+        self.max_depth = max_depth
+        self.calls = set()
+        _mark_calls(self.ast, self.calls)
+
+    def run(self, interpreter):
+        if interpreter.budget is not None:
+            interpreter.budget.start()
+        try:
+            self.execute(interpreter)
+        finally:
+            interpreter.output.flush()
+        return interpreter
+
+    def execute(self, it):
+        memo = it.memo
+        budget = it.budget
+        main_frame = it.frame
+        # Each entry: a body under way, its frame, and the function and memo
+        # key its result is to be remembered under.
+        stack = [(self.block(self.ast, it), main_frame, None)]
+        value = None
+        error = None
+        try:
+            while True:
+                body, it.frame, pending = stack[-1]
+                try:
+                    if error is not None:
+                        thrown, error = error, None
+                        call = body.throw(thrown)
+                    else:
+                        call = body.send(value)
+                except StopIteration as stop:
+                    stack.pop()
+                    if not stack:
+                        return
+                    signal = stop.value
+                    if signal is not TAIL_CALL_SIGNAL:
+                        value = None
+                        if signal is RETURN_SIGNAL:
+                            value = it.return_value
+                            it.return_value = None
+                        if pending is not None:
+                            memo.store(pending[0], pending[1], value)
+                        continue
+                    # The caller makes the tail call in place of this one.
+                    call = it.tail_call
+                    it.tail_call = None
+                except BaseException as e:
+                    stack.pop()
+                    if not stack:
+                        raise
+                    error = e
+                    continue
+
+                func_def, args = call
+                pending = None
+                if memo is not None and func_def.memoized:
+                    key, value = memo.lookup(func_def, func_def.name, args)
+                    if value is not MISSING:
+                        continue
+                    pending = (func_def, key)
+                value = None
+                if len(stack) > self.max_depth:
+                    error = StackOverflow(self.max_depth)
+                    continue
+                if budget is not None and func_def.recursive:
+                    try:
+                        it.charge(func_def.body)
+                    except BaseException as e:
+                        error = e
+                        continue
+                stack.append((self.block(func_def.body, it), new_frame(func_def, args), pending))
+        finally:
+            it.frame = main_frame
+
+    def block(self, statements, it):
+        calls = self.calls
+        for statement in statements if isinstance(statements, list) else (statements,):
+            if id(statement) in calls:
+                signal = yield from self.statement(statement, it)
+            else:
+                signal = it.evaluate_statement(statement)
+            if signal is not None:
+                return signal
+        return None
+
+    def statement(self, node, it):
+        node_type = node.kind
+
+        if node_type == PRINT:
+            values = []
+            for value in node.values:
+                if value is not None:
+                    values.append((yield from self.expression(value, it)))
+            output = format_values(values)
+            it.output.write(output if '\n' in output else output + " ")
+            return None
+
+        elif node_type == ASSIGNMENT:
+            value = yield from self.expression(node.value, it)
+            it.store(node.slot, node.target, value)
+            return None
+
+        elif node_type == IF:
+            if (yield from self.expression(node.condition, it)):
+                return (yield from self.block(node.body, it))
+            elif node.elif_clauses:
+                for elif_clause in node.elif_clauses:
+                    if (yield from self.expression(elif_clause.condition, it)):
+                        return (yield from self.block(elif_clause.body, it))
+            if node.else_body is not None:
+                return (yield from self.block(node.else_body, it))
+            return None
+
+        elif node_type == WHILE:
+            budget = it.budget
+            for _ in repeat(None) if budget is None else budget.iterations(it, body_cost(node.body)):
+                if not (yield from self.expression(node.condition, it)):
+                    break
+                signal = yield from self.block(node.body, it)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
+
+        elif node_type == FOR:
+            start = int(node.start)
+            end = int(node.end)
+            budget = it.budget
+            for i in range(start, end) if budget is None else budget.iterations(it, body_cost(node.body), end, start):
+                it.store(node.slot, node.var, i)
+                signal = yield from self.block(node.body, it)
+                if signal is not None and signal is not CONTINUE_SIGNAL:
+                    if signal is BREAK_SIGNAL:
+                        break
+                    return signal
+            return None
+
+        elif node_type == RETURN:
+            if node.tail:
+                call = node.value
+                func_def = it.functions.get(call.name)
+                if func_def is None:
+                    raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {call.name}")
+                args = []
+                for arg in call.args:
+                    args.append((yield from self.expression(arg, it)))
+                it.tail_call = (func_def, args)
+                return TAIL_CALL_SIGNAL
+            it.return_value = yield from self.expression(node.value, it)
+            return RETURN_SIGNAL
+
+        elif node_type == TRY_EXCEPT:
+            try:
+                return (yield from self.block(node.try_body, it))
+            except Exception:
+                return (yield from self.block(node.except_body, it))
+            finally:
+                if node.finally_body is not None:
+                    return_value = it.return_value
+                    yield from self.block(node.finally_body, it)
+                    it.return_value = return_value
+
+        else:
+            yield from self.expression(node, it)
+            return None
+
+    def expression(self, expr, it):
+        if id(expr) not in self.calls:
+            return it.evaluate_expression(expr)
+
+        expr_type = expr.kind
+
+        if expr_type == FUNCTION_CALL:
+            args = []
+            if expr.builtin:
+                for arg in expr.args:
+                    args.append((yield from self.expression(arg, it)))
+                return BUILTINS[expr.name](*args)
+            func_def = it.functions.get(expr.name)
+            if func_def is None:
+                raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {expr.name}")
+            for arg in expr.args:
+                args.append((yield from self.expression(arg, it)))
+            return (yield (func_def, args))
+
+        elif expr_type == BINARY_OP or expr_type == COMPARISON:
+            left = yield from self.expression(expr.left, it)
+            right = yield from self.expression(expr.right, it)
+            op = (BINARY_OPS if expr_type == BINARY_OP else COMPARISON_OPS).get(expr.op)
+            return op(left, right) if op is not None else None
+
+        elif expr_type == UNARY_OP:
+            operand = yield from self.expression(expr.operand, it)
+            if expr.op == 'NEGATE':
+                return -operand
+            elif expr.op == 'NOT':
+                return not operand
+
+        elif expr_type == ARRAY:
+            elements = []
+            for element in expr.elements:
+                elements.append((yield from self.expression(element, it)))
+            return make_array(elements)
+
+        elif expr_type == INDEX:
+            value = yield from self.expression(expr.value, it)
+            return get_item(value, (yield from self.expression(expr.index, it)))
+
+        elif expr_type == SLICE:
+            value = yield from self.expression(expr.value, it)
+            start = yield from self.expression(expr.start, it)
+            return get_slice(value, start, (yield from self.expression(expr.stop, it)))
+
+        return None
@@ -0,0 +1,470 @@
+import functools
+import linecache
+import re
+import sys
+
+from ast_nodes import (
+    PRINT, ASSIGNMENT, INPUT, IF, WHILE, FOR, FUNCTION_DEF, FUNCTION_CALL, RETURN, BREAK, CONTINUE, PASS,
+    TRY_EXCEPT, IMPORT, FROM_IMPORT, CLASS, NUMBER, STRING, BOOLEAN, IDENTIFIER, BINARY_OP, COMPARISON, UNARY_OP,
+    ARRAY, INDEX, SLICE,
+)
+from compiler import format_values
+from parser import KannadaInterpreter
+from budget import body_cost
+from arrays import BUILTINS, make_array, get_item, get_slice
+from resolver import UNSET
+
+
+# Lowers the AST produced by parser.parse to Python source and runs it
+# through compile(), so loops execute in CPython's own evaluator.
+# `line_map[i]` is the KA source line of generated line i + 1. Globals are
+# entries of the shared `V` table; function locals (see resolver.py)
+# become native Python locals, named by _local(); those sharing a name
+# with a global start out as `_UNSET` and read the global until assigned.
+# A budgeted variant, emitted on the first run with a budget, runs loops
+# over the budget's iterations() (`_iterations`), and the body of every
+# recursive function starts by taking the next item of an endless one of
+# its own, made where the function is defined. Its interpreter's `frame`
+# is a _RunningLocals, which finds the locals of the innermost running KA
+# function when the budget's memory check asks. Memoized functions are
+# stored through `_memoize`, which wraps them in the run's memo table, if
+# it has one. A tail call returns a `_TailCall` instead of making the
+# call; functions making them are stored through `_trampoline`, which
+# makes each returned call in turn, so tail recursion runs in one Python
+# frame. Arrays are made and read through `_array`, `_item` and `_slice`,
+# and builtin calls go to `_builtins` (arrays.py).
+
+
+class _Variables(dict):
+    def __missing__(self, name):
+        raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}")
+
+
+class _Functions(dict):
+    def __missing__(self, name):
+        raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {name}")
+
+
+def _local(name):
+    if name.isascii() and name.isidentifier():
+        return "l_" + name
+    return "u_" + "_".join(f"{ord(char):x}" for char in name)
+
+
+def _unmangle(local):
+    if local.startswith("l_"):
+        return local[2:]
+    return "".join(chr(int(code, 16)) for code in local[2:].split("_"))
+
+
+_UNBOUND_LOCAL = re.compile(r"local variable '([lu]_\w*)'")
+
+
+def _runtime(output):
+    # Functions the generated code calls, writing to the run's output sink.
+    write = output.write
+
+    def _print(*values):
+        text = format_values(values)
+        write(text if '\n' in text else text + " ")
+
+    def _input():
+        output.flush()
+        user_input = input("ಒಡ್ಡಿ/Enter input: ")
+        write("\n")
+        return user_input
+
+    def _announce(message):
+        write(message + " ")
+
+    return {
+        '_print': _print,
+        '_input': _input,
+        '_announce': _announce,
+    }
+
+
+def _unwrapped(function, name):
+    return function
+
+
+class _EndFinally(BaseException):
+    # Ends a KA finally body early; KA except blocks do not catch it.
+    pass
+
+
+class _TailCall:
+    __slots__ = ('function', 'args')
+
+    def __init__(self, function, args):
+        self.function = function
+        self.args = args
+
+
+class _RunningLocals:
+    # Iterates over the locals of the innermost KA function on the Python
+    # stack, looked up only when a budget check asks for them.
+    def __init__(self, code_name):
+        self.code_name = code_name
+
+    def __iter__(self):
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == self.code_name and code.co_name != "_ka_main":
+                return iter(frame.f_locals.values())
+            frame = frame.f_back
+        return iter(())
+
+
+def _trampoline(function):
+    def trampoline(*args):
+        result = function(*args)
+        while type(result) is _TailCall:
+            target = result.function
+            result = getattr(target, 'raw', target)(*result.args)
+        return result
+    trampoline.raw = function
+    return trampoline
+
+
+_COMPARISON_OPS = {
+    'LESS': '<',
+    'GREATER': '>',
+    'EQUAL': '==',
+    'NOTEQUAL': '!=',
+    'LESSEQUAL': '<=',
+    'GREATEREQUAL': '>=',
+}
+
+_BINARY_OPS = ('+', '-', '*', '/', '//', '**', '%')
+
+# Python precedence of what expression() emits, lowest first. Operands are
+# parenthesized only where Python would group them differently from the
+# tree, so that long operator chains stay within the parser's nesting limit.
+_NOT = 1
+_COMPARE = 2
+_SUM = 3
+_PRODUCT = 4
+_NEGATE = 5
+_POWER = 6
+_ATOM = 7
+
+_BINARY_PRECEDENCE = {'+': _SUM, '-': _SUM, '*': _PRODUCT, '/': _PRODUCT, '//': _PRODUCT, '%': _PRODUCT, '**': _POWER}
+
+
+def _precedence(expr):
+    if not expr or isinstance(expr, (int, float, str, bool)):
+        return _ATOM
+    kind = expr.kind
+    if kind == NUMBER:
+        return _NEGATE if int(expr.value) < 0 else _ATOM
+    elif kind == BINARY_OP:
+        return _BINARY_PRECEDENCE.get(expr.op, _ATOM)
+    elif kind == COMPARISON:
+        return _COMPARE if expr.op in _COMPARISON_OPS else _ATOM
+    elif kind == UNARY_OP:
+        return {'NEGATE': _NEGATE, 'NOT': _NOT}.get(expr.op, _ATOM)
+    return _ATOM
+
+
+class _Emitter:
+    def __init__(self, budgeted=False):
+        self.lines = []
+        self.line_map = []
+        self.functions = 0
+        self.tail_calls = 0
+        self.budgeted = budgeted
+        # Locals of the function being emitted that may read a global.
+        self.shadowed = frozenset()
+        # Whether a return (and a break or continue outside a loop) ends a
+        # finally body rather than the function.
+        self.in_finally = False
+
+    def emit(self, indent, text, line):
+        self.lines.append("    " * indent + text)
+        self.line_map.append(line)
+
+    def expression(self, expr):
+        if not expr:
+            return "None"
+
+        if isinstance(expr, (int, float, str, bool)):
+            return repr(expr)
+
+        expr_type = expr.kind
+
+        if expr_type == NUMBER:
+            return repr(int(expr.value))
+
+        elif expr_type == STRING or expr_type == BOOLEAN:
+            return repr(expr.value)
+
+        elif expr_type == IDENTIFIER:
+            if expr.slot >= 0 and expr.name in self.shadowed:
+                local = _local(expr.name)
+                return f"(V[{expr.name!r}] if {local} is _UNSET else {local})"
+            return self.variable(expr.name, expr.slot)
+
+        elif expr_type == BINARY_OP:
+            if expr.op not in _BINARY_OPS:
+                return "None"
+            precedence = _BINARY_PRECEDENCE[expr.op]
+            if expr.op == '**':
+                # Right-associative, and binds tighter than a unary minus
+                # on its left.
+                left, right = self.operand(expr.left, _ATOM), self.operand(expr.right, _POWER)
+            else:
+                left, right = self.operand(expr.left, precedence), self.operand(expr.right, precedence + 1)
+            return f"{left} {expr.op} {right}"
+
+        elif expr_type == COMPARISON:
+            op = _COMPARISON_OPS.get(expr.op)
+            if op is None:
+                return "None"
+            # Both sides bind tighter, so that Python does not chain them.
+            return f"{self.operand(expr.left, _SUM)} {op} {self.operand(expr.right, _SUM)}"
+
+        elif expr_type == UNARY_OP:
+            if expr.op == 'NEGATE':
+                return f"-{self.operand(expr.operand, _NEGATE)}"
+            elif expr.op == 'NOT':
+                return f"not {self.operand(expr.operand, _NOT)}"
+            return "None"
+
+        elif expr_type == FUNCTION_CALL:
+            args = ", ".join(self.expression(arg) for arg in expr.args)
+            if expr.builtin:
+                return f"_builtins[{expr.name!r}]({args})"
+            return f"F[{expr.name!r}]({args})"
+
+        elif expr_type == ARRAY:
+            return f"_array([{', '.join(self.expression(element) for element in expr.elements)}])"
+
+        elif expr_type == INDEX:
+            return f"_item({self.expression(expr.value)}, {self.expression(expr.index)})"
+
+        elif expr_type == SLICE:
+            return (f"_slice({self.expression(expr.value)}, {self.expression(expr.start)}, "
+                    f"{self.expression(expr.stop)})")
+
+        return "None"
+
+    def operand(self, expr, precedence):
+        # expr as an operand needing at least `precedence` to stay grouped.
+        text = self.expression(expr)
+        return text if _precedence(expr) >= precedence else f"({text})"
+
+    def variable(self, name, slot):
+        if slot >= 0:
+            return _local(name)
+        return f"V[{name!r}]"
+
+    # Outside a loop, break and continue end the enclosing function (or the
+    # program, or a finally body) the way their signal does in
+    # KannadaInterpreter.
+    def block(self, statements, indent, line, in_loop=False):
+        if not isinstance(statements, list):
+            statements = [statements]
+        start = len(self.lines)
+        for statement in statements:
+            self.statement(statement, indent, in_loop)
+        if len(self.lines) == start:
+            self.emit(indent, "pass", line)
+
+    def statement(self, node, indent, in_loop):
+        if not node:
+            return
+
+        node_type = node.kind
+        line = node.line
+
+        if node_type == PRINT:
+            values = ", ".join(self.expression(value) for value in node.values if value is not None)
+            self.emit(indent, f"_print({values})", line)
+
+        elif node_type == ASSIGNMENT:
+            self.emit(indent, f"{self.variable(node.target, node.slot)} = {self.expression(node.value)}", line)
+
+        elif node_type == INPUT:
+            self.emit(indent, f"{self.variable(node.target, node.slot)} = _input()", line)
+
+        elif node_type == IF:
+            self.emit(indent, f"if {self.expression(node.condition)}:", line)
+            self.block(node.body, indent + 1, line, in_loop)
+            for elif_clause in node.elif_clauses or ():
+                self.emit(indent, f"elif {self.expression(elif_clause.condition)}:", elif_clause.line or line)
+                self.block(elif_clause.body, indent + 1, line, in_loop)
+            if node.else_body is not None:
+                self.emit(indent, "else:", line)
+                self.block(node.else_body, indent + 1, line, in_loop)
+
+        elif node_type == WHILE:
+            if self.budgeted:
+                self.emit(indent, f"for _ in _iterations({body_cost(node.body)}):", line)
+                self.emit(indent + 1, f"if not {self.expression(node.condition)}: break", line)
+            else:
+                self.emit(indent, f"while {self.expression(node.condition)}:", line)
+            self.block(node.body, indent + 1, line, True)
+
+        elif node_type == FOR:
+            start = int(node.start)
+            end = int(node.end)
+            if self.budgeted:
+                iterations = f"_iterations({body_cost(node.body)}, {end}, {start})"
+            else:
+                iterations = f"range({start}, {end})"
+            self.emit(indent, f"for {self.variable(node.var, node.slot)} in {iterations}:", line)
+            self.block(node.body, indent + 1, line, True)
+
+        elif node_type == FUNCTION_DEF:
+            self.functions += 1
+            func_name = f"_ka_function_{self.functions}"
+            # A repeated parameter name is bound to its last argument.
+            params = [
+                f"_p{i}=None" if param in node.params[i + 1:] else f"{_local(param)}=None"
+                for i, param in enumerate(node.params)
+            ]
+            charged = self.budgeted and node.recursive
+            if charged:
+                self.emit(indent, f"_calls_{self.functions} = _iterations({body_cost(node.body)})", line)
+            self.emit(indent, f"def {func_name}({''.join(param + ', ' for param in params)}*_):", line)
+            if charged:
+                self.emit(indent + 1, f"next(_calls_{self.functions})", line)
+            for name in sorted(node.shadowed):
+                self.emit(indent + 1, f"{_local(name)} = _UNSET", line)
+            outer_tail_calls, outer_shadowed, outer_in_finally = self.tail_calls, self.shadowed, self.in_finally
+            self.tail_calls = 0
+            self.shadowed = node.shadowed
+            self.in_finally = False
+            self.block(node.body, indent + 1, line)
+            if node.memoized:
+                func_name = f"_memoize({func_name}, {node.name!r})"
+            elif self.tail_calls:
+                func_name = f"_trampoline({func_name})"
+            self.tail_calls = outer_tail_calls
+            self.shadowed = outer_shadowed
+            self.in_finally = outer_in_finally
+            self.emit(indent, f"F[{node.name!r}] = {func_name}", line)
+
+        elif node_type == RETURN:
+            if node.tail:
+                self.tail_calls += 1
+                call = node.value
+                args = "".join(self.expression(arg) + ", " for arg in call.args)
+                self.emit(indent, f"return _TailCall(F[{call.name!r}], ({args}))", line)
+            elif self.in_finally:
+                self.emit(indent, self.expression(node.value), line)
+                self.emit(indent, "raise _EndFinally", line)
+            else:
+                self.emit(indent, f"return {self.expression(node.value)}", line)
+
+        elif node_type == BREAK or node_type == CONTINUE:
+            if in_loop:
+                self.emit(indent, "break" if node_type == BREAK else "continue", line)
+            else:
+                self.emit(indent, "raise _EndFinally" if self.in_finally else "return None", line)
+
+        elif node_type == PASS:
+            self.emit(indent, "pass", line)
+
+        elif node_type == TRY_EXCEPT:
+            self.emit(indent, "try:", line)
+            self.block(node.try_body, indent + 1, line, in_loop)
+            self.emit(indent, "except Exception:", line)
+            self.block(node.except_body, indent + 1, line, in_loop)
+            if node.finally_body is not None:
+                # Its signals are discarded, as in KannadaInterpreter.
+                in_finally = self.in_finally
+                self.in_finally = True
+                self.emit(indent, "finally:", line)
+                self.emit(indent + 1, "try:", line)
+                self.block(node.finally_body, indent + 2, line)
+                self.emit(indent + 1, "except _EndFinally:", line)
+                self.emit(indent + 2, "pass", line)
+                self.in_finally = in_finally
+
+        elif node_type == IMPORT:
+            self.emit(indent, f"_announce({'Imported module: ' + node.module!r})", line)
+
+        elif node_type == FROM_IMPORT:
+            self.emit(indent, f"_announce({'Imported ' + node.name + ' from ' + node.module!r})", line)
+
+        elif node_type == CLASS:
+            self.emit(indent, f"_announce({'Defined class: ' + node.name!r})", line)
+
+        else:
+            self.emit(indent, self.expression(node), line)
+
+
+class TranspiledProgram:
+    def __init__(self, source, line_map, filename, ast=None, budgeted=False):
+        self.source = source
+        self.line_map = line_map
+        self.filename = filename
+        self.ast = ast
+        self.budgeted = budgeted
+        self.budgeted_program = None
+        self.code_name = f"<ka-python{'-budgeted' if budgeted else ''}:{filename}>"
+        linecache.cache[self.code_name] = (len(source), None, source.splitlines(True), self.code_name)
+        self.code = compile(source, self.code_name, "exec")
+
+    def ka_line(self, traceback):
+        line = None
+        while traceback is not None:
+            if traceback.tb_frame.f_code.co_filename == self.code_name:
+                line = self.line_map[traceback.tb_lineno - 1]
+            traceback = traceback.tb_next
+        return line
+
+    def run(self, interpreter=None):
+        if interpreter is None:
+            interpreter = KannadaInterpreter()
+        budget = interpreter.budget
+        if budget is not None and not self.budgeted:
+            if self.budgeted_program is None:
+                self.budgeted_program = transpile(self.ast, self.filename, budgeted=True)
+            return self.budgeted_program.run(interpreter)
+        namespace = _runtime(interpreter.output)
+        namespace['_memoize'] = interpreter.memo.wrap if interpreter.memo is not None else _unwrapped
+        namespace['_TailCall'] = _TailCall
+        namespace['_EndFinally'] = _EndFinally
+        namespace['_trampoline'] = _trampoline
+        namespace['_array'] = make_array
+        namespace['_item'] = get_item
+        namespace['_slice'] = get_slice
+        namespace['_builtins'] = BUILTINS
+        namespace['_UNSET'] = UNSET
+        if budget is not None:
+            budget.start()
+            namespace['_iterations'] = functools.partial(budget.iterations, interpreter)
+            interpreter.frame = _RunningLocals(self.code_name)
+        exec(self.code, namespace)
+        variables = interpreter.variables = _Variables(interpreter.variables)
+        try:
+            namespace['_ka_main'](variables, _Functions())
+        except Exception as e:
+            error = e
+            if isinstance(e, UnboundLocalError):
+                match = _UNBOUND_LOCAL.search(str(e))
+                name = _unmangle(match.group(1)) if match else e
+                error = NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {name}")
+            line = self.ka_line(e.__traceback__)
+            if line:
+                error.ka_line = line
+                error.add_note(f'  File "{self.filename}", line {line}')
+            if error is e:
+                raise
+            raise error from None
+        finally:
+            interpreter.frame = None
+            interpreter.output.flush()
+        return interpreter
+
+
+def transpile(ast, filename="<ka>", budgeted=False):
+    emitter = _Emitter(budgeted)
+    emitter.emit(0, "def _ka_main(V, F):", 0)
+    emitter.block(ast or [], 1, 0)
+    source = "\n".join(emitter.lines) + "\n"
+    return TranspiledProgram(source, emitter.line_map, filename, ast, budgeted)
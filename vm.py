@@ -0,0 +1,694 @@
+from array import array
+
+import ast_nodes as nodes
+from compiler import format_values
+from parser import KannadaInterpreter
+from resolver import new_frame, UNSET
+from budget import body_cost
+from memo import MISSING
+from arrays import BUILTINS, make_array, get_item, get_slice
+from stackless import StackOverflow, MAX_DEPTH
+
+
+# A stack-based bytecode VM for KA programs. compile_bytecode() flattens the
+# AST from parser.parse into parallel `array` streams of opcodes, operands
+# and KA line numbers; loops and conditionals become jumps and each KA call
+# gets its own frame on the VM's frame stack. Function locals live in a
+# per-call list indexed by the resolver's slots (LOAD_FAST/STORE_FAST);
+# globals are looked up by name. With a budget, GET_ITER swaps a for loop's
+# range for the budget's iterations() (costed by `for_costs`), each jump to
+# the top of a while loop, on entering it as well as back from its body, is
+# charged `while_costs[top]` before the iteration runs, and each call of a
+# recursive function its `cost`. A call of a memoized function (see
+# resolver.py) is looked up in the run's memo first; on a miss its frame
+# remembers the key, and RETURN stores the result. TAIL_CALL, followed by
+# a RETURN for when it makes an ordinary call instead, runs the function in
+# place of the current one without adding a frame. A builtin call
+# (LOAD_BUILTIN ... CALL_BUILTIN) runs the Python function in place. The
+# running call's locals are the interpreter's `frame`, for the budget's
+# memory checks.
+# A call that would make the frame stack deeper than `max_depth` raises
+# stackless.StackOverflow, which a KA try block can catch.
+
+(NOP, LOAD_CONST, LOAD_NAME, STORE_NAME, POP,
+ ADD, SUB, MUL, DIV, FLOOR_DIV, POW, MOD,
+ LESS, GREATER, EQUAL, NOTEQUAL, LESSEQUAL, GREATEREQUAL,
+ NEGATE, NOT, JUMP, POP_JUMP_IF_FALSE, GET_ITER, FOR_ITER,
+ PRINT, INPUT, ANNOUNCE, MAKE_FUNCTION, LOAD_FUNCTION, CALL,
+ RETURN, TRY, END_BLOCK, LOAD_FAST, STORE_FAST, TAIL_CALL,
+ BUILD_ARRAY, INDEX, SLICE, LOAD_BUILTIN, CALL_BUILTIN) = range(41)
+
+OPNAMES = (
+    'NOP', 'LOAD_CONST', 'LOAD_NAME', 'STORE_NAME', 'POP',
+    'ADD', 'SUB', 'MUL', 'DIV', 'FLOOR_DIV', 'POW', 'MOD',
+    'LESS', 'GREATER', 'EQUAL', 'NOTEQUAL', 'LESSEQUAL', 'GREATEREQUAL',
+    'NEGATE', 'NOT', 'JUMP', 'POP_JUMP_IF_FALSE', 'GET_ITER', 'FOR_ITER',
+    'PRINT', 'INPUT', 'ANNOUNCE', 'MAKE_FUNCTION', 'LOAD_FUNCTION', 'CALL',
+    'RETURN', 'TRY', 'END_BLOCK', 'LOAD_FAST', 'STORE_FAST', 'TAIL_CALL',
+    'BUILD_ARRAY', 'INDEX', 'SLICE', 'LOAD_BUILTIN', 'CALL_BUILTIN',
+)
+
+_BINARY_OPCODES = {
+    '+': ADD, '-': SUB, '*': MUL, '/': DIV, '//': FLOOR_DIV, '**': POW, '%': MOD,
+}
+
+_COMPARISON_OPCODES = {
+    'LESS': LESS, 'GREATER': GREATER, 'EQUAL': EQUAL,
+    'NOTEQUAL': NOTEQUAL, 'LESSEQUAL': LESSEQUAL, 'GREATEREQUAL': GREATEREQUAL,
+}
+
+# END_BLOCK operands: how a try/except block finished.
+_BLOCK_END = 0
+_BLOCK_BREAK = 1
+_BLOCK_RETURN = 2
+_BLOCK_CONTINUE = 3
+
+
+class CodeObject:
+    def __init__(self, name, ops, args, lines, consts, names, varnames, functions, tries, while_costs,
+                 for_costs):
+        self.name = name
+        self.ops = ops
+        self.args = args
+        self.lines = lines
+        self.consts = consts
+        self.names = names
+        self.varnames = varnames
+        self.functions = functions
+        self.tries = tries
+        self.while_costs = while_costs
+        self.for_costs = for_costs
+
+
+class FunctionObject:
+    def __init__(self, name, params, frame_size, code, cost, memoized=False):
+        self.name = name
+        self.params = params
+        self.frame_size = frame_size
+        self.code = code
+        self.cost = cost
+        self.memoized = memoized
+
+
+class _CodeBuilder:
+    def __init__(self, name, varnames=()):
+        self.name = name
+        self.varnames = varnames
+        self.ops = []
+        self.args = []
+        self.lines = []
+        self.consts = []
+        self.const_indexes = {}
+        self.names = []
+        self.name_indexes = {}
+        self.functions = []
+        self.tries = []
+        self.while_costs = {}
+        self.for_costs = {}
+        self.line = 0
+
+    def emit(self, op, arg=0):
+        self.ops.append(op)
+        self.args.append(arg)
+        self.lines.append(self.line)
+        return len(self.ops) - 1
+
+    def patch(self, index, target):
+        self.args[index] = target
+
+    def const(self, value):
+        key = (type(value), value)
+        if key not in self.const_indexes:
+            self.const_indexes[key] = len(self.consts)
+            self.consts.append(value)
+        return self.const_indexes[key]
+
+    def name_index(self, name):
+        if name not in self.name_indexes:
+            self.name_indexes[name] = len(self.names)
+            self.names.append(name)
+        return self.name_indexes[name]
+
+    def build(self):
+        return CodeObject(self.name, array('B', self.ops), array('i', self.args), array('i', self.lines),
+                          tuple(self.consts), tuple(self.names), self.varnames, tuple(self.functions),
+                          tuple(self.tries), self.while_costs, self.for_costs)
+
+
+class _BytecodeCompiler:
+    def __init__(self, name, varnames=()):
+        self.code = _CodeBuilder(name, varnames)
+
+    def load(self, name, slot):
+        if slot >= 0:
+            self.code.emit(LOAD_FAST, slot)
+        else:
+            self.code.emit(LOAD_NAME, self.code.name_index(name))
+
+    def store(self, name, slot):
+        if slot >= 0:
+            self.code.emit(STORE_FAST, slot)
+        else:
+            self.code.emit(STORE_NAME, self.code.name_index(name))
+
+    def expression(self, expr):
+        code = self.code
+        if not expr:
+            code.emit(LOAD_CONST, code.const(None))
+            return
+
+        if isinstance(expr, (int, float, str, bool)):
+            code.emit(LOAD_CONST, code.const(expr))
+            return
+
+        expr_type = expr.kind
+
+        if expr_type == nodes.NUMBER:
+            code.emit(LOAD_CONST, code.const(int(expr.value)))
+
+        elif expr_type == nodes.STRING or expr_type == nodes.BOOLEAN:
+            code.emit(LOAD_CONST, code.const(expr.value))
+
+        elif expr_type == nodes.IDENTIFIER:
+            self.load(expr.name, expr.slot)
+
+        elif expr_type == nodes.BINARY_OP or expr_type == nodes.COMPARISON:
+            opcodes = _BINARY_OPCODES if expr_type == nodes.BINARY_OP else _COMPARISON_OPCODES
+            opcode = opcodes.get(expr.op)
+            if opcode is None:
+                code.emit(LOAD_CONST, code.const(None))
+                return
+            self.expression(expr.left)
+            self.expression(expr.right)
+            code.emit(opcode)
+
+        elif expr_type == nodes.UNARY_OP:
+            if expr.op == 'NEGATE':
+                self.expression(expr.operand)
+                code.emit(NEGATE)
+            elif expr.op == 'NOT':
+                self.expression(expr.operand)
+                code.emit(NOT)
+            else:
+                code.emit(LOAD_CONST, code.const(None))
+
+        elif expr_type == nodes.FUNCTION_CALL:
+            if expr.builtin:
+                code.emit(LOAD_BUILTIN, code.name_index(expr.name))
+                for arg in expr.args:
+                    self.expression(arg)
+                code.emit(CALL_BUILTIN, len(expr.args))
+            else:
+                self.call(expr, CALL)
+
+        elif expr_type == nodes.ARRAY:
+            for element in expr.elements:
+                self.expression(element)
+            code.emit(BUILD_ARRAY, len(expr.elements))
+
+        elif expr_type == nodes.INDEX:
+            self.expression(expr.value)
+            self.expression(expr.index)
+            code.emit(INDEX)
+
+        elif expr_type == nodes.SLICE:
+            self.expression(expr.value)
+            self.expression(expr.start)
+            self.expression(expr.stop)
+            code.emit(SLICE)
+
+        else:
+            code.emit(LOAD_CONST, code.const(None))
+
+    # `loop` is a pair of jump lists (breaks, continues) for the innermost
+    # loop, patched once its exit and top are known. Outside a loop, break
+    # and continue end the function the way their signal does in
+    # KannadaInterpreter.
+    def block(self, statements, loop=None):
+        if not isinstance(statements, list):
+            statements = [statements]
+        for statement in statements:
+            self.statement(statement, loop)
+
+    def statement(self, node, loop):
+        code = self.code
+        if not node:
+            return
+
+        node_type = node.kind
+        code.line = node.line or code.line
+
+        if node_type == nodes.PRINT:
+            values = [value for value in node.values if value is not None]
+            for value in values:
+                self.expression(value)
+            code.emit(PRINT, len(values))
+
+        elif node_type == nodes.ASSIGNMENT:
+            self.expression(node.value)
+            self.store(node.target, node.slot)
+
+        elif node_type == nodes.INPUT:
+            code.emit(INPUT)
+            self.store(node.target, node.slot)
+
+        elif node_type == nodes.IF:
+            branches = [node] + list(node.elif_clauses or ())
+            end_jumps = []
+            for i, branch in enumerate(branches):
+                self.expression(branch.condition)
+                skip = code.emit(POP_JUMP_IF_FALSE)
+                self.block(branch.body, loop)
+                if i < len(branches) - 1 or node.else_body is not None:
+                    end_jumps.append(code.emit(JUMP))
+                code.patch(skip, len(code.ops))
+            if node.else_body is not None:
+                self.block(node.else_body, loop)
+            for jump in end_jumps:
+                code.patch(jump, len(code.ops))
+
+        elif node_type == nodes.WHILE:
+            # Entering the loop jumps to its top too, so that each iteration
+            # is paid for before it runs.
+            entry = code.emit(JUMP)
+            top = len(code.ops)
+            code.patch(entry, top)
+            code.while_costs[top] = body_cost(node.body)
+            self.expression(node.condition)
+            exit_jump = code.emit(POP_JUMP_IF_FALSE)
+            breaks, continues = [], []
+            self.block(node.body, (breaks, continues))
+            code.emit(JUMP, top)
+            for jump in breaks:
+                code.patch(jump, len(code.ops))
+            for jump in continues:
+                code.patch(jump, top)
+            code.patch(exit_jump, len(code.ops))
+
+        elif node_type == nodes.FOR:
+            code.emit(LOAD_CONST, code.const(range(int(node.start), int(node.end))))
+            code.emit(GET_ITER)
+            top = code.emit(FOR_ITER)
+            code.for_costs[top] = body_cost(node.body)
+            self.store(node.var, node.slot)
+            breaks, continues = [], []
+            self.block(node.body, (breaks, continues))
+            code.emit(JUMP, top)
+            for jump in breaks:
+                code.patch(jump, len(code.ops))
+            for jump in continues:
+                code.patch(jump, top)
+            if breaks:
+                code.emit(POP)
+            code.patch(top, len(code.ops))
+
+        elif node_type == nodes.FUNCTION_DEF:
+            function = _BytecodeCompiler(node.name, node.local_names)
+            function.block(node.body)
+            function.finish(RETURN)
+            cost = body_cost(node.body) if node.recursive else 0
+            code.functions.append(FunctionObject(node.name, tuple(node.params), node.frame_size,
+                                                 function.code.build(), cost, node.memoized))
+            code.emit(MAKE_FUNCTION, len(code.functions) - 1)
+
+        elif node_type == nodes.FUNCTION_CALL:
+            self.expression(node)
+            code.emit(POP)
+
+        elif node_type == nodes.RETURN:
+            if node.tail:
+                self.call(node.value, TAIL_CALL)
+            else:
+                self.expression(node.value)
+            code.emit(RETURN)
+
+        elif node_type == nodes.BREAK or node_type == nodes.CONTINUE:
+            if loop is None:
+                self.finish(RETURN)
+            else:
+                loop[0 if node_type == nodes.BREAK else 1].append(code.emit(JUMP))
+
+        elif node_type == nodes.PASS:
+            pass
+
+        elif node_type == nodes.TRY_EXCEPT:
+            try_code = self.nested_block(node.try_body, loop is not None)
+            except_code = self.nested_block(node.except_body, loop is not None)
+            finally_code = self.nested_block(node.finally_body, False) if node.finally_body is not None else None
+            code.tries.append((try_code, except_code, finally_code))
+            code.emit(TRY, len(code.tries) - 1)
+            if loop is not None:
+                loop[0].append(code.emit(JUMP))
+                loop[1].append(code.emit(JUMP))
+            else:
+                code.emit(NOP)
+                code.emit(NOP)
+            code.emit(RETURN)
+
+        elif node_type == nodes.IMPORT:
+            code.emit(ANNOUNCE, code.const(f"Imported module: {node.module}"))
+
+        elif node_type == nodes.FROM_IMPORT:
+            code.emit(ANNOUNCE, code.const(f"Imported {node.name} from {node.module}"))
+
+        elif node_type == nodes.CLASS:
+            code.emit(ANNOUNCE, code.const(f"Defined class: {node.name}"))
+
+        else:
+            self.expression(node)
+            code.emit(POP)
+
+    def call(self, expr, op):
+        self.code.emit(LOAD_FUNCTION, self.code.name_index(expr.name))
+        for arg in expr.args:
+            self.expression(arg)
+        self.code.emit(op, len(expr.args))
+
+    # try/except bodies run as separate code objects in the same frame and
+    # report how they finished through END_BLOCK or RETURN. TRY is always
+    # followed by the break and continue jumps (or NOPs) and a RETURN, and
+    # resumes at one of those or after them depending on that status.
+    def nested_block(self, statements, in_loop):
+        nested = _BytecodeCompiler(self.code.name, self.code.varnames)
+        nested.code.line = self.code.line
+        loop = ([], []) if in_loop else None
+        nested.block(statements, loop)
+        nested.code.emit(END_BLOCK, _BLOCK_END)
+        if in_loop:
+            for status, jumps in zip((_BLOCK_BREAK, _BLOCK_CONTINUE), loop):
+                if jumps:
+                    target = nested.code.emit(END_BLOCK, status)
+                    for jump in jumps:
+                        nested.code.patch(jump, target)
+        return nested.code.build()
+
+    def finish(self, op):
+        self.code.emit(LOAD_CONST, self.code.const(None))
+        self.code.emit(op)
+
+
+def compile_bytecode(ast, name="<module>"):
+    compiler = _BytecodeCompiler(name)
+    compiler.block(ast or [])
+    compiler.finish(RETURN)
+    return compiler.code.build()
+
+
+def disassemble(code):
+    lines = []
+    _disassemble_into(code, lines)
+    return "\n".join(lines)
+
+
+def _disassemble_into(code, lines):
+    lines.append(f"Disassembly of {code.name}:")
+    jump_targets = {code.args[i] for i, op in enumerate(code.ops)
+                    if op in (JUMP, POP_JUMP_IF_FALSE, FOR_ITER)}
+    last_line = None
+    for i, op in enumerate(code.ops):
+        arg = code.args[i]
+        line = code.lines[i]
+        line_column = f"{line:>4}" if line != last_line else "    "
+        last_line = line
+        marker = ">>" if i in jump_targets else "  "
+        detail = ""
+        if op in (LOAD_CONST, ANNOUNCE):
+            detail = f"({code.consts[arg]!r})"
+        elif op in (LOAD_NAME, STORE_NAME, LOAD_FUNCTION, LOAD_BUILTIN):
+            detail = f"({code.names[arg]})"
+        elif op in (LOAD_FAST, STORE_FAST):
+            detail = f"({code.varnames[arg]})"
+        elif op in (JUMP, POP_JUMP_IF_FALSE, FOR_ITER):
+            detail = f"(to {arg})"
+        elif op == MAKE_FUNCTION:
+            detail = f"({code.functions[arg].name})"
+        elif op == END_BLOCK:
+            detail = {_BLOCK_BREAK: "(break)", _BLOCK_CONTINUE: "(continue)"}.get(arg, "")
+        lines.append(f"{line_column} {marker}{i:>5} {OPNAMES[op]:<20}{arg:>4} {detail}".rstrip())
+    for function in code.functions:
+        lines.append("")
+        _disassemble_into(function.code, lines)
+    for index, blocks in enumerate(code.tries):
+        for label, block in zip(('try', 'except', 'finally'), blocks):
+            if block is not None:
+                lines.append("")
+                lines.append(f"{code.name} TRY {index} {label}:")
+                _disassemble_into(block, lines)
+
+
+class VirtualMachine:
+    def __init__(self, interpreter=None, max_depth=MAX_DEPTH):
+        self.interpreter = interpreter if interpreter is not None else KannadaInterpreter()
+        self.functions = {}
+        self.max_depth = max_depth
+        # Frames held by the execute() calls a try block is nested in.
+        self.depth = 0
+
+    def run(self, code):
+        if self.interpreter.budget is not None:
+            self.interpreter.budget.start()
+        try:
+            self.execute(code, self.interpreter.variables, None)
+        finally:
+            self.interpreter.frame = None
+            self.interpreter.output.flush()
+        return self.interpreter
+
+    def execute(self, code, variables, fast):
+        functions = self.functions
+        interpreter = self.interpreter
+        write = interpreter.output.write
+        budget = interpreter.budget
+        memo = interpreter.memo
+        frames = []
+        ops, args, consts, names = code.ops, code.args, code.consts, code.names
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pc = 0
+        try:
+            while True:
+                op = ops[pc]
+                arg = args[pc]
+                pc += 1
+                if op == LOAD_NAME:
+                    try:
+                        push(variables[names[arg]])
+                    except KeyError:
+                        raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {names[arg]}") from None
+                elif op == LOAD_CONST:
+                    push(consts[arg])
+                elif op == STORE_NAME:
+                    variables[names[arg]] = pop()
+                elif op == LOAD_FAST:
+                    value = fast[arg]
+                    if value is UNSET:
+                        try:
+                            value = variables[code.varnames[arg]]
+                        except KeyError:
+                            raise NameError(f"ಅಪರಿಚಿತ ಚರ/Unknown variable: {code.varnames[arg]}") from None
+                    push(value)
+                elif op == STORE_FAST:
+                    fast[arg] = pop()
+                elif op == POP_JUMP_IF_FALSE:
+                    if not pop():
+                        pc = arg
+                elif op == JUMP:
+                    if budget is not None and arg in code.while_costs:
+                        budget.countdown -= code.while_costs[arg]
+                        if budget.countdown <= 0:
+                            budget.check(self.interpreter)
+                    pc = arg
+                elif op == ADD:
+                    right = pop()
+                    stack[-1] = stack[-1] + right
+                elif op == SUB:
+                    right = pop()
+                    stack[-1] = stack[-1] - right
+                elif op == MUL:
+                    right = pop()
+                    stack[-1] = stack[-1] * right
+                elif op == LESS:
+                    right = pop()
+                    stack[-1] = stack[-1] < right
+                elif op == GREATER:
+                    right = pop()
+                    stack[-1] = stack[-1] > right
+                elif op == EQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] == right
+                elif op == FOR_ITER:
+                    for value in stack[-1]:
+                        push(value)
+                        break
+                    else:
+                        pop()
+                        pc = arg
+                elif op == NOTEQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] != right
+                elif op == LESSEQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] <= right
+                elif op == GREATEREQUAL:
+                    right = pop()
+                    stack[-1] = stack[-1] >= right
+                elif op == DIV:
+                    right = pop()
+                    stack[-1] = stack[-1] / right
+                elif op == FLOOR_DIV:
+                    right = pop()
+                    stack[-1] = stack[-1] // right
+                elif op == MOD:
+                    right = pop()
+                    stack[-1] = stack[-1] % right
+                elif op == POW:
+                    right = pop()
+                    stack[-1] = stack[-1] ** right
+                elif op == NEGATE:
+                    stack[-1] = -stack[-1]
+                elif op == NOT:
+                    stack[-1] = not stack[-1]
+                elif op == POP:
+                    pop()
+                elif op == PRINT:
+                    if arg:
+                        values = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        values = []
+                    output = format_values(values)
+                    write(output if '\n' in output else output + " ")
+                elif op == LOAD_FUNCTION:
+                    function = functions.get(names[arg])
+                    if function is None:
+                        raise NameError(f"ಅಪರಿಚಿತ ಕಾರ್ಯ/Unknown function: {names[arg]}")
+                    push(function)
+                elif op == CALL or op == TAIL_CALL:
+                    if arg:
+                        values = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        values = []
+                    function = pop()
+                    pending = None
+                    if memo is not None and function.memoized:
+                        key, value = memo.lookup(function, function.name, values)
+                        if value is not MISSING:
+                            push(value)
+                            continue
+                        pending = (function, key)
+                    if budget is not None and function.cost:
+                        budget.countdown -= function.cost
+                        if budget.countdown <= 0:
+                            budget.check(self.interpreter)
+                    if op == CALL or pending is not None:
+                        if self.depth + len(frames) >= self.max_depth:
+                            raise StackOverflow(self.max_depth)
+                        frames.append((code, pc, stack, fast, pending))
+                    fast = interpreter.frame = new_frame(function, values)
+                    code = function.code
+                    ops, args, consts, names = code.ops, code.args, code.consts, code.names
+                    stack = []
+                    push = stack.append
+                    pop = stack.pop
+                    pc = 0
+                elif op == RETURN:
+                    value = pop()
+                    if not frames:
+                        return _BLOCK_RETURN, value
+                    code, pc, stack, fast, pending = frames.pop()
+                    interpreter.frame = fast
+                    if pending is not None:
+                        memo.store(pending[0], pending[1], value)
+                    ops, args, consts, names = code.ops, code.args, code.consts, code.names
+                    push = stack.append
+                    pop = stack.pop
+                    push(value)
+                elif op == GET_ITER:
+                    if budget is not None:
+                        loop = stack[-1]
+                        stack[-1] = budget.iterations(self.interpreter, code.for_costs[pc], loop.stop, loop.start)
+                    else:
+                        stack[-1] = iter(stack[-1])
+                elif op == MAKE_FUNCTION:
+                    function = code.functions[arg]
+                    functions[function.name] = function
+                elif op == INPUT:
+                    self.interpreter.output.flush()
+                    user_input = input("ಒಡ್ಡಿ/Enter input: ")
+                    write("\n")
+                    push(user_input)
+                elif op == ANNOUNCE:
+                    write(consts[arg] + " ")
+                elif op == TRY:
+                    try_code, except_code, finally_code = code.tries[arg]
+                    self.depth += len(frames)
+                    try:
+                        try:
+                            status, value = self.execute(try_code, variables, fast)
+                        except Exception:
+                            status, value = self.execute(except_code, variables, fast)
+                    finally:
+                        try:
+                            if finally_code is not None:
+                                self.execute(finally_code, variables, fast)
+                        finally:
+                            self.depth -= len(frames)
+                            interpreter.frame = fast
+                    if status == _BLOCK_END:
+                        pc += 3
+                    elif status == _BLOCK_RETURN:
+                        push(value)
+                        pc += 2
+                    elif status == _BLOCK_CONTINUE:
+                        pc += 1
+                elif op == END_BLOCK:
+                    return arg, None
+                elif op == NOP:
+                    pass
+                elif op == INDEX:
+                    position = pop()
+                    stack[-1] = get_item(stack[-1], position)
+                elif op == LOAD_BUILTIN:
+                    push(BUILTINS[names[arg]])
+                elif op == CALL_BUILTIN:
+                    if arg:
+                        values = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        values = []
+                    stack[-1] = stack[-1](*values)
+                elif op == BUILD_ARRAY:
+                    if arg:
+                        values = stack[-arg:]
+                        del stack[-arg:]
+                    else:
+                        values = []
+                    push(make_array(values))
+                elif op == SLICE:
+                    stop = pop()
+                    start = pop()
+                    stack[-1] = get_slice(stack[-1], start, stop)
+        except Exception as e:
+            if not hasattr(e, 'ka_line'):
+                e.ka_line = code.lines[pc - 1]
+            raise
+
+
+def run_bytecode(ast, interpreter=None, max_depth=MAX_DEPTH):
+    return VirtualMachine(interpreter, max_depth).run(compile_bytecode(ast))
+
+if __name__ == "__main__":
+    test_code = """ಪ್ರಾರಂಭಿಸಿ
+i = 0
+ಯಾವಾಗ (i < 3)
+ಮುದ್ರಿಸಿ(i)
+i = i + 1
+ಮುಗಿಯಿರಿ
+ಮುಗಿಯಿರಿ"""
+    from parser import parse
+    ast = parse(test_code)
+    print(disassemble(compile_bytecode(ast)))
+    run_bytecode(ast)
+    print()